@@ -0,0 +1,229 @@
+"""
+Competency Scoring Benchmarks
+
+Times competency signal generation for synthetic talents with hundreds of
+skills and thousands of evidence items: evidence indexing plus scoring
+(CompetencySignalGenerator.compute), and the scoring step alone, vectorized
+(scoring.score_signals) vs the previous per-signal loop. Also counts memory
+allocations per signal for internal records vs validated pydantic models.
+
+Usage:
+    uv run python -m benchmarks.bench_competency_scoring
+    uv run python -m benchmarks.bench_competency_scoring --sizes 100:1000 500:5000 \\
+        --output benchmarks/results/competency.json
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from src.core.competency.records import SignalRecord, to_models
+from src.core.competency.scoring import score_signals
+from src.core.competency.signal_generator import CompetencySignalGenerator
+from src.models.competency import CompetencySignal, Evidence, SourceBreakdown
+from src.utils.skills_taxonomy import get_skills_taxonomy
+
+# skills:evidence items
+DEFAULT_SIZES = ["100:1000", "300:3000", "800:8000"]
+
+SOURCE_KEYS = {
+    "professional_recommendations": "text",
+    "work_references": "feedback",
+    "tapi_data": "summary",
+    "work_samples": "description",
+}
+
+PHRASES = [
+    "Delivered a project using {}",
+    "Strong hands-on experience with {} and {}",
+    "Mentored the team on {}",
+    "Improved reliability by applying {} alongside {} and {}",
+]
+
+
+def build_talent(skills: int, evidence: int, seed: int = 42) -> dict:
+    """Synthetic generate() arguments: taxonomy plus made-up skills, evidence spread across sources."""
+    rng = random.Random(seed)
+    taxonomy = get_skills_taxonomy()
+    names = [skill.name for skill in taxonomy.skills]
+    names += [f"Domain Skill {i}" for i in range(max(0, skills - len(names)))]
+    names = names[:skills]
+
+    kwargs = {"talent_id": f"BENCH-{skills}-{evidence}", **{source: [] for source in SOURCE_KEYS}}
+    responsibilities = []
+    certifications = []
+
+    for i in range(evidence):
+        phrase = rng.choice(PHRASES)
+        text = phrase.format(*rng.sample(names, phrase.count("{}")))
+        bucket = i % 6
+        if bucket == 0:
+            responsibilities.append(text)
+        elif bucket == 1:
+            certifications.append({"name": f"Certificate {i}", "skills": rng.sample(names, 2), "issuer": "Bench"})
+        else:
+            source = list(SOURCE_KEYS)[bucket - 2]
+            item = {SOURCE_KEYS[source]: text}
+            if source == "tapi_data":
+                item["performance_score"] = rng.randint(50, 100)
+            kwargs[source].append(item)
+
+    kwargs["cv_data"] = {"skills": names, "work_experience": [{"responsibilities": responsibilities}]}
+    kwargs["verified_certifications"] = certifications
+    return kwargs
+
+
+def legacy_scores(evidence_per_signal: list) -> list:
+    """Previous per-signal scoring loop (five filtered lists per signal), for comparison."""
+    weights = {"CV": (15.0, 3), "PR": (15.0, 2), "V.Cert": (20.0, 2), "TAPI": (20.0, 3), "Ref": (20.0, 2)}
+    results = []
+    for evidence in evidence_per_signal:
+        total = 10.0
+        for source, (weight, full) in weights.items():
+            items = [e for e in evidence if e.source == source]
+            if items:
+                confidence = sum(e.confidence for e in items) / len(items)
+                total += weight * confidence * min(1.0, len(items) / full)
+        results.append(int(min(100, total)))
+    return results
+
+
+def validated_models(records: list[SignalRecord]) -> list[CompetencySignal]:
+    """Signals built as validated pydantic models (as generation used to), for comparison."""
+    return [
+        CompetencySignal(
+            skill=record.skill,
+            score=record.score,
+            level=record.level,
+            evidence=[
+                Evidence(
+                    source=item.source,
+                    confidence=item.confidence,
+                    snippet=item.snippet,
+                    weight_contribution=record.weight_contribution(item.source),
+                )
+                for item in record.evidence
+            ],
+            source_breakdown=SourceBreakdown(
+                cv_analysis=record.contributions[0],
+                professional_recommendations=record.contributions[1],
+                verified_certifications=record.contributions[2],
+                tapi_intelligence=record.contributions[3],
+                work_references=record.contributions[4],
+            ),
+            confidence=record.confidence,
+            verified=record.verified,
+            verified_by=record.verified_by,
+        )
+        for record in records
+    ]
+
+
+def _allocations_per_signal(build: Callable[[], list], signals: int) -> float:
+    """Memory blocks still allocated by a build step, per signal."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del result
+    return round(blocks / max(signals, 1), 1)
+
+
+def _measure(operation: Callable[[], object], repeat: int) -> dict:
+    """Best-of-N wall time and peak memory of an operation."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"seconds": round(min(timings), 5), "peak_memory_mb": round(peak / (1024 * 1024), 2)}
+
+
+def _benchmark_talent(generator: CompetencySignalGenerator, skills: int, evidence: int, repeat: int) -> dict:
+    """Run every benchmark on one synthetic talent."""
+    kwargs = build_talent(skills, evidence)
+    computed = generator.compute(**kwargs)
+    keys = [computed.index.taxonomy.key(skill) for skill in computed.skills]
+    indexed = [computed.index.indexed(key) for key in keys]
+
+    entry = {
+        "signals": len(computed.signals),
+        "evidence_links": sum(len(items) for items in indexed),
+        "compute": _measure(lambda: generator.compute(**kwargs), repeat),
+        "scoring_vectorized": _measure(lambda: score_signals(indexed), repeat),
+        "scoring_legacy": _measure(lambda: legacy_scores(indexed), repeat),
+    }
+    records = computed.signals
+    entry["allocations_per_signal"] = {
+        "records": _allocations_per_signal(lambda: generator._score(computed.skills, computed.index), len(records)),
+        "models_from_records": _allocations_per_signal(lambda: to_models(records), len(records)),
+        "validated_models": _allocations_per_signal(lambda: validated_models(records), len(records)),
+    }
+    entry["scoring_speedup"] = round(
+        entry["scoring_legacy"]["seconds"] / max(entry["scoring_vectorized"]["seconds"], 1e-9), 2
+    )
+    return entry
+
+
+def run_benchmarks(sizes: list[str], repeat: int) -> dict:
+    """Run every benchmark for every talent size."""
+    generator = CompetencySignalGenerator()
+    results = {}
+
+    for size in sizes:
+        skills, evidence = (int(part) for part in size.split(":"))
+        entry = results[size] = _benchmark_talent(generator, skills, evidence, repeat)
+        print(f"{skills:>5} skills / {evidence:>6} evidence: compute {entry['compute']['seconds'] * 1000:.1f}ms, "
+              f"scoring {entry['scoring_vectorized']['seconds'] * 1000:.2f}ms "
+              f"(legacy {entry['scoring_legacy']['seconds'] * 1000:.2f}ms, {entry['scoring_speedup']}x), "
+              f"allocations/signal {entry['allocations_per_signal']}")
+
+    return results
+
+
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Competency scoring benchmarks")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES,
+                        help="Talent sizes as skills:evidence_items")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    report = {
+        "benchmark": "competency_scoring",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": run_benchmarks(args.sizes, args.repeat),
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Results written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
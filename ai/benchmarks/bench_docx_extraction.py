@@ -0,0 +1,155 @@
+"""
+DOCX Extraction Benchmarks
+
+Compares the streaming XML DOCX extractor with the python-docx path on
+synthetic CVs of increasing size (paragraphs plus tables with merged
+cells), recording wall time and peak memory.
+
+Usage:
+    uv run python -m benchmarks.bench_docx_extraction
+    uv run python -m benchmarks.bench_docx_extraction --sizes 100 1000 \\
+        --output benchmarks/results/docx.json
+"""
+import argparse
+import gc
+import io
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from src.services.text_extraction import extract_docx_fast_sync, extract_docx_sync
+
+DEFAULT_SIZES = [100, 1_000, 10_000]
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+PACKAGE_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+WORDS = (
+    "led designed built migrated python django react kubernetes data pipeline "
+    "analytics team stakeholders delivered reduced latency improved revenue"
+).split()
+
+
+def build_docx(paragraphs: int, seed: int = 42) -> bytes:
+    """Synthetic CV: paragraphs, with a table (merged first column) every 20."""
+    rng = random.Random(seed)
+    body = []
+
+    for i in range(paragraphs):
+        text = " ".join(rng.choices(WORDS, k=rng.randint(8, 30)))
+        body.append(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>")
+
+        if i % 20 == 19:
+            rows = []
+            for r in range(4):
+                merge = '<w:vMerge w:val="restart"/>' if r == 0 else "<w:vMerge/>"
+                rows.append(
+                    f"<w:tr><w:tc><w:tcPr>{merge}</w:tcPr><w:p><w:r><w:t>Company {i}</w:t></w:r></w:p></w:tc>"
+                    f"<w:tc><w:p><w:r><w:t>{rng.choice(WORDS)} {r}</w:t></w:r></w:p></w:tc></w:tr>"
+                )
+            body.append(f"<w:tbl>{''.join(rows)}</w:tbl>")
+
+    document = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f"<w:document {W}><w:body>{''.join(body)}</w:body></w:document>"
+    )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", CONTENT_TYPES)
+        docx.writestr("_rels/.rels", PACKAGE_RELS)
+        docx.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+def _measure(extract: Callable[[bytes], str], content: bytes, repeat: int) -> dict:
+    """Best-of-N wall time and peak memory of one extractor."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        text = extract(content)
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    extract(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": round(min(timings), 4),
+        "peak_memory_mb": round(peak / (1024 * 1024), 2),
+        "chars": len(text),
+    }
+
+
+def run_benchmarks(sizes: list[int], repeat: int) -> dict:
+    """Run both extractors for every document size."""
+    results = {}
+
+    for size in sizes:
+        content = build_docx(size)
+        fast = _measure(extract_docx_fast_sync, content, repeat)
+        entry = {"bytes": len(content), "streaming": fast}
+
+        try:
+            entry["python_docx"] = _measure(extract_docx_sync, content, repeat)
+            entry["speedup"] = round(entry["python_docx"]["seconds"] / fast["seconds"], 2)
+        except RuntimeError as e:
+            entry["python_docx"] = {"error": str(e)}
+
+        results[str(size)] = entry
+        print(f"{size:>8} paragraphs: streaming {fast['seconds']}s / {fast['peak_memory_mb']}MB"
+              + (f", python-docx {entry['python_docx']['seconds']}s / "
+                 f"{entry['python_docx']['peak_memory_mb']}MB ({entry['speedup']}x)"
+                 if "speedup" in entry else ""))
+
+    return results
+
+
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="DOCX extraction benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Document sizes in paragraphs")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    report = {
+        "benchmark": "docx_extraction",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": run_benchmarks(args.sizes, args.repeat),
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Results written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
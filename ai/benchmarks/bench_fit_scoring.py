@@ -0,0 +1,224 @@
+"""
+Fit-Scoring Benchmarks
+
+Times FitScoringEngine.score, batch_score, rank_candidates and rerank on
+synthetic candidate pools and records throughput and peak memory.
+
+Usage:
+    uv run python -m benchmarks.bench_fit_scoring
+    uv run python -m benchmarks.bench_fit_scoring --sizes 1000 10000 \\
+        --output benchmarks/results/latest.json \\
+        --baseline benchmarks/results/baseline.json
+
+With --baseline, exits non-zero if any operation's throughput drops, or its
+peak memory grows, by more than the allowed regression.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from benchmarks.synthetic import SyntheticPool
+from src.core.fit_scoring.component_store import ComponentStoreRegistry
+from src.core.fit_scoring.scorer import FitScoringEngine
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+async def _measure(
+    operation: Callable[[], Awaitable[object]],
+    items: int,
+    track_memory: bool,
+) -> dict:
+    """Run an operation once and measure wall time (and peak memory)."""
+    gc.collect()
+    start = time.perf_counter()
+    await operation()
+    seconds = time.perf_counter() - start
+
+    result = {
+        "seconds": round(seconds, 4),
+        "throughput_per_s": round(items / seconds, 1) if seconds > 0 else None,
+    }
+
+    if track_memory:
+        # Separate pass: tracemalloc distorts timings
+        gc.collect()
+        tracemalloc.start()
+        await operation()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_memory_mb"] = round(peak / (1024 * 1024), 2)
+
+    return result
+
+
+async def _benchmark_pool(
+    engine: FitScoringEngine,
+    job,
+    job_id: str,
+    candidates: list,
+    track_memory: bool,
+) -> dict:
+    """Run every benchmark on one candidate pool."""
+    size = len(candidates)
+
+    async def score_each():
+        for candidate in candidates:
+            await engine.score(candidate.talent_id, job_id, job, candidate)
+
+    async def batch():
+        await engine.batch_score(job_id, job, candidates)
+
+    async def rank():
+        await engine.rank_candidates(job_id, job, candidates)
+
+    async def rerank():
+        await engine.rerank(job_id, {"skills": 0.6, "experience": 0.2})
+
+    return {
+        "score": await _measure(score_each, size, track_memory),
+        "batch_score": await _measure(batch, size, track_memory),
+        "rank_candidates": await _measure(rank, size, track_memory),
+        "rerank": await _measure(rerank, size, track_memory),
+    }
+
+
+async def run_benchmarks(
+    sizes: list[int],
+    seed: int,
+    matching_mode: str,
+    track_memory: bool,
+) -> dict:
+    """Run every benchmark for every pool size."""
+    pool = SyntheticPool(seed=seed)
+    job = pool.job()
+    # Scratch component store, so runs neither read nor pollute the service's
+    store_dir = tempfile.TemporaryDirectory()
+    engine = FitScoringEngine(
+        matching_mode=matching_mode,
+        component_stores=ComponentStoreRegistry(str(Path(store_dir.name) / "components.db")),
+    )
+    results = {}
+
+    for size in sizes:
+        results[str(size)] = await _benchmark_pool(
+            engine, job, f"BENCH-{size}", pool.candidates(size), track_memory
+        )
+        print(f"{size:>8} candidates: " + ", ".join(
+            f"{op} {m['throughput_per_s']}/s" for op, m in results[str(size)].items()
+        ))
+
+    engine.component_stores.close()
+    store_dir.cleanup()
+    return results
+
+
+def _git_commit() -> str:
+    """Current commit hash, if available."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare_to_baseline(
+    current: dict,
+    baseline: dict,
+    max_regression: float,
+    max_memory_growth: float,
+) -> list[str]:
+    """
+    Compare a run with a baseline run.
+
+    Returns:
+        Human-readable list of regressions (empty if none)
+    """
+    regressions = []
+
+    for size, operations in current["results"].items():
+        for operation, metrics in operations.items():
+            reference = baseline.get("results", {}).get(size, {}).get(operation)
+            if not reference:
+                continue
+
+            if metrics.get("throughput_per_s") and reference.get("throughput_per_s"):
+                floor = reference["throughput_per_s"] * (1 - max_regression)
+                if metrics["throughput_per_s"] < floor:
+                    regressions.append(
+                        f"{operation}@{size}: throughput {metrics['throughput_per_s']}/s "
+                        f"< {floor:.1f}/s (baseline {reference['throughput_per_s']}/s)"
+                    )
+
+            if metrics.get("peak_memory_mb") and reference.get("peak_memory_mb"):
+                ceiling = reference["peak_memory_mb"] * (1 + max_memory_growth)
+                if metrics["peak_memory_mb"] > ceiling:
+                    regressions.append(
+                        f"{operation}@{size}: peak memory {metrics['peak_memory_mb']}MB "
+                        f"> {ceiling:.2f}MB (baseline {reference['peak_memory_mb']}MB)"
+                    )
+
+    return regressions
+
+
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Fit-scoring benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--matching-mode", choices=["exact", "semantic"], default="exact")
+    parser.add_argument("--no-memory", action="store_true", help="Skip peak-memory passes")
+    parser.add_argument("--output", type=Path, default=None, help="Write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=None, help="Baseline results JSON")
+    parser.add_argument("--max-regression", type=float, default=0.20,
+                        help="Allowed throughput drop vs baseline (fraction)")
+    parser.add_argument("--max-memory-growth", type=float, default=0.25,
+                        help="Allowed peak-memory growth vs baseline (fraction)")
+    args = parser.parse_args()
+
+    report = {
+        "benchmark": "fit_scoring",
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "matching_mode": args.matching_mode,
+        "results": asyncio.run(
+            run_benchmarks(args.sizes, args.seed, args.matching_mode, not args.no_memory)
+        ),
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_to_baseline(
+            report, baseline, args.max_regression, args.max_memory_growth
+        )
+        if regressions:
+            print(f"Regressions vs {baseline.get('commit', 'baseline')}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"No regressions vs {baseline.get('commit', 'baseline')}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Synthetic Fit-Scoring Data
+
+Deterministic generator of jobs and candidate pools drawn from the skills
+taxonomy, with realistic distributions:
+
+- Candidates specialise: most skills come from one primary category, a few
+  from others, plus some soft skills.
+- Skill popularity within a category is Zipf-like (Python is far more
+  common than Kotlin).
+- Years of experience are log-normal (many juniors, a long senior tail).
+- A small share of skills are written as aliases or in odd casing.
+"""
+import random
+from typing import Optional
+
+from src.models.fit_score import CandidateData, JobRequirement
+from src.utils.skills_taxonomy import SkillsTaxonomy, get_skills_taxonomy
+
+DEGREES = [
+    ("BSc Computer Science", 0.30),
+    ("BEng Software Engineering", 0.12),
+    ("BSc Mathematics", 0.08),
+    ("BSc Statistics", 0.06),
+    ("MSc Computer Science", 0.10),
+    ("MSc Data Science", 0.07),
+    ("BA Marketing", 0.08),
+    ("BSc Business Administration", 0.09),
+    ("HND Electrical Engineering", 0.05),
+    ("PhD Machine Learning", 0.02),
+    ("Bootcamp Certificate", 0.03),
+]
+
+EDUCATION_REQUIREMENTS = ["Computer Science", "Engineering", "Mathematics", "Data Science", "Business"]
+
+TECHNICAL_CATEGORIES = ["programming", "web_frontend", "web_backend", "data", "ai_ml", "devops", "marketing"]
+
+JOB_TITLES = {
+    "programming": "Software Engineer",
+    "web_frontend": "Frontend Developer",
+    "web_backend": "Backend Developer",
+    "data": "Data Analyst",
+    "ai_ml": "Machine Learning Engineer",
+    "devops": "DevOps Engineer",
+    "marketing": "Digital Marketing Manager",
+}
+
+
+class SyntheticPool:
+    """Generator of synthetic jobs and candidates."""
+
+    def __init__(self, seed: int = 42, taxonomy: Optional[SkillsTaxonomy] = None):
+        self.random = random.Random(seed)
+        self.taxonomy = taxonomy or get_skills_taxonomy()
+
+        self.by_category: dict[str, list] = {}
+        for skill in self.taxonomy.skills:
+            self.by_category.setdefault(skill.category, []).append(skill)
+
+        # Zipf-like popularity: the n-th skill of a category has weight 1/n
+        self.popularity = {
+            category: [1.0 / (rank + 1) for rank in range(len(skills))]
+            for category, skills in self.by_category.items()
+        }
+
+    def _pick_skills(self, category: str, count: int) -> list:
+        """Draw distinct skills from a category by popularity."""
+        skills = self.by_category[category]
+        weights = self.popularity[category]
+        picked = {}
+
+        for _ in range(count * 3):
+            if len(picked) >= min(count, len(skills)):
+                break
+            skill = self.random.choices(skills, weights=weights)[0]
+            picked[skill.id] = skill
+
+        return list(picked.values())
+
+    def _surface_form(self, skill) -> str:
+        """How a candidate writes a skill (usually its name)."""
+        roll = self.random.random()
+        if skill.aliases and roll < 0.10:
+            return self.random.choice(skill.aliases)
+        if roll < 0.15:
+            return skill.name.lower()
+        return skill.name
+
+    def job(self, category: Optional[str] = None) -> JobRequirement:
+        """Generate a job requirement."""
+        category = category or self.random.choice(TECHNICAL_CATEGORIES)
+        required = self._pick_skills(category, self.random.randint(3, 6))
+        secondary = self.random.choice([c for c in TECHNICAL_CATEGORIES if c != category])
+        preferred = self._pick_skills(secondary, self.random.randint(1, 3))
+        culture = self._pick_skills("soft_skills", self.random.randint(0, 3))
+
+        return JobRequirement(
+            title=JOB_TITLES[category],
+            required_skills=[s.name for s in required],
+            preferred_skills=[s.name for s in preferred],
+            min_experience_years=self.random.choice([0, 1, 2, 3, 3, 5, 5, 8]),
+            education_requirements=self.random.sample(
+                EDUCATION_REQUIREMENTS, self.random.randint(0, 2)
+            ),
+            culture_keywords=[s.name for s in culture],
+        )
+
+    def candidate(self, index: int) -> CandidateData:
+        """Generate a candidate."""
+        primary = self.random.choice(TECHNICAL_CATEGORIES)
+        skills = self._pick_skills(primary, max(1, int(self.random.gauss(6, 2))))
+
+        for _ in range(self.random.randint(0, 3)):
+            skills += self._pick_skills(self.random.choice(TECHNICAL_CATEGORIES), 1)
+        skills += self._pick_skills("soft_skills", self.random.randint(0, 3))
+
+        unique = list({s.id: s for s in skills}.values())
+        degrees, weights = zip(*DEGREES)
+
+        return CandidateData(
+            talent_id=f"VT/{index:06d}",
+            name=f"Candidate {index}",
+            skills=[self._surface_form(s) for s in unique],
+            experience_years=round(min(30.0, self.random.lognormvariate(1.2, 0.7)), 1),
+            education=list(self.random.choices(degrees, weights=weights, k=self.random.randint(1, 2))),
+        )
+
+    def candidates(self, count: int) -> list[CandidateData]:
+        """Generate a pool of candidates."""
+        return [self.candidate(i) for i in range(count)]
@@ -3,14 +3,21 @@ Competency Signal API Routes
 
 Endpoints for generating and retrieving AI-backed competency signals.
 """
+import json
+
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from src.models.competency import (
+    CompetencyBatchRequest,
     CompetencyRequest,
     CompetencyResponse,
     CompetencySignal,
+    EvidenceEvent,
 )
+from src.core.competency.batch import competency_batch_service
 from src.core.competency.signal_generator import CompetencySignalGenerator
+from src.utils.skills_taxonomy import get_skills_taxonomy
 
 router = APIRouter()
 
@@ -56,6 +63,23 @@ async def generate_competency_signals(request: CompetencyRequest):
         )
 
 
+@router.post("/signals/batch")
+async def generate_cohort_signals(request: CompetencyBatchRequest):
+    """
+    Generate competency signals for a cohort of talents.
+    
+    Talents are scored in parallel on a process pool. The response is NDJSON,
+    one line per talent in completion order, tagged with the talent's index
+    in the request: {"index", "talent_id", "signals"} or, for talents that
+    failed, {"index", "talent_id", "error"}. Generated signals are stored.
+    """
+    async def stream_results():
+        async for outcome in competency_batch_service.iter_generate(request.requests):
+            yield json.dumps(outcome.model_dump(mode="json")) + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @router.get("/signals/{talent_id}", response_model=CompetencyResponse)
 async def get_competency_signals(talent_id: str):
     """
@@ -86,6 +110,42 @@ async def get_competency_signals(talent_id: str):
         )
 
 
+@router.post("/signals/{talent_id}/evidence", response_model=CompetencyResponse)
+async def apply_evidence_event(talent_id: str, event: EvidenceEvent):
+    """
+    Apply an "evidence added/removed" event to a talent's signals.
+    
+    Only the skills the evidence mentions are rescored; the response holds
+    just those changed signals. Signals must have been generated first.
+    """
+    try:
+        signals = await signal_generator.apply_evidence_event(
+            talent_id=talent_id,
+            action=event.action,
+            source=event.source,
+            item=event.data,
+            item_id=event.evidence_id,
+        )
+        
+        return CompetencyResponse(
+            success=True,
+            talent_id=talent_id,
+            signals=signals,
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No competency signals generated for talent: {talent_id}",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to apply evidence event: {str(e)}",
+        )
+
+
 @router.post("/signals/{talent_id}/refresh")
 async def refresh_competency_signals(talent_id: str):
     """
@@ -110,31 +170,16 @@ async def refresh_competency_signals(talent_id: str):
 
 
 @router.get("/skills/taxonomy")
-async def get_skills_taxonomy():
+async def skills_taxonomy():
     """
     Get the skills taxonomy used for competency mapping.
     
     Returns hierarchical skill categories and definitions.
     """
-    # This would load from data/skills_taxonomy.json
-    return {
-        "version": "1.0",
-        "categories": [
-            {
-                "name": "Technical Skills",
-                "skills": [
-                    {"id": "python", "name": "Python", "category": "Programming"},
-                    {"id": "javascript", "name": "JavaScript", "category": "Programming"},
-                    {"id": "data_analysis", "name": "Data Analysis", "category": "Data Science"},
-                ]
-            },
-            {
-                "name": "Soft Skills",
-                "skills": [
-                    {"id": "communication", "name": "Communication", "category": "Interpersonal"},
-                    {"id": "leadership", "name": "Leadership", "category": "Management"},
-                    {"id": "problem_solving", "name": "Problem Solving", "category": "Cognitive"},
-                ]
-            },
-        ],
-    }
+    try:
+        return get_skills_taxonomy().data
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to load skills taxonomy: {str(e)}",
+        )
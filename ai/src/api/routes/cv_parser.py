@@ -5,7 +5,14 @@ Endpoints for parsing and extracting structured data from CVs.
 """
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
 
-from src.models.cv import CVParseRequest, CVParseResponse, ParsedCV
+from src.models.cv import (
+    BulkIngestRequest,
+    CVParseRequest,
+    CVParseResponse,
+    IngestionJobStatus,
+    ParsedCV,
+)
+from src.core.cv_parser.ingestion import cv_ingestion_pipeline
 from src.core.cv_parser.parser import CVParserService
 
 router = APIRouter()
@@ -139,3 +146,51 @@ async def batch_parse_cvs(files: list[UploadFile] = File(...)):
         "failed": sum(1 for r in results if not r["success"]),
         "results": results,
     }
+
+
+@router.post("/ingest", status_code=status.HTTP_202_ACCEPTED)
+async def ingest_cvs(request: BulkIngestRequest):
+    """
+    Start a bulk ingestion job for a manifest of CV files.
+    
+    Each file is downloaded, extracted, parsed, embedded and stored in the
+    background; poll the job for progress and per-file errors.
+    """
+    try:
+        job_id = await cv_ingestion_pipeline.submit(request.files, request.source)
+        return {"job_id": job_id, "total": len(request.files)}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to start ingestion: {str(e)}",
+        )
+
+
+@router.get("/ingest/{job_id}", response_model=IngestionJobStatus)
+async def get_ingestion_status(job_id: str):
+    """Get progress of a bulk ingestion job."""
+    try:
+        return await cv_ingestion_pipeline.get_status(job_id)
+    except KeyError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ingestion job not found")
+
+
+@router.post("/ingest/{job_id}/resume", status_code=status.HTTP_202_ACCEPTED)
+async def resume_ingestion(job_id: str):
+    """Resume an interrupted, cancelled or partly failed ingestion job."""
+    try:
+        await cv_ingestion_pipeline.resume(job_id)
+        return {"job_id": job_id, "resumed": True}
+    except KeyError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ingestion job not found")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+@router.post("/ingest/{job_id}/cancel", response_model=IngestionJobStatus)
+async def cancel_ingestion(job_id: str):
+    """Stop a running ingestion job (it can be resumed later)."""
+    try:
+        return await cv_ingestion_pipeline.cancel(job_id)
+    except KeyError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ingestion job not found")
@@ -3,13 +3,19 @@ Fit Scoring API Routes
 
 Endpoints for calculating candidate-job fit scores.
 """
+import json
+
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from src.models.fit_score import (
+    CandidateScoreError,
     FitScoreRequest,
+    FitScoreResult,
     FitScoreResponse,
     BatchFitScoreRequest,
     BatchFitScoreResponse,
+    RerankRequest,
 )
 from src.core.fit_scoring.scorer import FitScoringEngine
 
@@ -38,6 +44,7 @@ async def calculate_fit_score(request: FitScoreRequest):
             job_id=request.job_id,
             job_requirements=request.job_requirements,
             candidate_data=request.candidate_data,
+            matching_mode=request.matching_mode,
         )
         
         return FitScoreResponse(
@@ -61,20 +68,40 @@ async def batch_calculate_fit_scores(request: BatchFitScoreRequest):
     """
     Calculate fit scores for multiple candidates against a job.
     
-    Returns ranked list of candidates with scores and explanations.
+    Candidates that fail to score are reported in `errors` instead of
+    failing the whole batch. With `stream=true` the response is NDJSON,
+    one line per candidate in completion order, each tagged with the
+    candidate's index in the request.
     """
+    if request.stream:
+        async def stream_results():
+            async for index, outcome in fit_scorer.iter_batch_score(
+                job_id=request.job_id,
+                job_requirements=request.job_requirements,
+                candidates=request.candidates,
+                matching_mode=request.matching_mode,
+                include_explanations=request.include_explanations,
+            ):
+                key = "result" if isinstance(outcome, FitScoreResult) else "error"
+                yield json.dumps({"index": index, key: outcome.model_dump(mode="json")}) + "\n"
+        
+        return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+    
     try:
-        results = await fit_scorer.batch_score(
+        outcomes = await fit_scorer.batch_score(
             job_id=request.job_id,
             job_requirements=request.job_requirements,
             candidates=request.candidates,
+            matching_mode=request.matching_mode,
+            include_explanations=request.include_explanations,
         )
         
         return BatchFitScoreResponse(
             success=True,
             job_id=request.job_id,
             total_candidates=len(request.candidates),
-            results=results,
+            results=[o for o in outcomes if isinstance(o, FitScoreResult)],
+            errors=[o for o in outcomes if isinstance(o, CandidateScoreError)],
         )
     except Exception as e:
         raise HTTPException(
@@ -95,6 +122,7 @@ async def rank_candidates(request: BatchFitScoreRequest):
             job_id=request.job_id,
             job_requirements=request.job_requirements,
             candidates=request.candidates,
+            matching_mode=request.matching_mode,
         )
         
         return {
@@ -109,6 +137,44 @@ async def rank_candidates(request: BatchFitScoreRequest):
         )
 
 
+@router.post("/rerank")
+async def rerank_candidates(request: RerankRequest):
+    """
+    Re-rank already scored candidates for a job using new scoring weights.
+    
+    Uses the component scores stored when the job was scored, so only the
+    weighted totals are recomputed. Intended for interactive weight sliders.
+    """
+    try:
+        ranked = await fit_scorer.rerank(
+            job_id=request.job_id,
+            weights=request.weights,
+            limit=request.limit,
+        )
+        
+        return {
+            "success": True,
+            "job_id": request.job_id,
+            "weights": fit_scorer.resolve_weights(request.weights),
+            "ranked_candidates": ranked,
+        }
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No scored candidates found for job: {request.job_id}",
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to re-rank candidates: {str(e)}",
+        )
+
+
 @router.get("/score/{talent_id}/{job_id}")
 async def get_stored_fit_score(talent_id: str, job_id: str):
     """
@@ -3,7 +3,7 @@ LPI Agent API Routes
 
 Endpoints for Learning & Performance Intelligence processing.
 """
-from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile, status
 
 from src.models.lpi import (
     LPISubmissionRequest,
@@ -11,13 +11,12 @@ from src.models.lpi import (
     LPIReportResponse,
     ProcessingStatusResponse,
 )
-from src.core.lpi.summarizer import LPISummarizer
+from src.core.lpi.summarizer import lpi_summarizer
 from src.core.lpi.report_generator import LPIReportGenerator
 
 router = APIRouter()
 
 # Initialize services
-lpi_summarizer = LPISummarizer()
 report_generator = LPIReportGenerator()
 
 
@@ -39,7 +38,7 @@ async def submit_learner_work(
     - Links to external work
     - Notes/descriptions
     
-    Returns submission ID for tracking.
+    Returns submission ID for tracking; the work is summarized in the background.
     """
     if not file and not link:
         raise HTTPException(
@@ -82,27 +81,40 @@ async def submit_learner_work(
 @router.get("/submissions")
 async def list_submissions(
     program: str = None,
-    status: str = None,
+    submission_status: str = Query(None, alias="status"),
+    learner_email: str = None,
+    cursor: str = None,
     page: int = 1,
     limit: int = 20,
 ):
     """
     List learner submissions with optional filters.
+    
+    Pass the returned next_cursor as cursor to get the next page. page is
+    ignored (and returned as null) when a cursor is given.
     """
     try:
-        submissions = await lpi_summarizer.list_submissions(
+        result = await lpi_summarizer.list_submissions(
             program=program,
-            status=status,
+            status=submission_status,
+            learner_email=learner_email,
+            cursor=cursor,
             page=page,
             limit=limit,
         )
         
         return {
             "success": True,
-            "page": page,
+            "page": None if cursor else page,
             "limit": limit,
-            "submissions": submissions,
+            "submissions": result.items,
+            "next_cursor": result.next_cursor,
         }
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -137,7 +149,7 @@ async def get_submission(submission_id: str):
 @router.post("/submissions/{submission_id}/retry")
 async def retry_submission(submission_id: str):
     """
-    Retry a failed submission.
+    Retry a failed submission, using the originally submitted file.
     """
     try:
         result = await lpi_summarizer.retry_submission(submission_id)
@@ -147,6 +159,11 @@ async def retry_submission(submission_id: str):
             "submission_id": submission_id,
             "message": "Submission queued for retry",
         }
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -154,6 +171,31 @@ async def retry_submission(submission_id: str):
         )
 
 
+@router.post("/submissions/{submission_id}/resummarize")
+async def resummarize_submission(submission_id: str):
+    """
+    Summarize a processed submission again from its stored file.
+    """
+    try:
+        await lpi_summarizer.resummarize_submission(submission_id)
+        
+        return {
+            "success": True,
+            "submission_id": submission_id,
+            "message": "Submission queued for summarization",
+        }
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to resummarize submission: {str(e)}",
+        )
+
+
 @router.get("/processing-status", response_model=ProcessingStatusResponse)
 async def get_processing_status():
     """
@@ -167,6 +209,7 @@ async def get_processing_status():
             in_queue=status["in_queue"],
             failed=status["failed"],
             last_updated=status.get("last_updated"),
+            failed_items=status.get("failed_items", []),
         )
     except Exception as e:
         raise HTTPException(
@@ -180,18 +223,31 @@ async def list_reports(
     learner_email: str = None,
     program: str = None,
     report_type: str = None,
+    cursor: str = None,
+    limit: int = None,
 ):
     """
     List generated LPI reports.
+    
+    Without a limit every matching report is returned, as before pagination
+    was added. With a limit, pass the returned next_cursor as cursor to get
+    the next page.
     """
     try:
-        reports = await report_generator.list_reports(
+        result = await report_generator.list_reports(
             learner_email=learner_email,
             program=program,
             report_type=report_type,
+            cursor=cursor,
+            limit=limit,
         )
         
-        return {"success": True, "reports": reports}
+        return {"success": True, "reports": result.items, "next_cursor": result.next_cursor}
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
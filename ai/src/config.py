@@ -20,6 +20,8 @@ class Settings(BaseSettings):
     azure_openai_embedding_endpoint: str = ""
     azure_openai_embedding_key: str = ""
     azure_embedding_model: str = "text-embedding-3-small"
+    embedding_cache_size: int = 50000
+    embedding_batch_size: int = 256
 
     # MongoDB Atlas (Vector Storage)
     mongodb_connection_string: str = ""
@@ -47,6 +49,80 @@ class Settings(BaseSettings):
     max_cv_size_mb: int = 10
     max_tokens_per_request: int = 4000
 
+    # Document Extraction
+    extraction_workers: int = 2
+    extraction_max_tasks_per_child: int = 50
+    extraction_timeout_seconds: float = 30.0
+    extraction_max_pages: int = 50
+    extraction_pages_per_chunk: int = 8
+    extraction_char_budget: int = 100000
+
+    # CV Parsing
+    cv_section_parsing_min_chars: int = 6000  # Longer CVs are parsed per section, concurrently
+
+    # Bulk CV Ingestion
+    ingestion_checkpoint_dir: str = "/tmp/veritalent_ai/ingestion"
+    ingestion_queue_size: int = 16
+    ingestion_download_concurrency: int = 8
+    ingestion_extract_concurrency: int = 2
+    ingestion_parse_concurrency: int = 4  # Bounded by the LLM quota
+    ingestion_embed_concurrency: int = 2
+    ingestion_store_concurrency: int = 2
+    ingestion_checkpoint_every: int = 25
+
+    # Extracted Text Cache
+    text_cache_enabled: bool = True
+    text_cache_dir: str = "/tmp/veritalent_ai/text_cache"
+    text_cache_memory_mb: int = 64
+    text_cache_disk_mb: int = 512
+
+    # File Downloads
+    download_temp_dir: str = "/tmp/veritalent_ai"
+    download_timeout_seconds: float = 30.0
+    download_max_connections: int = 50
+    download_max_keepalive_connections: int = 20
+    download_spool_threshold_kb: int = 1024
+    download_max_concurrency: int = 8
+    download_per_host_limit: int = 4
+    download_max_attempts: int = 3
+    download_retry_backoff_seconds: float = 0.5
+
+    # Background Work Queue
+    work_queue_path: str = "/tmp/veritalent_ai/work_queue.db"  # SQLite (WAL) job store
+    work_queue_workers: int = 2  # Workers per queue
+    work_queue_max_attempts: int = 3
+    work_queue_visibility_timeout_seconds: float = 600.0  # Above the LLM timeout; expired leases are reclaimed
+    work_queue_retry_backoff_seconds: float = 5.0  # Doubled after every failed attempt
+    work_queue_poll_interval_seconds: float = 1.0
+
+    # Submission Content Store
+    content_store_dir: str = "/tmp/veritalent_ai/content"
+    content_store_ttl_hours: float = 168.0  # Unused blobs are evicted after this long
+    content_store_min_compression_saving: float = 0.1  # Store compressed only if it saves this fraction
+    content_store_eviction_interval_seconds: float = 3600.0
+
+    # Skills Taxonomy
+    skills_taxonomy_path: str = str(Path(__file__).parent.parent / "data" / "skills_taxonomy.json")
+    skill_similarity_path: str = str(Path(__file__).parent.parent / "data" / "skill_similarity.npz")
+
+    # Competency Signals
+    competency_max_cached_talents: int = 1024  # Talents whose evidence index is kept in memory (all are stored)
+    competency_store_path: str = "/tmp/veritalent_ai/competency_signals.db"  # SQLite signal store
+    competency_store_cache_size: int = 1024  # Talents' latest signals kept in memory
+    competency_store_max_versions: int = 5  # Signal versions kept per talent
+    competency_batch_workers: int = 0  # Cohort generation processes (0 = one per CPU core)
+    competency_batch_shard_size: int = 16  # Talents per pool task
+    competency_batch_max_tasks_per_child: int = 100  # Recycle workers after this many shards
+    competency_matching_mode: str = "exact"  # "exact", or "semantic" to also link evidence by embeddings
+    competency_semantic_threshold: float = 0.45  # Sentence-to-skill similarity needed for a semantic link
+    
+    # Fit Scoring
+    fit_score_store_path: str = "/tmp/veritalent_ai/fit_components.db"  # SQLite component store
+    fit_score_max_cached_jobs: int = 256  # Jobs whose component matrix is kept in memory
+    fit_scoring_matching_mode: str = "exact"  # "exact" or "semantic"
+    semantic_match_threshold: float = 0.80
+    fit_scoring_max_concurrency: int = 8
+
     @property
     def allowed_origins(self) -> list[str]:
         """Parse allowed origins from comma-separated string."""
@@ -12,7 +12,8 @@ from src.models.backend_integration import (
     ScreeningScoreResult,
 )
 from src.services.llm_service import llm_service
-from src.services.file_downloader import file_downloader
+from src.services.file_downloader import DownloadedFile, file_downloader
+from src.services.text_extraction import text_extraction_service
 
 logger = logging.getLogger(__name__)
 
@@ -36,19 +37,21 @@ class AIOperationHandler:
             raise ValueError("No file provided for resume parsing")
         
         # Download CV from Cloudinary
-        cv_content = await file_downloader.download_from_url(
+        cv_file = await file_downloader.download_from_url(
             request.file.url,
             request.file.original_name,
         )
         
-        if not cv_content:
+        if not cv_file:
             raise ValueError("Failed to download CV file")
         
         # Extract text from CV
-        cv_text = self._extract_text_from_file(
-            cv_content,
-            request.file.mime_type,
-        )
+        with cv_file:
+            cv_text = await self._extract_text_from_file(
+                cv_file,
+                request.file.mime_type,
+                request.file.original_name,
+            )
         
         # Use LLM to parse CV
         parsed_data = await llm_service.parse_cv(cv_text)
@@ -112,15 +115,17 @@ class AIOperationHandler:
         # Download and parse CV if provided
         cv_data = {}
         if request.file:
-            cv_content = await file_downloader.download_from_url(
+            cv_file = await file_downloader.download_from_url(
                 request.file.url,
                 request.file.original_name,
             )
-            if cv_content:
-                cv_text = self._extract_text_from_file(
-                    cv_content,
-                    request.file.mime_type,
-                )
+            if cv_file:
+                with cv_file:
+                    cv_text = await self._extract_text_from_file(
+                        cv_file,
+                        request.file.mime_type,
+                        request.file.original_name,
+                    )
                 cv_data = await llm_service.parse_cv(cv_text)
         
         # Get screening criteria
@@ -264,32 +269,29 @@ class AIOperationHandler:
             "message": "Competency verification not yet implemented",
         }
     
-    def _extract_text_from_file(
+    async def _extract_text_from_file(
         self,
-        content: bytes,
+        file: DownloadedFile,
         mime_type: str,
+        filename: str = "",
     ) -> str:
         """
-        Extract text from file content.
+        Extract text from a downloaded file.
+        
+        PDF and DOCX files are parsed in the extraction process pool;
+        spooled downloads are read by the workers straight from disk.
         
         Args:
-            content: Raw file bytes
+            file: Downloaded file
             mime_type: MIME type of file
+            filename: Original filename (used to sniff the type)
             
         Returns:
             Extracted text
         """
-        # For now, simple text extraction
-        # TODO: Add proper PDF, DOCX parsing
-        
-        if mime_type == "application/pdf":
-            # Placeholder - add PyPDF2 or pdfplumber
-            return content.decode("utf-8", errors="ignore")
-        elif "word" in mime_type or "docx" in mime_type:
-            # Placeholder - add python-docx
-            return content.decode("utf-8", errors="ignore")
-        else:
-            return content.decode("utf-8", errors="ignore")
+        return await text_extraction_service.extract(
+            file.buffer, mime_type, filename, path=file.path
+        )
 
 
 # Singleton instance
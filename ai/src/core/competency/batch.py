@@ -0,0 +1,207 @@
+"""
+Cohort Competency Generation
+
+Generates competency signals for many talents at once. Requests are split
+into shards and scored on a process pool (evidence matching and scoring are
+CPU-bound), and results are yielded as each shard completes so they can be
+streamed back. Finished signal sets (and the evidence they were scored
+from) are stored from the parent process, as are semantic evidence links
+(one embedding batch per shard) when enabled.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Optional, Union
+
+from src.config import settings
+from src.core.competency.records import to_models
+from src.core.competency.signal_generator import CompetencySignalGenerator, declared_skills
+from src.models.competency import CompetencyBatchError, CompetencyBatchResult, CompetencyRequest
+
+logger = logging.getLogger(__name__)
+
+# Per-worker generator (no LLM/DB clients are opened to score)
+_worker_generator: Optional[CompetencySignalGenerator] = None
+
+
+def generate_shard_sync(shard: list[tuple[int, dict]]) -> list[tuple[int, Union[tuple, str]]]:
+    """
+    Score a shard of talents (runs in a pool worker).
+
+    Args:
+        shard: (request index, generate() keyword arguments) pairs
+
+    Returns:
+        (index, (signal records, fingerprint, evidence index rows)) per talent,
+        or (index, error message)
+    """
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = CompetencySignalGenerator()
+
+    outcomes = []
+    for index, kwargs in shard:
+        try:
+            computed = _worker_generator.compute(**kwargs)
+            outcomes.append((index, (computed.signals, computed.fingerprint, computed.index.dump())))
+        except Exception as e:
+            outcomes.append((index, str(e) or type(e).__name__))
+    return outcomes
+
+
+def request_kwargs(request: CompetencyRequest) -> dict:
+    """generate() keyword arguments of a request."""
+    return {
+        "talent_id": request.talent_id,
+        "cv_data": request.cv_data,
+        "professional_recommendations": request.professional_recommendations,
+        "verified_certifications": request.verified_certifications,
+        "tapi_data": request.tapi_data,
+        "work_references": request.work_references,
+        "work_samples": request.work_samples,
+    }
+
+
+class CompetencyBatchService:
+    """Process-pool backed cohort signal generation."""
+
+    def __init__(
+        self,
+        generator: Optional[CompetencySignalGenerator] = None,
+        max_workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = None,
+    ):
+        self.generator = generator or CompetencySignalGenerator()
+        self.max_workers = max_workers or settings.competency_batch_workers or os.cpu_count() or 1
+        self.shard_size = shard_size or settings.competency_batch_shard_size
+        self.max_tasks_per_child = max_tasks_per_child or settings.competency_batch_max_tasks_per_child
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """Worker pool, created on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                max_tasks_per_child=self.max_tasks_per_child,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    async def iter_generate(
+        self,
+        requests: list[CompetencyRequest],
+    ) -> AsyncIterator[Union[CompetencyBatchResult, CompetencyBatchError]]:
+        """
+        Generate signals for a cohort, yielding each talent's outcome as its shard completes.
+
+        At most two shards per worker are in flight, so a large cohort is not
+        pickled into the pool all at once.
+
+        Args:
+            requests: One CompetencyRequest per talent
+
+        Yields:
+            CompetencyBatchResult, or CompetencyBatchError for talents that failed
+        """
+        indexed = [(index, request_kwargs(request)) for index, request in enumerate(requests)]
+        shards = [
+            indexed[start:start + self.shard_size]
+            for start in range(0, len(indexed), self.shard_size)
+        ]
+        # Future -> (shard, pool it was submitted to)
+        pending: dict[asyncio.Future, tuple[list[tuple[int, dict]], ProcessPoolExecutor]] = {}
+        next_shard = 0
+
+        try:
+            while next_shard < len(shards) or pending:
+                while next_shard < len(shards) and len(pending) < self.max_workers * 2:
+                    shard = shards[next_shard]
+                    future, pool = await self._submit(shard)
+                    pending[future] = (shard, pool)
+                    next_shard += 1
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    shard, pool = pending.pop(future)
+                    try:
+                        outcomes = future.result()
+                    except BrokenProcessPool as e:
+                        # Shards of one crashed pool can fail in separate rounds:
+                        # only the first replaces it, later ones leave the new pool alone
+                        self._reset_pool(pool)
+                        outcomes = [(index, f"Worker crashed: {e}") for index, _ in shard]
+                    except asyncio.CancelledError:
+                        # The pool was shut down under the shard
+                        outcomes = [(index, "Shard was cancelled") for index, _ in shard]
+                    except Exception as e:
+                        outcomes = [(index, str(e) or type(e).__name__) for index, _ in shard]
+
+                    for index, outcome in outcomes:
+                        yield await self._finish(requests[index], index, outcome)
+        finally:
+            # Client went away mid-stream: drop shards not yet started
+            for future in pending:
+                future.cancel()
+
+    async def _submit(self, shard: list[tuple[int, dict]]) -> tuple[asyncio.Future, ProcessPoolExecutor]:
+        """
+        Link the shard's evidence semantically (if enabled) and submit it to the pool.
+
+        Returns:
+            The shard's future, and the pool it was submitted to
+        """
+        links = await self.generator.semantic_links([kwargs for _, kwargs in shard])
+        shard = [
+            (index, {**kwargs, "semantic_links": talent_links})
+            for (index, kwargs), talent_links in zip(shard, links)
+        ]
+        pool = self.pool
+        future: Future = pool.submit(generate_shard_sync, shard)
+        return asyncio.wrap_future(future), pool
+
+    async def _finish(
+        self,
+        request: CompetencyRequest,
+        index: int,
+        outcome: Union[tuple, str],
+    ) -> Union[CompetencyBatchResult, CompetencyBatchError]:
+        """Store a talent's signals and wrap its outcome."""
+        if isinstance(outcome, str):
+            logger.warning(f"Failed to generate signals for {request.talent_id}: {outcome}")
+            return CompetencyBatchError(index=index, talent_id=request.talent_id, error=outcome)
+
+        # Records were pickled back from the worker; models are built here, once
+        records, fingerprint, evidence = outcome
+        signals = to_models(records)
+        await self.generator.save_signals(request.talent_id, fingerprint, signals)
+        await self.generator.save_evidence(request.talent_id, declared_skills(request.cv_data), evidence)
+        self.generator.forget(request.talent_id)
+        return CompetencyBatchResult(index=index, talent_id=request.talent_id, signals=signals)
+
+    def _reset_pool(self, pool: ProcessPoolExecutor) -> None:
+        """
+        Drop a broken pool; the next submit starts a new one.
+
+        A no-op if the pool was already replaced. Its unfinished shards have
+        already failed with BrokenProcessPool, so none are cancelled (other
+        requests' shards on the current pool are never touched).
+        """
+        if pool is not self._pool:
+            return
+        self._pool = None
+        pool.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Singleton instance
+competency_batch_service = CompetencyBatchService()
@@ -0,0 +1,253 @@
+"""
+Evidence Index
+
+Indexes a talent's evidence (CV, recommendations, certifications, TAPI,
+references, work samples) by skill in a single pass: every evidence text is
+scanned once with the talent's skill scanner, instead of once per skill.
+
+Each evidence item is kept under an id, so items can later be added,
+replaced or removed one at a time and only the skills they mention need
+rescoring. An index can be dumped to JSON rows and restored without
+rescanning.
+Items can also be linked to skills found by the semantic linker, on top of
+the skills they name.
+"""
+import hashlib
+import json
+from typing import Iterable, NamedTuple, Optional
+
+from src.utils.skill_scanner import SkillScanner
+from src.utils.skills_taxonomy import SkillsTaxonomy
+
+# Confidence of a single piece of evidence, by source
+CV_CONFIDENCE = 0.7
+PR_CONFIDENCE = 0.9
+CERT_CONFIDENCE = 1.0  # Verified credentials
+REF_CONFIDENCE = 0.85
+WORK_SAMPLE_CONFIDENCE = 0.85
+
+SNIPPET_LENGTH = 200
+
+# Kinds of evidence, in the order their evidence is listed on a signal
+EVIDENCE_KINDS = (
+    "cv",
+    "recommendation",
+    "certification",
+    "tapi",
+    "reference",
+    "work_sample",
+)
+KIND_ORDER = {kind: position for position, kind in enumerate(EVIDENCE_KINDS)}
+
+# Free-text fields of an evidence item, by kind (first non-empty wins)
+TEXT_FIELDS = {
+    "recommendation": ("text", "recommendation"),
+    "tapi": ("summary",),
+    "reference": ("feedback", "text"),
+    "work_sample": ("description",),
+}
+
+# Sources that verify a skill
+VERIFYING_SOURCES = frozenset({"PR", "V.Cert", "Ref"})
+
+
+class IndexedEvidence(NamedTuple):
+    """A piece of evidence for one or more skills, before scoring."""
+
+    kind: str
+    source: str
+    confidence: float
+    snippet: str
+    issuer: Optional[str] = None  # Recommendations only
+
+
+def evidence_id(kind: str, item) -> str:
+    """Id of an evidence item: its own "id", else a hash of its content."""
+    if isinstance(item, dict) and item.get("id"):
+        return f"{kind}:{item['id']}"
+    payload = json.dumps(item, sort_keys=True, default=str)
+    return f"{kind}:{hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]}"
+
+
+def evidence_text(kind: str, item) -> str:
+    """Free text of an evidence item ("" for kinds without one)."""
+    if kind == "cv":
+        return item
+    for field in TEXT_FIELDS.get(kind, ()):
+        text = item.get(field, "")
+        if text:
+            return text
+    return ""
+
+
+class EvidenceIndex:
+    """Evidence per skill key for one talent."""
+
+    def __init__(self, scanner: SkillScanner, taxonomy: SkillsTaxonomy):
+        self.scanner = scanner
+        self.taxonomy = taxonomy
+        # Evidence id -> (evidence, skill keys it supports)
+        self.items: dict[str, tuple[IndexedEvidence, list[str]]] = {}
+        # Skill key -> evidence ids, in insertion order
+        self.by_skill: dict[str, dict[str, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _mentioned(self, text: str, listed: Optional[list] = None) -> list[str]:
+        """Keys of skills mentioned in text or listed explicitly."""
+        keys = self.scanner.find(text) if text else []
+        for skill in listed or []:
+            if isinstance(skill, str) and skill.strip():
+                key = self.taxonomy.key(skill)
+                if key not in keys:
+                    keys.append(key)
+        return keys
+
+    def _read(self, kind: str, item) -> tuple[IndexedEvidence, list[str]]:
+        """Evidence and mentioned skill keys of one source item."""
+        if kind == "cv":
+            # A work experience responsibility or achievement
+            evidence = IndexedEvidence(kind, "CV", CV_CONFIDENCE, item[:SNIPPET_LENGTH])
+            return evidence, self._mentioned(item)
+
+        if kind == "recommendation":
+            text = evidence_text(kind, item)
+            evidence = IndexedEvidence(
+                kind, "PR", PR_CONFIDENCE, text[:SNIPPET_LENGTH], item.get("issuer", "Professional")
+            )
+            return evidence, self._mentioned(text)
+
+        if kind == "certification":
+            name = item.get("name", "")
+            snippet = f"{name} - {item.get('issuer', 'Unknown')}"
+            evidence = IndexedEvidence(kind, "V.Cert", CERT_CONFIDENCE, snippet)
+            return evidence, self._mentioned(name, item.get("skills", []))
+
+        if kind == "tapi":
+            summary = evidence_text(kind, item)
+            # performance_score is caller input: keep the confidence within [0, 1]
+            confidence = min(1.0, max(0.0, item.get("performance_score", 0) / 100.0))
+            evidence = IndexedEvidence(kind, "TAPI", confidence, summary[:SNIPPET_LENGTH])
+            return evidence, self._mentioned(summary, item.get("skills_demonstrated", []))
+
+        if kind == "reference":
+            text = evidence_text(kind, item)
+            evidence = IndexedEvidence(kind, "Ref", REF_CONFIDENCE, text[:SNIPPET_LENGTH])
+            return evidence, self._mentioned(text)
+
+        if kind == "work_sample":
+            # Work samples enhance CV evidence
+            text = evidence_text(kind, item)
+            evidence = IndexedEvidence(kind, "CV", WORK_SAMPLE_CONFIDENCE, text[:SNIPPET_LENGTH])
+            return evidence, self._mentioned(text, item.get("technologies", []))
+
+        raise ValueError(f"Unknown evidence source: {kind}")
+
+    def add(
+        self,
+        kind: str,
+        item,
+        item_id: Optional[str] = None,
+        linked: Iterable[str] = (),
+    ) -> set[str]:
+        """
+        Index one evidence item, replacing any item already held under its id.
+
+        Args:
+            kind: One of EVIDENCE_KINDS
+            item: Source item (a text for "cv", otherwise a dict)
+            item_id: Evidence id (defaults to evidence_id(kind, item))
+            linked: Further skill keys the item supports (semantic links)
+
+        Returns:
+            Skill keys whose evidence changed
+        """
+        evidence, keys = self._read(kind, item)
+        keys += [key for key in linked if key not in keys]
+
+        item_id = item_id or evidence_id(kind, item)
+        changed = self.remove(item_id)
+        if not keys:
+            return changed
+
+        self.items[item_id] = (evidence, keys)
+        for key in keys:
+            self.by_skill.setdefault(key, {})[item_id] = None
+        return changed | set(keys)
+
+    def remove(self, item_id: str) -> set[str]:
+        """
+        Drop one evidence item.
+
+        Returns:
+            Skill keys whose evidence changed (empty if the id is unknown)
+        """
+        entry = self.items.pop(item_id, None)
+        if entry is None:
+            return set()
+
+        _, keys = entry
+        for key in keys:
+            ids = self.by_skill.get(key)
+            if ids is not None:
+                ids.pop(item_id, None)
+                if not ids:
+                    del self.by_skill[key]
+        return set(keys)
+
+    def _unique_id(self, kind: str, item) -> str:
+        """Id of an item indexed in bulk: the same content given twice still counts twice."""
+        item_id = evidence_id(kind, item)
+        if item_id not in self.items:
+            return item_id
+        suffix = 2
+        while f"{item_id}#{suffix}" in self.items:
+            suffix += 1
+        return f"{item_id}#{suffix}"
+
+    def add_cv(self, cv_data: dict) -> None:
+        """Index work experience responsibilities and achievements."""
+        for exp in cv_data.get("work_experience", []):
+            for item in exp.get("responsibilities", []) + exp.get("achievements", []):
+                self.add("cv", item, self._unique_id("cv", item))
+
+    def add_all(self, kind: str, items: list, linked: Optional[list[list[str]]] = None) -> None:
+        """Index every item of one source (linked: semantic links per item, aligned with items)."""
+        for position, item in enumerate(items):
+            self.add(kind, item, self._unique_id(kind, item), linked=linked[position] if linked else ())
+
+    def indexed(self, key: str) -> list[IndexedEvidence]:
+        """A skill's evidence, grouped by source in EVIDENCE_KINDS order."""
+        evidence = [self.items[item_id][0] for item_id in self.by_skill.get(key, {})]
+        return sorted(evidence, key=lambda item: KIND_ORDER[item.kind])
+
+    def dump(self) -> list:
+        """Indexed items as JSON-serialisable rows (see restore())."""
+        return [[item_id, list(evidence), keys] for item_id, (evidence, keys) in self.items.items()]
+
+    @classmethod
+    def restore(cls, scanner: SkillScanner, taxonomy: SkillsTaxonomy, rows: list) -> "EvidenceIndex":
+        """Rebuild an index from dump() rows, without scanning any text again."""
+        index = cls(scanner, taxonomy)
+        for item_id, evidence, keys in rows:
+            index.items[item_id] = (IndexedEvidence(*evidence), keys)
+            for key in keys:
+                index.by_skill.setdefault(key, {})[item_id] = None
+        return index
+
+
+def verification(evidence: list[IndexedEvidence]) -> tuple[bool, Optional[str]]:
+    """
+    Whether a skill's evidence verifies it, and by whom.
+
+    Returns:
+        (verified, issuer of the latest recommendation or None)
+    """
+    verified, verified_by = False, None
+    for item in evidence:
+        if item.source in VERIFYING_SOURCES:
+            verified = True
+        if item.issuer is not None:
+            verified_by = item.issuer
+    return verified, verified_by
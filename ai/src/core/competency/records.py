@@ -0,0 +1,87 @@
+"""
+Competency Signal Records
+
+Slotted record of a scored signal, used inside the generation pipeline
+(and pickled between pool workers) instead of the pydantic models. Records
+are converted to CompetencySignal once, where signals leave the pipeline;
+the values are computed internally and kept within the models' bounds
+(evidence confidence is clamped when indexed, contributions when scored),
+so conversion skips validation.
+"""
+from typing import Optional
+
+from src.core.competency.evidence_index import IndexedEvidence
+from src.core.competency.scoring import BASE_SIGNAL, BREAKDOWN_FIELDS, SOURCE_COLUMNS
+from src.models.competency import CompetencySignal, Evidence, SourceBreakdown
+
+
+class SignalRecord:
+    """A scored competency signal."""
+
+    __slots__ = (
+        "skill",
+        "score",
+        "level",
+        "evidence",
+        "contributions",
+        "confidence",
+        "verified",
+        "verified_by",
+    )
+
+    def __init__(
+        self,
+        skill: str,
+        score: int,
+        level: str,
+        evidence: list[IndexedEvidence],
+        contributions: list[float],
+        confidence: float,
+        verified: bool = False,
+        verified_by: Optional[str] = None,
+    ):
+        self.skill = skill
+        self.score = score
+        self.level = level
+        self.evidence = evidence
+        # Contribution of each scored source, in scoring.SOURCES order
+        self.contributions = contributions
+        self.confidence = confidence
+        self.verified = verified
+        self.verified_by = verified_by
+
+    def weight_contribution(self, source: str) -> float:
+        """Contribution of an evidence source to the score."""
+        column = SOURCE_COLUMNS.get(source)
+        return self.contributions[column] if column is not None else 0.0
+
+    def to_model(self) -> CompetencySignal:
+        """Public CompetencySignal model."""
+        return CompetencySignal.model_construct(
+            skill=self.skill,
+            score=self.score,
+            level=self.level,
+            evidence=[
+                Evidence.model_construct(
+                    source=item.source,
+                    confidence=item.confidence,
+                    snippet=item.snippet,
+                    date=None,
+                    weight_contribution=self.weight_contribution(item.source),
+                )
+                for item in self.evidence
+            ],
+            source_breakdown=SourceBreakdown.model_construct(
+                **dict(zip(BREAKDOWN_FIELDS, self.contributions)),
+                base_signal=BASE_SIGNAL,
+            ),
+            confidence=self.confidence,
+            verified=self.verified,
+            verified_by=self.verified_by,
+            last_updated=None,
+        )
+
+
+def to_models(records: list[SignalRecord]) -> list[CompetencySignal]:
+    """Convert records to public models."""
+    return [record.to_model() for record in records]
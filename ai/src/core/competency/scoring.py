@@ -0,0 +1,96 @@
+"""
+Competency Signal Scoring
+
+Weighted multi-source scoring for all of a talent's signals at once: evidence
+counts and confidence sums are packed into (signals x sources) arrays, and
+source contributions, scores, levels and confidences are computed in one
+vectorized pass.
+
+Per source: max weight x mean evidence confidence x strength, where strength
+is the evidence count over the count needed for full strength (capped at 1).
+"""
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from src.core.competency.evidence_index import IndexedEvidence
+
+# Scored sources, in SourceBreakdown field order
+SOURCES = ("CV", "PR", "V.Cert", "TAPI", "Ref")
+SOURCE_COLUMNS = {source: column for column, source in enumerate(SOURCES)}
+BREAKDOWN_FIELDS = (
+    "cv_analysis",
+    "professional_recommendations",
+    "verified_certifications",
+    "tapi_intelligence",
+    "work_references",
+)
+
+# Max contribution of each source (percentage points)
+MAX_WEIGHTS = np.array([15.0, 15.0, 20.0, 20.0, 20.0])
+
+# Pieces of evidence for full strength: 3+ CV items, 2+ recommendations,
+# 2+ certs, 3+ TAPI activities, 2+ references
+FULL_STRENGTH_COUNTS = np.array([3.0, 2.0, 2.0, 3.0, 2.0])
+
+# Applied to all verified profiles
+BASE_SIGNAL = 10.0
+
+# Lower score bound of each level above "Poor"
+LEVEL_THRESHOLDS = np.array([31, 51, 61, 76])
+LEVELS = ("Poor", "Low", "Good", "Very Good", "Excellent")
+
+
+class SignalScores(NamedTuple):
+    """Scores of a batch of signals, one row per signal."""
+
+    breakdown: np.ndarray  # (signals x SOURCES) contributions
+    scores: np.ndarray  # Final integer scores
+    confidences: np.ndarray  # Mean confidence over all evidence
+    levels: list[str]
+
+
+def score_signals(evidence_per_signal: Iterable[list[IndexedEvidence]]) -> SignalScores:
+    """
+    Score signals from their evidence.
+
+    Args:
+        evidence_per_signal: Each signal's evidence
+
+    Returns:
+        SignalScores with one row per signal
+    """
+    evidence_per_signal = list(evidence_per_signal)
+    rows = len(evidence_per_signal)
+    counts = np.zeros((rows, len(SOURCES)))
+    confidence_sums = np.zeros((rows, len(SOURCES)))
+    total_confidence = np.zeros(rows)
+    total_counts = np.zeros(rows)
+
+    # Pack: the only per-evidence Python loop
+    for row, evidence in enumerate(evidence_per_signal):
+        total = 0.0
+        for item in evidence:
+            column = SOURCE_COLUMNS.get(item.source)
+            if column is not None:
+                counts[row, column] += 1
+                confidence_sums[row, column] += item.confidence
+            total += item.confidence
+        total_confidence[row] = total
+        total_counts[row] = len(evidence)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_confidence = np.where(counts > 0, confidence_sums / counts, 0.0)
+        overall = np.where(total_counts > 0, total_confidence / total_counts, 0.0)
+    strength = np.minimum(1.0, counts / FULL_STRENGTH_COUNTS)
+    # Capped at each source's SourceBreakdown limit (models are built without validation)
+    breakdown = np.clip(MAX_WEIGHTS * mean_confidence * strength, 0.0, MAX_WEIGHTS)
+
+    # Summed source by source, in the same order as SourceBreakdown
+    totals = np.full(rows, 0.0)
+    for column in range(len(SOURCES)):
+        totals = totals + breakdown[:, column]
+    scores = np.minimum(100.0, totals + BASE_SIGNAL).astype(np.int64)
+
+    levels = [LEVELS[level] for level in np.searchsorted(LEVEL_THRESHOLDS, scores, side="right")]
+    return SignalScores(breakdown, scores, overall, levels)
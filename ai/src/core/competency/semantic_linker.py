@@ -0,0 +1,138 @@
+"""
+Semantic Evidence Linker
+
+Links free-text evidence (recommendations, TAPI summaries, references) to
+declared skills it never names literally: "built REST services in Django"
+supports "Python". Evidence is split into sentences and each sentence is
+compared with every declared skill by embedding similarity; a skill is
+linked when any sentence of an item reaches the threshold.
+
+All sentences and skills of a call are embedded in one embed_texts batch
+(vectors are cached by text hash), so latency grows with the number of
+batches rather than the number of sentences.
+"""
+import re
+from typing import Optional
+
+import numpy as np
+
+from src.core.competency.evidence_index import evidence_text
+from src.services.embedding_service import EmbeddingService
+from src.utils.skills_taxonomy import SkillsTaxonomy
+
+# Evidence kinds whose text is linked (generate() argument -> kind)
+LINKED_SOURCES = {
+    "professional_recommendations": "recommendation",
+    "tapi_data": "tapi",
+    "work_references": "reference",
+}
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?;])\s+|\n+")
+MIN_SENTENCE_LENGTH = 12  # Shorter fragments carry too little meaning to embed
+
+
+def split_sentences(text: str) -> list[str]:
+    """Sentences of an evidence text, without fragments too short to match."""
+    sentences = (part.strip() for part in SENTENCE_BOUNDARY.split(text or ""))
+    return [sentence for sentence in sentences if len(sentence) >= MIN_SENTENCE_LENGTH]
+
+
+class SemanticEvidenceLinker:
+    """Finds declared skills supported by evidence sentences."""
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        taxonomy: SkillsTaxonomy,
+        threshold: float,
+    ):
+        self.embedding_service = embedding_service
+        self.taxonomy = taxonomy
+        self.threshold = threshold
+
+    async def link(self, skills: list[str], sources: dict[str, list]) -> dict[str, list[list[str]]]:
+        """
+        Semantic skill links of one talent's evidence.
+
+        Args:
+            skills: Declared skill names
+            sources: generate() evidence arguments (only LINKED_SOURCES are read)
+
+        Returns:
+            Evidence kind -> linked skill keys per item, aligned with the items
+        """
+        return (await self.link_many([(skills, sources)]))[0]
+
+    async def link_many(
+        self,
+        talents: list[tuple[list[str], dict[str, list]]],
+    ) -> list[dict[str, list[list[str]]]]:
+        """
+        Semantic skill links of several talents, embedded in one batch.
+
+        Args:
+            talents: (declared skill names, generate() evidence arguments) per talent
+
+        Returns:
+            One link mapping per talent (see link())
+        """
+        texts: list[str] = []
+        positions: dict[str, int] = {}
+
+        def position(text: str) -> int:
+            if text not in positions:
+                positions[text] = len(texts)
+                texts.append(text)
+            return positions[text]
+
+        # Rows of every skill and sentence, shared across talents
+        plans = []
+        for skills, sources in talents:
+            names = list(dict.fromkeys(skill for skill in skills if skill))
+            skill_rows = [position(name) for name in names]
+            items = {
+                kind: [
+                    [position(sentence) for sentence in split_sentences(evidence_text(kind, item))]
+                    for item in sources.get(argument) or []
+                ]
+                for argument, kind in LINKED_SOURCES.items()
+            }
+            plans.append(([self.taxonomy.key(name) for name in names], skill_rows, items))
+
+        if not texts:
+            return [{} for _ in talents]
+
+        vectors = await self.embedding_service.embed_texts(texts)
+        return [self._match(vectors, keys, skill_rows, items) for keys, skill_rows, items in plans]
+
+    def _match(
+        self,
+        vectors: np.ndarray,
+        keys: list[str],
+        skill_rows: list[int],
+        items: dict[str, list[list[int]]],
+    ) -> dict[str, list[list[str]]]:
+        """Skill keys each item's sentences reach the threshold for."""
+        links: dict[str, list[list[str]]] = {}
+        sentence_rows = [row for sentences in items.values() for rows in sentences for row in rows]
+        if not keys or not sentence_rows or vectors.shape[1] == 0:
+            return links
+
+        # One (sentences x skills) similarity matrix per talent
+        similarity = vectors[sentence_rows] @ vectors[skill_rows].T
+        matched = similarity >= self.threshold
+
+        offset = 0
+        for kind, sentences in items.items():
+            kind_links = []
+            for rows in sentences:
+                hits: Optional[np.ndarray] = None
+                if rows:
+                    hits = matched[offset:offset + len(rows)].any(axis=0)
+                    offset += len(rows)
+                kind_links.append(
+                    [keys[column] for column in np.flatnonzero(hits)] if hits is not None else []
+                )
+            if any(kind_links):
+                links[kind] = kind_links
+        return links
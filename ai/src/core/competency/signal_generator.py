@@ -18,19 +18,85 @@ Signal Level Classification:
 - 61-75: Very Good (Strong consistent validation)
 - 76-100: Excellent (Highly credible multi-dimensional validation)
 """
-from typing import Optional
+import logging
+from collections import OrderedDict
+from typing import NamedTuple, Optional
 
-from src.models.competency import CompetencySignal, Evidence, SourceBreakdown
+from src.config import settings
+from src.core.competency.evidence_index import EVIDENCE_KINDS, EvidenceIndex, evidence_id, verification
+from src.core.competency.records import SignalRecord, to_models
+from src.core.competency.scoring import score_signals
+from src.core.competency.semantic_linker import LINKED_SOURCES, SemanticEvidenceLinker
+from src.models.competency import CompetencySignal
 from src.services.llm_service import LLMService
 from src.services.embedding_service import EmbeddingService
+from src.services.signal_store import CompetencySignalStore, input_fingerprint, signal_store
+from src.utils.skills_taxonomy import get_skills_taxonomy
+
+logger = logging.getLogger(__name__)
+
+
+def declared_skills(cv_data: Optional[dict]) -> list[str]:
+    """Skill names declared on a CV."""
+    return [
+        skill if isinstance(skill, str) else skill.get("name", "")
+        for skill in (cv_data or {}).get("skills", [])
+    ]
+
+
+class ComputedSignals(NamedTuple):
+    """Scored signals for one talent, with the evidence they came from."""
+
+    signals: list[SignalRecord]
+    fingerprint: str
+    skills: list[str]
+    index: EvidenceIndex
 
 
 class CompetencySignalGenerator:
     """Service for generating competency signals."""
 
-    def __init__(self):
-        self.llm_service = LLMService()
-        self.embedding_service = EmbeddingService()
+    def __init__(
+        self,
+        store: Optional[CompetencySignalStore] = None,
+        matching_mode: Optional[str] = None,
+    ):
+        # LLM/embedding clients (and the MongoDB connection) are created on
+        # first use, so pool workers that only score never open them
+        self._llm_service: Optional[LLMService] = None
+        self._embedding_service: Optional[EmbeddingService] = None
+        self.store = store or signal_store
+        self.matching_mode = matching_mode or settings.competency_matching_mode
+        
+        # Per-talent declared skills and evidence, for incremental updates
+        # (most recently used in memory; all of them in the store)
+        self.max_talents = settings.competency_max_cached_talents
+        self._talents: OrderedDict[str, tuple[list[str], EvidenceIndex]] = OrderedDict()
+
+    @property
+    def llm_service(self) -> LLMService:
+        """LLM client, created on first use."""
+        if self._llm_service is None:
+            self._llm_service = LLMService()
+        return self._llm_service
+
+    @property
+    def embedding_service(self) -> EmbeddingService:
+        """Embedding client, created on first use."""
+        if self._embedding_service is None:
+            self._embedding_service = EmbeddingService()
+        return self._embedding_service
+
+    @property
+    def semantic_linker(self) -> Optional[SemanticEvidenceLinker]:
+        """Semantic evidence linker, or None in exact matching mode."""
+        if self.matching_mode != "semantic":
+            return None
+        return SemanticEvidenceLinker(
+            self.embedding_service,
+            get_skills_taxonomy(),
+            settings.competency_semantic_threshold,
+        )
 
     async def generate(
         self,
@@ -57,210 +123,220 @@ class CompetencySignalGenerator:
         Returns:
             List of CompetencySignal objects with multi-source validation
         """
+        kwargs = {
+            "cv_data": cv_data,
+            "professional_recommendations": professional_recommendations,
+            "verified_certifications": verified_certifications,
+            "tapi_data": tapi_data,
+            "work_references": work_references,
+            "work_samples": work_samples,
+        }
+        semantic_links = (await self.semantic_links([kwargs]))[0]
+        computed = self.compute(talent_id, **kwargs, semantic_links=semantic_links)
+        
+        self._remember(talent_id, computed.skills, computed.index)
+        signals = to_models(computed.signals)
+        await self.save_signals(talent_id, computed.fingerprint, signals)
+        await self.save_evidence(talent_id, computed.skills, computed.index.dump())
+        
+        return signals
+
+    def compute(
+        self,
+        talent_id: str,
+        cv_data: Optional[dict] = None,
+        professional_recommendations: list[dict] = None,
+        verified_certifications: list[dict] = None,
+        tapi_data: list[dict] = None,
+        work_references: list[dict] = None,
+        work_samples: list[dict] = None,
+        semantic_links: Optional[dict[str, list[list[str]]]] = None,
+    ) -> ComputedSignals:
+        """
+        Match evidence to skills and score them (CPU only: no I/O, no state).
+        
+        Takes the same arguments as generate(), plus the semantic links found
+        for its evidence beforehand (see semantic_links()).
+        
+        Returns:
+            ComputedSignals with the scored signal records and input fingerprint
+        """
         professional_recommendations = professional_recommendations or []
         verified_certifications = verified_certifications or []
         tapi_data = tapi_data or []
         work_references = work_references or []
         work_samples = work_samples or []
         
-        signals = []
+        # Index every evidence text once against this talent's skills
+        taxonomy = get_skills_taxonomy()
+        skills = declared_skills(cv_data)
+        index = EvidenceIndex(taxonomy.scanner_for(skills), taxonomy)
+        links = semantic_links or {}
         
-        # Extract skills from CV (15% weight)
         if cv_data:
-            cv_signals = await self._generate_from_cv(cv_data)
-            signals.extend(cv_signals)
+            index.add_cv(cv_data)  # 15% weight
+        index.add_all("recommendation", professional_recommendations, links.get("recommendation"))  # 15% weight
+        index.add_all("certification", verified_certifications)  # 20% weight
+        index.add_all("tapi", tapi_data, links.get("tapi"))  # 20% weight
+        index.add_all("reference", work_references, links.get("reference"))  # 20% weight
+        index.add_all("work_sample", work_samples)  # Supplementary
         
-        # Enhance with professional recommendations (15% weight)
-        if professional_recommendations:
-            signals = await self._enhance_with_professional_recommendations(signals, professional_recommendations)
+        # One signal per declared skill, scored from its indexed evidence
+        signals = self._score(skills, index)
         
-        # Add verified certifications (20% weight)
-        if verified_certifications:
-            signals = await self._add_certification_evidence(signals, verified_certifications)
+        fingerprint = input_fingerprint({
+            "taxonomy": taxonomy.version,
+            "cv_data": cv_data,
+            "professional_recommendations": professional_recommendations,
+            "verified_certifications": verified_certifications,
+            "tapi_data": tapi_data,
+            "work_references": work_references,
+            "work_samples": work_samples,
+            "semantic_links": semantic_links,
+        })
+        return ComputedSignals(signals, fingerprint, skills, index)
+
+    async def semantic_links(self, talents: list[dict]) -> list[Optional[dict[str, list[list[str]]]]]:
+        """
+        Semantic skill links for talents' evidence, in one embedding batch.
         
-        # Add TAPI intelligence (20% weight)
-        if tapi_data:
-            signals = await self._add_tapi_evidence(signals, tapi_data)
+        Args:
+            talents: generate() keyword arguments per talent
+            
+        Returns:
+            compute() semantic_links per talent (None in exact mode, or if embedding failed)
+        """
+        linker = self.semantic_linker
+        if linker is None:
+            return [None] * len(talents)
         
-        # Add work references (20% weight)
-        if work_references:
-            signals = await self._add_work_reference_evidence(signals, work_references)
+        try:
+            return await linker.link_many([
+                (declared_skills(kwargs.get("cv_data")), kwargs) for kwargs in talents
+            ])
+        except Exception as e:
+            logger.warning(f"Semantic evidence linking failed, using exact matches only: {e}")
+            return [None] * len(talents)
+
+    async def apply_evidence_event(
+        self,
+        talent_id: str,
+        action: str,
+        source: str,
+        item: Optional[dict] = None,
+        item_id: Optional[str] = None,
+    ) -> list[CompetencySignal]:
+        """
+        Add or remove one piece of evidence and rescore only the skills it mentions.
         
-        # Add work sample evidence (supplementary)
-        if work_samples:
-            signals = await self._add_work_sample_evidence(signals, work_samples)
+        Args:
+            talent_id: Talent whose signals were generated earlier
+            action: "added" or "removed"
+            source: Evidence kind (recommendation, certification, tapi, reference, work_sample)
+            item: The evidence item, shaped as in generate()
+            item_id: Evidence id (defaults to the item's "id", else a hash of its content)
+            
+        Returns:
+            The changed signals (empty if no declared skill was affected)
+            
+        Raises:
+            KeyError: No signals have been generated for the talent
+            ValueError: Unknown action or source, or nothing to identify the evidence by
+        """
+        state = await self._evidence(talent_id)
+        if state is None:
+            raise KeyError(f"No competency evidence held for talent: {talent_id}")
+        skills, index = state
         
-        # Calculate final weighted scores (includes 10% base signal)
-        signals = self._calculate_weighted_scores(signals)
+        # CV changes can change the declared skills: those need a full generate
+        if source not in EVIDENCE_KINDS or source == "cv":
+            raise ValueError(f"Unsupported evidence source: {source}")
         
-        return signals
-
-    async def _generate_from_cv(self, cv_data: dict) -> list[CompetencySignal]:
-        """Generate initial signals from CV data (15% weight)."""
-        signals = []
+        item_id = f"{source}:{item_id}" if item_id else None
+        if action == "added":
+            if not item:
+                raise ValueError("Added evidence needs its data")
+            linked = []
+            argument = next((arg for arg, kind in LINKED_SOURCES.items() if kind == source), None)
+            if argument is not None:
+                links = (await self.semantic_links([{"cv_data": {"skills": skills}, argument: [item]}]))[0]
+                linked = (links or {}).get(source, [[]])[0]
+            changed = index.add(source, item, item_id, linked)
+        elif action == "removed":
+            if not item_id and not item:
+                raise ValueError("Removed evidence needs an evidence_id or its data")
+            changed = index.remove(item_id or evidence_id(source, item))
+        else:
+            raise ValueError(f"Unknown evidence action: {action}")
         
-        skills = cv_data.get("skills", [])
-        work_experience = cv_data.get("work_experience", [])
+        if changed:
+            await self.save_evidence(talent_id, skills, index.dump())
         
-        for skill in skills:
-            skill_name = skill if isinstance(skill, str) else skill.get("name", "")
-            
-            # Find evidence in work experience
-            evidence = []
-            for exp in work_experience:
-                responsibilities = exp.get("responsibilities", [])
-                achievements = exp.get("achievements", [])
-                
-                for item in responsibilities + achievements:
-                    if skill_name.lower() in item.lower():
-                        evidence.append(
-                            Evidence(
-                                source="CV",
-                                confidence=0.7,
-                                snippet=item[:200],
-                                weight_contribution=0.0,  # Calculated later
-                            )
-                        )
-            
-            signals.append(
-                CompetencySignal(
-                    skill=skill_name,
-                    score=0,  # Will be calculated later
-                    level="Poor",  # Will be determined by weighted score
-                    evidence=evidence,
-                    confidence=0.0,  # Calculated from all sources
-                )
-            )
+        taxonomy = get_skills_taxonomy()
+        affected = [
+            skill_name for skill_name in skills
+            if skill_name and taxonomy.key(skill_name) in changed
+        ]
+        signals = to_models(self._score(affected, index))
         
-        return signals
-
-    async def _enhance_with_professional_recommendations(
-        self,
-        signals: list[CompetencySignal],
-        recommendations: list[dict],
-    ) -> list[CompetencySignal]:
-        """Enhance signals with professional recommendations (15% weight)."""
-        for signal in signals:
-            for rec in recommendations:
-                rec_text = rec.get("text", "") or rec.get("recommendation", "")
-                
-                if signal.skill.lower() in rec_text.lower():
-                    signal.evidence.append(
-                        Evidence(
-                            source="PR",
-                            confidence=0.9,
-                            snippet=rec_text[:200],
-                            weight_contribution=0.0,  # Calculated later
-                        )
-                    )
-                    signal.verified = True
-                    signal.verified_by = rec.get("issuer", "Professional")
+        # Store the full set with the changed signals swapped in
+        if signals:
+            latest = await self.store.get(talent_id)
+            if latest is not None:
+                updated = {signal.skill: signal for signal in signals}
+                merged = [updated.get(signal.skill, signal) for signal in latest.signals]
+                fingerprint = input_fingerprint([latest.fingerprint, action, source, item_id, item])
+                await self.save_signals(talent_id, fingerprint, merged)
         
         return signals
 
-    async def _add_certification_evidence(
-        self,
-        signals: list[CompetencySignal],
-        certifications: list[dict],
-    ) -> list[CompetencySignal]:
-        """Add verified certification evidence (20% weight)."""
-        for signal in signals:
-            for cert in certifications:
-                cert_name = cert.get("name", "")
-                cert_skills = cert.get("skills", [])
-                
-                if signal.skill.lower() in cert_name.lower() or \
-                   signal.skill in cert_skills:
-                    signal.evidence.append(
-                        Evidence(
-                            source="V.Cert",
-                            confidence=1.0,  # Verified credentials
-                            snippet=f"{cert_name} - {cert.get('issuer', 'Unknown')}",
-                            weight_contribution=0.0,  # Calculated later
-                        )
-                    )
-                    signal.verified = True
-        
-        return signals
+    async def save_signals(self, talent_id: str, fingerprint: str, signals: list[CompetencySignal]) -> None:
+        """Persist a talent's signals (failures are logged, not raised)."""
+        try:
+            await self.store.save(talent_id, fingerprint, signals)
+        except Exception as e:
+            logger.warning(f"Failed to store competency signals for {talent_id}: {e}")
 
-    async def _add_tapi_evidence(
-        self,
-        signals: list[CompetencySignal],
-        tapi_data: list[dict],
-    ) -> list[CompetencySignal]:
-        """Add TAPI intelligence evidence (20% weight)."""
-        for signal in signals:
-            for tapi in tapi_data:
-                tapi_skills = tapi.get("skills_demonstrated", [])
-                performance_score = tapi.get("performance_score", 0)
-                
-                if signal.skill in tapi_skills or \
-                   signal.skill.lower() in tapi.get("summary", "").lower():
-                    signal.evidence.append(
-                        Evidence(
-                            source="TAPI",
-                            confidence=performance_score / 100.0,
-                            snippet=tapi.get("summary", "")[:200],
-                            weight_contribution=0.0,  # Calculated later
-                        )
-                    )
-        
-        return signals
+    async def save_evidence(self, talent_id: str, skills: list[str], items: list) -> None:
+        """Persist a talent's evidence index rows (failures are logged, not raised)."""
+        try:
+            await self.store.save_evidence(talent_id, skills, items)
+        except Exception as e:
+            logger.warning(f"Failed to store competency evidence for {talent_id}: {e}")
 
-    async def _add_work_reference_evidence(
-        self,
-        signals: list[CompetencySignal],
-        references: list[dict],
-    ) -> list[CompetencySignal]:
-        """Add work experience reference evidence (20% weight)."""
-        for signal in signals:
-            for ref in references:
-                ref_text = ref.get("feedback", "") or ref.get("text", "")
-                
-                if signal.skill.lower() in ref_text.lower():
-                    signal.evidence.append(
-                        Evidence(
-                            source="Ref",
-                            confidence=0.85,
-                            snippet=ref_text[:200],
-                            weight_contribution=0.0,  # Calculated later
-                        )
-                    )
-                    signal.verified = True
-        
-        return signals
+    def forget(self, talent_id: str) -> None:
+        """Drop a talent's in-memory evidence (the stored copy is read on next use)."""
+        self._talents.pop(talent_id, None)
 
-    async def _add_work_sample_evidence(
-        self,
-        signals: list[CompetencySignal],
-        work_samples: list[dict],
-    ) -> list[CompetencySignal]:
-        """Add work sample evidence (supplementary - enhances CV score)."""
-        for signal in signals:
-            for sample in work_samples:
-                sample_text = sample.get("description", "")
-                technologies = sample.get("technologies", [])
-                
-                if signal.skill.lower() in sample_text.lower() or \
-                   signal.skill in technologies:
-                    # Work samples enhance CV validation
-                    signal.evidence.append(
-                        Evidence(
-                            source="CV",  # Enhances CV evidence
-                            confidence=0.85,
-                            snippet=sample_text[:200],
-                            weight_contribution=0.0,  # Calculated later
-                        )
-                    )
+    async def _evidence(self, talent_id: str) -> Optional[tuple[list[str], EvidenceIndex]]:
+        """A talent's declared skills and evidence index, from memory or the store."""
+        state = self._talents.get(talent_id)
+        if state is not None:
+            self._talents.move_to_end(talent_id)
+            return state
         
-        return signals
+        stored = await self.store.get_evidence(talent_id)
+        if stored is None:
+            return None
+        taxonomy = get_skills_taxonomy()
+        index = EvidenceIndex.restore(taxonomy.scanner_for(stored.skills), taxonomy, stored.items)
+        self._remember(talent_id, stored.skills, index)
+        return stored.skills, index
 
-    def _calculate_weighted_scores(
-        self,
-        signals: list[CompetencySignal],
-    ) -> list[CompetencySignal]:
+    def _remember(self, talent_id: str, skills: list[str], index: EvidenceIndex) -> None:
+        """Keep a talent's evidence for later events (least recently used evicted)."""
+        self._talents[talent_id] = (skills, index)
+        self._talents.move_to_end(talent_id)
+        while len(self._talents) > self.max_talents:
+            self._talents.popitem(last=False)
+
+    @staticmethod
+    def _score(skills: list[str], index: EvidenceIndex) -> list[SignalRecord]:
         """
-        Calculate final scores using weighted multi-source validation.
+        Score declared skills from their indexed evidence.
+        
+        Scores for all skills are computed in one vectorized pass (see
+        scoring.score_signals) and returned as lightweight records.
         
         Weighting:
         - CV: 15%
@@ -270,102 +346,36 @@ class CompetencySignalGenerator:
         - Ref: 20%
         - Base Signal: 10%
         """
-        for signal in signals:
-            # Initialize breakdown
-            breakdown = SourceBreakdown()
-            
-            # Count evidence by source
-            cv_evidence = [e for e in signal.evidence if e.source == "CV"]
-            pr_evidence = [e for e in signal.evidence if e.source == "PR"]
-            cert_evidence = [e for e in signal.evidence if e.source == "V.Cert"]
-            tapi_evidence = [e for e in signal.evidence if e.source == "TAPI"]
-            ref_evidence = [e for e in signal.evidence if e.source == "Ref"]
-            
-            # Calculate source scores (max weight × evidence strength)
-            # CV: 15% max
-            if cv_evidence:
-                cv_confidence = sum(e.confidence for e in cv_evidence) / len(cv_evidence)
-                cv_strength = min(1.0, len(cv_evidence) / 3)  # 3+ pieces = full strength
-                breakdown.cv_analysis = 15.0 * cv_confidence * cv_strength
-            
-            # PR: 15% max
-            if pr_evidence:
-                pr_confidence = sum(e.confidence for e in pr_evidence) / len(pr_evidence)
-                pr_strength = min(1.0, len(pr_evidence) / 2)  # 2+ recommendations = full strength
-                breakdown.professional_recommendations = 15.0 * pr_confidence * pr_strength
-            
-            # V.Cert: 20% max
-            if cert_evidence:
-                cert_confidence = sum(e.confidence for e in cert_evidence) / len(cert_evidence)
-                cert_strength = min(1.0, len(cert_evidence) / 2)  # 2+ certs = full strength
-                breakdown.verified_certifications = 20.0 * cert_confidence * cert_strength
-            
-            # TAPI: 20% max
-            if tapi_evidence:
-                tapi_confidence = sum(e.confidence for e in tapi_evidence) / len(tapi_evidence)
-                tapi_strength = min(1.0, len(tapi_evidence) / 3)  # 3+ activities = full strength
-                breakdown.tapi_intelligence = 20.0 * tapi_confidence * tapi_strength
-            
-            # Ref: 20% max
-            if ref_evidence:
-                ref_confidence = sum(e.confidence for e in ref_evidence) / len(ref_evidence)
-                ref_strength = min(1.0, len(ref_evidence) / 2)  # 2+ references = full strength
-                breakdown.work_references = 20.0 * ref_confidence * ref_strength
-            
-            # Base signal: 10% (applied to all verified profiles)
-            breakdown.base_signal = 10.0
-            
-            # Calculate final score
-            final_score = (
-                breakdown.cv_analysis +
-                breakdown.professional_recommendations +
-                breakdown.verified_certifications +
-                breakdown.tapi_intelligence +
-                breakdown.work_references +
-                breakdown.base_signal
+        keys = [index.taxonomy.key(skill_name) if skill_name else None for skill_name in skills]
+        evidence = [index.indexed(key) if key else [] for key in keys]
+        scored = score_signals(evidence)
+        
+        breakdown = scored.breakdown.tolist()
+        scores = scored.scores.tolist()
+        confidences = scored.confidences.tolist()
+        
+        records = []
+        for row, (skill_name, items) in enumerate(zip(skills, evidence)):
+            verified, verified_by = verification(items)
+            records.append(
+                SignalRecord(
+                    skill=skill_name,
+                    score=scores[row],
+                    level=scored.levels[row],
+                    evidence=items,
+                    contributions=breakdown[row],
+                    confidence=confidences[row],
+                    verified=verified,
+                    verified_by=verified_by,
+                )
             )
-            
-            signal.score = int(min(100, final_score))
-            signal.source_breakdown = breakdown
-            
-            # Calculate overall confidence
-            all_evidence = signal.evidence
-            if all_evidence:
-                signal.confidence = sum(e.confidence for e in all_evidence) / len(all_evidence)
-            else:
-                signal.confidence = 0.0
-            
-            # Determine level based on score
-            if signal.score >= 76:
-                signal.level = "Excellent"
-            elif signal.score >= 61:
-                signal.level = "Very Good"
-            elif signal.score >= 51:
-                signal.level = "Good"
-            elif signal.score >= 31:
-                signal.level = "Low"
-            else:
-                signal.level = "Poor"
-            
-            # Update evidence weight contributions
-            for evidence in signal.evidence:
-                if evidence.source == "CV":
-                    evidence.weight_contribution = breakdown.cv_analysis
-                elif evidence.source == "PR":
-                    evidence.weight_contribution = breakdown.professional_recommendations
-                elif evidence.source == "V.Cert":
-                    evidence.weight_contribution = breakdown.verified_certifications
-                elif evidence.source == "TAPI":
-                    evidence.weight_contribution = breakdown.tapi_intelligence
-                elif evidence.source == "Ref":
-                    evidence.weight_contribution = breakdown.work_references
         
-        return signals
+        return records
 
     async def get_stored_signals(self, talent_id: str) -> list[CompetencySignal]:
-        """Retrieve stored competency signals for a talent."""
-        # TODO: Implement database retrieval
-        return []
+        """Retrieve the latest stored competency signals for a talent."""
+        stored = await self.store.get(talent_id)
+        return stored.signals if stored is not None else []
 
     async def refresh_signals(self, talent_id: str) -> dict:
         """Trigger refresh of competency signals."""
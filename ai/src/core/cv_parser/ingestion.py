@@ -0,0 +1,409 @@
+"""
+Bulk CV Ingestion
+
+Ingests a manifest of CV files through a staged pipeline:
+
+    download -> extract -> parse (LLM) -> embed -> store
+
+Stages are connected by bounded queues, so a slow stage (usually the LLM)
+applies backpressure upstream instead of letting downloads pile up, and
+each stage has its own concurrency limit. Job progress is checkpointed to
+disk; an interrupted or partly failed job can be resumed, and only items
+not yet stored are processed again.
+"""
+import asyncio
+import json
+import logging
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from src.config import settings
+from src.core.cv_parser.parser import CVParserService
+from src.models.backend_integration import FileMetadata
+from src.models.cv import IngestionItemError, IngestionJobStatus, ParsedCV
+from src.services.embedding_service import EmbeddingService
+from src.services.file_downloader import DownloadedFile, file_downloader
+from src.services.text_extraction import text_extraction_service
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("download", "extract", "parse", "embed", "store")
+
+
+class IngestionItem:
+    """One CV moving through the pipeline."""
+
+    __slots__ = ("index", "file", "download", "text", "parsed", "embedding")
+
+    def __init__(self, index: int, file: FileMetadata):
+        self.index = index
+        self.file = file
+        self.download: Optional[DownloadedFile] = None
+        self.text: Optional[str] = None
+        self.parsed: Optional[ParsedCV] = None
+        self.embedding: Optional[list[float]] = None
+
+
+class CVIngestionPipeline:
+    """Runs bulk CV ingestion jobs in the background."""
+
+    def __init__(
+        self,
+        cv_parser: Optional[CVParserService] = None,
+        embedding_service: Optional[EmbeddingService] = None,
+        checkpoint_dir: Optional[str] = None,
+    ):
+        self.cv_parser = cv_parser or CVParserService()
+        self._embedding_service = embedding_service
+        self.checkpoint_dir = Path(checkpoint_dir or settings.ingestion_checkpoint_dir)
+        self.concurrency = {
+            "download": settings.ingestion_download_concurrency,
+            "extract": settings.ingestion_extract_concurrency,
+            "parse": settings.ingestion_parse_concurrency,
+            "embed": settings.ingestion_embed_concurrency,
+            "store": settings.ingestion_store_concurrency,
+        }
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    @property
+    def embedding_service(self) -> EmbeddingService:
+        """Embedding service, created on first use (connects to MongoDB)."""
+        if self._embedding_service is None:
+            self._embedding_service = EmbeddingService()
+        return self._embedding_service
+
+    # Jobs
+
+    async def submit(self, files: list[FileMetadata], source: Optional[str] = None) -> str:
+        """
+        Start ingesting a manifest of CV files.
+
+        Args:
+            files: CV files to ingest
+            source: Where the archive comes from (stored as metadata)
+
+        Returns:
+            Job ID
+        """
+        now = datetime.utcnow().isoformat()
+        job = {
+            "job_id": str(uuid.uuid4()),
+            "status": "queued",
+            "source": source,
+            "manifest": [f.model_dump() for f in files],
+            "done": set(),
+            "errors": {},
+            "stages": {stage: 0 for stage in STAGES},
+            "created_at": now,
+            "updated_at": now,
+        }
+        self._jobs[job["job_id"]] = job
+        await self._checkpoint(job)
+
+        self._start(job)
+        logger.info(f"Ingestion job {job['job_id']} queued with {len(files)} files")
+        return job["job_id"]
+
+    async def resume(self, job_id: str) -> str:
+        """
+        Resume a job from its checkpoint; failed items are retried.
+
+        Raises:
+            KeyError: If the job is unknown
+            ValueError: If the job is still running
+        """
+        if job_id in self._tasks and not self._tasks[job_id].done():
+            raise ValueError(f"Ingestion job {job_id} is still running")
+
+        job = self._jobs.get(job_id) or await self._load_checkpoint(job_id)
+        job["errors"] = {}
+        self._jobs[job_id] = job
+
+        self._start(job)
+        logger.info(f"Ingestion job {job_id} resumed, {len(job['done'])} already stored")
+        return job_id
+
+    async def cancel(self, job_id: str) -> IngestionJobStatus:
+        """
+        Stop a running job; it can be resumed later.
+
+        Raises:
+            KeyError: If the job is unknown
+        """
+        if job_id not in self._jobs:
+            raise KeyError(job_id)
+
+        task = self._tasks.get(job_id)
+        if task and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        return self.status(job_id)
+
+    def status(self, job_id: str) -> IngestionJobStatus:
+        """
+        Get job progress.
+
+        Raises:
+            KeyError: If the job is unknown
+        """
+        job = self._jobs[job_id]
+        return IngestionJobStatus(
+            job_id=job_id,
+            status=job["status"],
+            total=len(job["manifest"]),
+            completed=len(job["done"]),
+            failed=len(job["errors"]),
+            stages=dict(job["stages"]),
+            errors=[IngestionItemError(**e) for e in job["errors"].values()],
+            created_at=job["created_at"],
+            updated_at=job["updated_at"],
+        )
+
+    async def get_status(self, job_id: str) -> IngestionJobStatus:
+        """Get job progress, loading it from its checkpoint if needed."""
+        if job_id not in self._jobs:
+            self._jobs[job_id] = await self._load_checkpoint(job_id)
+        return self.status(job_id)
+
+    def _start(self, job: dict[str, Any]) -> None:
+        """Run a job in the background."""
+        task = asyncio.create_task(self._run(job))
+        self._tasks[job["job_id"]] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job["job_id"], None))
+
+    # Pipeline
+
+    async def _run(self, job: dict[str, Any]) -> None:
+        """Run every pending item of a job through the stages."""
+        job["status"] = "running"
+        handlers: dict[str, Callable[[IngestionItem], Awaitable[None]]] = {
+            "download": self._download,
+            "extract": self._extract,
+            "parse": self._parse,
+            "embed": self._embed,
+            "store": self._store,
+        }
+        queues = [asyncio.Queue(maxsize=settings.ingestion_queue_size) for _ in STAGES]
+        workers: list[list[asyncio.Task]] = []
+
+        for position, stage in enumerate(STAGES):
+            outbox = queues[position + 1] if position + 1 < len(STAGES) else None
+            workers.append([
+                asyncio.create_task(self._worker(job, stage, handlers[stage], queues[position], outbox))
+                for _ in range(self.concurrency[stage])
+            ])
+
+        try:
+            for index, entry in enumerate(job["manifest"]):
+                if index not in job["done"]:
+                    await queues[0].put(IngestionItem(index, FileMetadata(**entry)))
+
+            # Drain stage by stage: once a queue is joined, every item has
+            # been handed to the next stage (or failed)
+            for queue, stage_workers in zip(queues, workers):
+                await queue.join()
+                for worker in stage_workers:
+                    worker.cancel()
+
+            job["status"] = "completed_with_errors" if job["errors"] else "completed"
+
+        except asyncio.CancelledError:
+            job["status"] = "cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"Ingestion job {job['job_id']} failed: {e}", exc_info=True)
+            job["status"] = "failed"
+        finally:
+            for stage_workers in workers:
+                for worker in stage_workers:
+                    worker.cancel()
+            await asyncio.gather(*(w for ws in workers for w in ws), return_exceptions=True)
+
+            # Release spooled downloads of items still in flight
+            for queue in queues:
+                while not queue.empty():
+                    self._release(queue.get_nowait())
+
+            job["updated_at"] = datetime.utcnow().isoformat()
+            await self._checkpoint(job)
+            logger.info(
+                f"Ingestion job {job['job_id']} {job['status']}: "
+                f"{len(job['done'])}/{len(job['manifest'])} stored, {len(job['errors'])} failed"
+            )
+
+    async def _worker(
+        self,
+        job: dict[str, Any],
+        stage: str,
+        handler: Callable[[IngestionItem], Awaitable[None]],
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+    ) -> None:
+        """Process items from one stage's queue, forever."""
+        while True:
+            item = await inbox.get()
+            try:
+                await handler(item)
+                job["stages"][stage] += 1
+
+                if outbox is not None:
+                    # Blocks while the next stage is backed up
+                    await outbox.put(item)
+                else:
+                    job["done"].add(item.index)
+                    await self._progress(job)
+
+            except asyncio.CancelledError:
+                self._release(item)
+                raise
+            except Exception as e:
+                logger.warning(f"Ingestion of {item.file.original_name} failed at {stage}: {e}")
+                self._release(item)
+                job["errors"][item.index] = {
+                    "index": item.index,
+                    "original_name": item.file.original_name,
+                    "stage": stage,
+                    "error": str(e) or type(e).__name__,
+                }
+                await self._progress(job)
+            finally:
+                inbox.task_done()
+
+    @staticmethod
+    def _release(item: IngestionItem) -> None:
+        """Close an item's download (deleting any spool file)."""
+        if item.download is not None:
+            item.download.close()
+            item.download = None
+
+    async def _progress(self, job: dict[str, Any]) -> None:
+        """Record progress, checkpointing every few items."""
+        job["updated_at"] = datetime.utcnow().isoformat()
+        finished = len(job["done"]) + len(job["errors"])
+        if finished % settings.ingestion_checkpoint_every == 0:
+            await self._checkpoint(job)
+
+    # Stages
+
+    async def _download(self, item: IngestionItem) -> None:
+        """Fetch the CV file."""
+        item.download = await file_downloader.fetch_with_retry(
+            item.file.url, item.file.original_name
+        )
+
+    async def _extract(self, item: IngestionItem) -> None:
+        """Extract text (the download is released afterwards)."""
+        try:
+            item.text = await text_extraction_service.extract(
+                item.download.buffer,
+                item.file.mime_type,
+                item.file.original_name,
+                path=item.download.path,
+            )
+        finally:
+            self._release(item)
+
+        if not item.text.strip():
+            raise ValueError("No text could be extracted")
+
+    async def _parse(self, item: IngestionItem) -> None:
+        """Parse the CV with the LLM."""
+        item.parsed = await self.cv_parser.parse_text(item.text)
+        if item.parsed.confidence_score == 0.0:
+            # LLM fallback; fail the item so a resume retries it
+            raise ValueError("LLM could not parse the CV")
+
+    async def _embed(self, item: IngestionItem) -> None:
+        """Embed the parsed profile."""
+        vectors = await self.embedding_service.embed_texts([profile_text(item.parsed)])
+        if not vectors.any():
+            raise ValueError("Embedding failed")
+        item.embedding = vectors[0].tolist()
+
+    async def _store(self, item: IngestionItem) -> None:
+        """Store the embedding with the parsed CV as metadata."""
+        stored = await self.embedding_service.store_embedding(
+            doc_id=f"cv:{item.file.public_id}",
+            embedding=item.embedding,
+            metadata={
+                "type": "cv",
+                "public_id": item.file.public_id,
+                "original_name": item.file.original_name,
+                "parsed_cv": item.parsed.model_dump(mode="json", exclude={"raw_text"}),
+            },
+            text=profile_text(item.parsed),
+        )
+        if not stored:
+            raise ValueError("Failed to store embedding")
+
+    # Checkpoints
+
+    def _checkpoint_path(self, job_id: str) -> Path:
+        """Checkpoint file of a job."""
+        return self.checkpoint_dir / f"{job_id}.json"
+
+    async def _checkpoint(self, job: dict[str, Any]) -> None:
+        """Write job state to disk (atomically)."""
+        state = {
+            **job,
+            "done": sorted(job["done"]),
+            "errors": list(job["errors"].values()),
+        }
+
+        def write() -> None:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            path = self._checkpoint_path(job["job_id"])
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(state))
+            os.replace(tmp, path)
+
+        try:
+            await asyncio.to_thread(write)
+        except Exception as e:
+            logger.error(f"Failed to checkpoint ingestion job {job['job_id']}: {e}")
+
+    async def _load_checkpoint(self, job_id: str) -> dict[str, Any]:
+        """
+        Read job state from disk.
+
+        Raises:
+            KeyError: If there is no checkpoint for the job
+        """
+        path = self._checkpoint_path(job_id)
+        try:
+            state = json.loads(await asyncio.to_thread(path.read_text))
+        except FileNotFoundError:
+            raise KeyError(job_id)
+
+        state["done"] = set(state["done"])
+        state["errors"] = {e["index"]: e for e in state["errors"]}
+        if state["status"] in ("queued", "running"):
+            # The process stopped mid-job
+            state["status"] = "interrupted"
+        return state
+
+    async def shutdown(self) -> None:
+        """Stop running jobs (they are checkpointed and can be resumed)."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def profile_text(parsed: ParsedCV) -> str:
+    """Text embedded for a parsed CV: summary, roles and skills."""
+    roles = [f"{w.role} at {w.company}" for w in parsed.work_experience]
+    parts = [
+        parsed.summary or "",
+        "; ".join(roles),
+        ", ".join(parsed.skills),
+    ]
+    return "\n".join(part for part in parts if part)
+
+
+# Singleton instance
+cv_ingestion_pipeline = CVIngestionPipeline()
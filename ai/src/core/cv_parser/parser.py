@@ -3,8 +3,10 @@ CV Parser Service
 
 Main service for parsing CVs and extracting structured data.
 """
-from typing import Optional
+import asyncio
+from typing import Any, Optional
 
+from src.config import settings
 from src.models.cv import ParsedCV, PersonalInfo
 from src.core.cv_parser.extractors import (
     extract_personal_info,
@@ -13,9 +15,25 @@ from src.core.cv_parser.extractors import (
     extract_skills,
 )
 from src.core.cv_parser.normalizers import normalize_dates, normalize_skills
+from src.core.cv_parser.rule_extractor import extract_rule_based, merge_extracted
+from src.core.cv_parser.segmenter import segment_cv
 from src.services.llm_service import LLMService
 from src.utils.document_loader import load_document
 
+# CV sections extracted in their own LLM call, and the fields they yield
+SECTION_FIELDS = {
+    "experience": ["work_experience"],
+    "education": ["education"],
+    "skills": ["skills"],
+    "projects": ["projects"],
+}
+
+# Fields extracted from the rest of the CV (header, summary, ...)
+PROFILE_FIELDS = ["personal_info", "summary", "certifications", "languages"]
+
+# Minimum number of SECTION_FIELDS sections found to parse per section
+MIN_SECTIONS = 2
+
 
 class CVParserService:
     """Service for parsing CV documents."""
@@ -46,6 +64,59 @@ class CVParserService:
         # Step 2: Parse using LLM
         return await self.parse_text(raw_text)
 
+    async def _extract_by_section(
+        self,
+        sections: dict[str, str],
+        rules: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Extract a segmented CV with one concurrent LLM call per section.
+
+        Latency tracks the largest section instead of the whole CV. Fields
+        of sections that were not found are asked for in the profile call.
+
+        Args:
+            sections: Output of segment_cv
+            rules: Rule-based extraction (left out of the prompts)
+
+        Returns:
+            Extraction shaped like extract_cv_data output
+        """
+        calls = []
+        profile_fields = list(PROFILE_FIELDS)
+        for section, fields in SECTION_FIELDS.items():
+            if section in sections:
+                calls.append((fields, sections[section]))
+            else:
+                profile_fields += fields
+
+        profile_text = "\n\n".join(
+            body for section, body in sections.items() if section not in SECTION_FIELDS
+        )
+        calls.append((profile_fields, profile_text))
+
+        results = await asyncio.gather(*(
+            self.llm_service.extract_cv_section(fields, body, known=rules)
+            for fields, body in calls
+        ))
+
+        extracted: dict[str, Any] = {}
+        errors = []
+        for (fields, _), result in zip(calls, results):
+            for field in fields:
+                if field in result:
+                    extracted[field] = result[field]
+            if result.get("error"):
+                errors.append(result["error"])
+
+        extracted["confidence"] = min(result.get("confidence", 0.8) for result in results)
+        if errors:
+            extracted["error"] = "; ".join(errors)
+        if all(result.get("fallback") for result in results):
+            extracted["fallback"] = True
+
+        return extracted
+
     async def parse_text(self, text: str) -> ParsedCV:
         """
         Parse CV from raw text.
@@ -56,8 +127,16 @@ class CVParserService:
         Returns:
             ParsedCV with extracted information
         """
-        # Use LLM to extract structured data
-        extracted = await self.llm_service.extract_cv_data(text)
+        # Deterministic fields first; the LLM only extracts the rest
+        rules = extract_rule_based(text)
+
+        sections = segment_cv(text) if len(text) >= settings.cv_section_parsing_min_chars else {}
+        if sum(section in sections for section in SECTION_FIELDS) >= MIN_SECTIONS:
+            extracted = await self._extract_by_section(sections, rules)
+        else:
+            extracted = await self.llm_service.extract_cv_data(text, known=rules)
+
+        extracted = merge_extracted(extracted, rules)
         
         # Extract individual components
         personal_info = extract_personal_info(extracted.get("personal_info", {}))
@@ -0,0 +1,124 @@
+"""
+Rule-Based CV Extraction
+
+Deterministic pre-extraction of the CV fields that patterns find reliably:
+contact details, profile links and taxonomy skills. The LLM is then asked
+only for what is left, and the results are merged back into its output.
+"""
+import re
+from typing import Any, Optional
+
+from src.utils.skills_taxonomy import get_skills_taxonomy
+from src.utils.text_cleaner import (
+    EMAIL_PATTERN,
+    GITHUB_PATTERN,
+    LINKEDIN_PATTERN,
+    PHONE_PATTERN,
+)
+
+# Fields the rules fill confidently; the LLM is not asked for them
+RULE_PERSONAL_FIELDS = ("email", "phone", "linkedin", "github")
+
+YEAR_RANGE_PATTERN = re.compile(r"^(19|20)\d{2}\s*[-.]?\s*(19|20)\d{2}$")
+NAME_LINE_PATTERN = re.compile(r"^[A-Z][A-Za-z'\-]+(?:\s+[A-Z][A-Za-z'\-.]+){1,3}$")
+
+# Lines scanned for a name (it heads the CV)
+NAME_SCAN_LINES = 5
+
+
+def _find_phone(text: str) -> Optional[str]:
+    """First match that looks like a phone number rather than a date range."""
+    for match in PHONE_PATTERN.finditer(text):
+        candidate = match.group(0).strip()
+        digits = sum(c.isdigit() for c in candidate)
+        if 10 <= digits <= 15 and not YEAR_RANGE_PATTERN.match(candidate):
+            return candidate
+    return None
+
+
+def _guess_name(text: str) -> Optional[str]:
+    """Name from the first lines, if one looks like 'Firstname Lastname'."""
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    for line in lines[:NAME_SCAN_LINES]:
+        if NAME_LINE_PATTERN.match(line):
+            return line
+    return None
+
+
+def extract_rule_based(text: str) -> dict[str, Any]:
+    """
+    Extract CV fields with patterns and the skills taxonomy.
+
+    Args:
+        text: Raw CV text
+
+    Returns:
+        Dict shaped like the LLM output, with only the fields found
+        (``personal_info`` may also carry a guessed ``name``)
+    """
+    personal_info = {}
+
+    email = EMAIL_PATTERN.search(text)
+    if email:
+        personal_info["email"] = email.group(0).rstrip(".")
+
+    phone = _find_phone(text)
+    if phone:
+        personal_info["phone"] = phone
+
+    linkedin = LINKEDIN_PATTERN.search(text)
+    if linkedin:
+        personal_info["linkedin"] = f"https://{linkedin.group(0)}"
+
+    github = GITHUB_PATTERN.search(text)
+    if github:
+        personal_info["github"] = f"https://{github.group(0)}"
+
+    name = _guess_name(text)
+    if name:
+        personal_info["name"] = name
+
+    taxonomy = get_skills_taxonomy()
+    skills = [taxonomy.get(skill_id).name for skill_id in taxonomy.find_skills(text)]
+
+    return {"personal_info": personal_info, "skills": skills}
+
+
+def merge_extracted(extracted: dict[str, Any], rules: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge rule-based results into LLM output.
+
+    Rule-extracted contact fields win; the guessed name is only used when
+    the LLM gave none (or failed). Skills are unioned by canonical id.
+
+    Args:
+        extracted: LLM output
+        rules: Output of extract_rule_based
+
+    Returns:
+        Merged extraction
+    """
+    merged = dict(extracted)
+    llm_personal = extracted.get("personal_info") or {}
+    rule_personal = rules.get("personal_info", {})
+
+    personal_info = dict(llm_personal)
+    for field in RULE_PERSONAL_FIELDS:
+        if rule_personal.get(field):
+            personal_info[field] = rule_personal[field]
+
+    if rule_personal.get("name") and (extracted.get("fallback") or not llm_personal.get("name")):
+        personal_info["name"] = rule_personal["name"]
+    merged["personal_info"] = personal_info
+
+    taxonomy = get_skills_taxonomy()
+    skills = list(extracted.get("skills") or [])
+    seen = {taxonomy.resolve(s) or s.lower() for s in skills if isinstance(s, str)}
+    for skill in rules.get("skills", []):
+        key = taxonomy.resolve(skill) or skill.lower()
+        if key not in seen:
+            seen.add(key)
+            skills.append(skill)
+    merged["skills"] = skills
+
+    return merged
@@ -0,0 +1,83 @@
+"""
+CV Section Segmenter
+
+Splits CV text into sections (experience, education, skills, projects, ...)
+by recognising heading lines, so each section can be extracted separately.
+"""
+import re
+
+# Normalised heading text -> section
+SECTION_HEADINGS = {
+    "summary": [
+        "summary", "professional summary", "profile", "professional profile", "about me",
+        "objective", "career objective", "personal statement",
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience", "relevant experience",
+        "employment", "employment history", "work history", "career history",
+    ],
+    "education": [
+        "education", "academic background", "academic qualifications", "qualifications",
+        "education and training",
+    ],
+    "skills": [
+        "skills", "technical skills", "key skills", "core skills", "core competencies",
+        "competencies", "skills and competencies", "tools and technologies", "technologies",
+    ],
+    "projects": [
+        "projects", "personal projects", "key projects", "selected projects", "portfolio",
+    ],
+    "certifications": [
+        "certifications", "certificates", "licenses and certifications", "courses", "training",
+    ],
+    "languages": ["languages"],
+}
+
+HEADINGS = {heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings}
+
+# Text before the first heading (name, contact details)
+HEADER = "header"
+
+MAX_HEADING_LENGTH = 40
+NON_LETTERS_PATTERN = re.compile(r"[^a-z ]+")
+SPACES_PATTERN = re.compile(r"\s+")
+
+
+def heading_section(line: str) -> str | None:
+    """Section a line is the heading of, if it is one."""
+    line = line.strip()
+    if not line or len(line) > MAX_HEADING_LENGTH:
+        return None
+
+    normalised = NON_LETTERS_PATTERN.sub(" ", line.lower().replace("&", " and "))
+    return HEADINGS.get(SPACES_PATTERN.sub(" ", normalised).strip())
+
+
+def segment_cv(text: str) -> dict[str, str]:
+    """
+    Split CV text into sections.
+
+    Args:
+        text: Raw CV text
+
+    Returns:
+        Section name -> text (without the heading). Text before the first
+        heading is under "header"; repeated sections are concatenated.
+    """
+    sections: dict[str, list[str]] = {}
+    current = HEADER
+
+    for line in text.splitlines():
+        section = heading_section(line)
+        if section:
+            current = section
+            sections.setdefault(current, [])
+            continue
+        sections.setdefault(current, []).append(line)
+
+    segmented = {}
+    for name, lines in sections.items():
+        body = "\n".join(lines).strip()
+        if body:
+            segmented[name] = body
+    return segmented
@@ -0,0 +1,198 @@
+"""
+Fit Score Component Store
+
+Keeps per-candidate component scores for each job so that rankings can be
+recomputed for new weights without re-scoring every candidate.
+
+- SQLite file (``fit_score_store_path``) as the durable backend: one row per
+  scored (job, candidate) pair, so stored scores survive restarts. Batches
+  write all their rows in one transaction.
+- In-memory read-through LRU of per-job component matrices, capped at
+  ``fit_score_max_cached_jobs``; an evicted job is reloaded on next use.
+"""
+import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.config import settings
+
+# Order of the columns in every component matrix
+COMPONENTS = ("skills", "experience", "education", "culture")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fit_components (
+    job_id TEXT NOT NULL,
+    talent_id TEXT NOT NULL,
+    skills REAL NOT NULL,
+    experience REAL NOT NULL,
+    education REAL NOT NULL,
+    culture REAL NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (job_id, talent_id)
+)
+"""
+
+
+class JobComponentStore:
+    """Component score matrix (candidates x components) for a single job."""
+
+    def __init__(self):
+        self.talent_ids: list[str] = []
+        self._index: dict[str, int] = {}
+        self._rows = np.zeros((0, len(COMPONENTS)), dtype=np.float64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def components(self) -> np.ndarray:
+        """View of the stored component scores, one row per candidate."""
+        return self._rows[: self._size]
+
+    def upsert(self, talent_id: str, components: Sequence[float]) -> None:
+        """Insert or replace the component scores of a candidate."""
+        row = self._index.get(talent_id)
+
+        if row is None:
+            if self._size == len(self._rows):
+                self._grow()
+            row = self._size
+            self._index[talent_id] = row
+            self.talent_ids.append(talent_id)
+            self._size += 1
+
+        self._rows[row] = components
+
+    def get(self, talent_id: str) -> Optional[np.ndarray]:
+        """Get the component scores of a candidate."""
+        row = self._index.get(talent_id)
+        return None if row is None else self._rows[row]
+
+    def weighted_totals(self, weight_vector: np.ndarray) -> np.ndarray:
+        """Weighted fit score of every stored candidate."""
+        return self.components @ weight_vector
+
+    def _grow(self) -> None:
+        """Double the row capacity (amortised O(1) inserts)."""
+        capacity = max(64, len(self._rows) * 2)
+        grown = np.zeros((capacity, len(COMPONENTS)), dtype=np.float64)
+        grown[: self._size] = self._rows[: self._size]
+        self._rows = grown
+
+
+class ComponentStoreRegistry:
+    """Durable per-job component scores with an LRU of loaded jobs in front."""
+
+    def __init__(self, path: Optional[str] = None, max_jobs: Optional[int] = None):
+        self.path = Path(path or settings.fit_score_store_path)
+        self.max_jobs = max_jobs or settings.fit_score_max_cached_jobs
+        self._stores: OrderedDict[str, JobComponentStore] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (called from worker threads)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _remember(self, job_id: str, store: JobComponentStore) -> None:
+        """Cache a job's loaded matrix."""
+        self._stores[job_id] = store
+        self._stores.move_to_end(job_id)
+        while len(self._stores) > self.max_jobs:
+            self._stores.popitem(last=False)
+
+    async def get(self, job_id: str) -> Optional[JobComponentStore]:
+        """Get the store for a job, if it has been scored."""
+        store = self._stores.get(job_id)
+        if store is not None:
+            self._stores.move_to_end(job_id)
+            return store
+
+        store = await asyncio.to_thread(self._load, job_id)
+        if store is not None:
+            self._remember(job_id, store)
+        return store
+
+    async def upsert(self, job_id: str, talent_id: str, components: Sequence[float]) -> None:
+        """
+        Store the component scores of a candidate for a job.
+
+        Args:
+            job_id: Job identifier
+            talent_id: Candidate identifier
+            components: Scores in COMPONENTS order
+        """
+        await self.upsert_many(job_id, [(talent_id, components)])
+
+    async def upsert_many(self, job_id: str, rows: list[tuple[str, Sequence[float]]]) -> None:
+        """
+        Store the component scores of many candidates for a job, in one transaction.
+
+        Args:
+            job_id: Job identifier
+            rows: (candidate identifier, scores in COMPONENTS order) pairs
+        """
+        if not rows:
+            return
+        rows = [(talent_id, tuple(float(value) for value in components)) for talent_id, components in rows]
+        await asyncio.to_thread(self._write, job_id, rows)
+
+        # Loaded jobs are updated in place; others are read back on next use
+        store = self._stores.get(job_id)
+        if store is not None:
+            for talent_id, components in rows:
+                store.upsert(talent_id, components)
+
+    def clear_cache(self) -> None:
+        """Drop the in-memory tier (stored scores are kept)."""
+        self._stores.clear()
+
+    def _load(self, job_id: str) -> Optional[JobComponentStore]:
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT talent_id, {', '.join(COMPONENTS)} FROM fit_components "
+                "WHERE job_id = ? ORDER BY rowid",
+                (job_id,),
+            ).fetchall()
+
+        if not rows:
+            return None
+        store = JobComponentStore()
+        for talent_id, *components in rows:
+            store.upsert(talent_id, components)
+        return store
+
+    def _write(self, job_id: str, rows: list[tuple[str, tuple[float, ...]]]) -> None:
+        updated_at = datetime.utcnow().isoformat()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    f"INSERT INTO fit_components (job_id, talent_id, {', '.join(COMPONENTS)}, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (job_id, talent_id) DO UPDATE SET "
+                    + ", ".join(f"{name} = excluded.{name}" for name in COMPONENTS)
+                    + ", updated_at = excluded.updated_at",
+                    [(job_id, talent_id, *components, updated_at) for talent_id, components in rows],
+                )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -3,9 +3,17 @@ Fit Scoring Engine
 
 Calculates candidate-job fit scores with explainability.
 """
-from typing import Optional
+import asyncio
+import logging
+from typing import AsyncIterator, Optional, Union
 
+import numpy as np
+
+from src.config import settings
+from src.core.fit_scoring.component_store import COMPONENTS, ComponentStoreRegistry
+from src.core.fit_scoring.semantic_matcher import SemanticSkillMatcher
 from src.models.fit_score import (
+    CandidateScoreError,
     FitScoreResult,
     ScoreBreakdown,
     ExplainabilityFactor,
@@ -14,15 +22,30 @@ from src.models.fit_score import (
 )
 from src.services.llm_service import LLMService
 from src.services.embedding_service import EmbeddingService
+from src.services.skill_similarity import get_skill_similarity_index
+from src.utils.skill_scanner import keyword_scanner
+
+logger = logging.getLogger(__name__)
+
+
+MATCHING_MODES = ("exact", "semantic")
 
 
 class FitScoringEngine:
     """Engine for calculating fit scores between candidates and jobs."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        matching_mode: Optional[str] = None,
+        component_stores: Optional[ComponentStoreRegistry] = None,
+    ):
         self.llm_service = LLMService()
         self.embedding_service = EmbeddingService()
         
+        # "exact" compares lowercase strings, "semantic" compares embeddings
+        self.matching_mode = matching_mode or settings.fit_scoring_matching_mode
+        self.semantic_threshold = settings.semantic_match_threshold
+        
         # Default weights for scoring components
         self.weights = {
             "skills": 0.40,
@@ -30,6 +53,9 @@ class FitScoringEngine:
             "education": 0.15,
             "culture": 0.15,
         }
+        
+        # Per-job component scores for re-ranking under new weights
+        self.component_stores = component_stores or ComponentStoreRegistry()
 
     async def score(
         self,
@@ -37,6 +63,9 @@ class FitScoringEngine:
         job_id: str,
         job_requirements: JobRequirement,
         candidate_data: CandidateData,
+        matching_mode: Optional[str] = None,
+        matcher: Optional[SemanticSkillMatcher] = None,
+        pending_components: Optional[list] = None,
     ) -> dict:
         """
         Calculate fit score for a candidate-job pair.
@@ -46,15 +75,23 @@ class FitScoringEngine:
             job_id: Job identifier
             job_requirements: Job requirements specification
             candidate_data: Candidate data for scoring
+            matching_mode: Override of the engine's matching mode
+            matcher: Prepared semantic matcher shared across a batch
+            pending_components: Batch buffer to add the component scores to,
+                instead of storing them right away
             
         Returns:
             Dictionary with fit_score, breakdown, and explainability
         """
+        if matcher is None and self._resolve_mode(matching_mode) == "semantic":
+            matcher = await self.prepare_matcher(job_requirements, [candidate_data])
+        
         # Calculate component scores
         skills_score = self._calculate_skills_score(
             job_requirements.required_skills,
             job_requirements.preferred_skills,
             candidate_data.skills,
+            matcher=matcher,
         )
         
         experience_score = self._calculate_experience_score(
@@ -70,8 +107,16 @@ class FitScoringEngine:
         culture_score = await self._calculate_culture_score(
             job_requirements.culture_keywords,
             candidate_data,
+            matcher=matcher,
         )
         
+        # Persist components so the job can be re-ranked without re-scoring
+        components = (skills_score, experience_score, education_score, culture_score)
+        if pending_components is not None:
+            pending_components.append((talent_id, components))
+        else:
+            await self.component_stores.upsert(job_id, talent_id, components)
+        
         # Calculate weighted total
         fit_score = int(
             skills_score * self.weights["skills"] +
@@ -86,14 +131,22 @@ class FitScoringEngine:
         )
         
         # Find matched and missing skills
-        matched_skills = [
-            s for s in candidate_data.skills
-            if s.lower() in [r.lower() for r in job_requirements.required_skills]
-        ]
-        missing_skills = [
-            s for s in job_requirements.required_skills
-            if s.lower() not in [c.lower() for c in candidate_data.skills]
-        ]
+        if matcher is not None:
+            relevant = matcher.relevant(job_requirements.required_skills, candidate_data.skills)
+            covered = matcher.covered(job_requirements.required_skills, candidate_data.skills)
+            matched_skills = [s for s, hit in zip(candidate_data.skills, relevant) if hit]
+            missing_skills = [
+                s for s, hit in zip(job_requirements.required_skills, covered) if not hit
+            ]
+        else:
+            matched_skills = [
+                s for s in candidate_data.skills
+                if s.lower() in [r.lower() for r in job_requirements.required_skills]
+            ]
+            missing_skills = [
+                s for s in job_requirements.required_skills
+                if s.lower() not in [c.lower() for c in candidate_data.skills]
+            ]
         
         # Generate recommendations
         recommendations = self._generate_recommendations(
@@ -114,11 +167,47 @@ class FitScoringEngine:
             "recommendations": recommendations,
         }
 
+    def _resolve_mode(self, matching_mode: Optional[str]) -> str:
+        """Validate and resolve the matching mode for a request."""
+        mode = matching_mode or self.matching_mode
+        if mode not in MATCHING_MODES:
+            raise ValueError(f"Unknown matching mode: {mode}")
+        return mode
+
+    async def prepare_matcher(
+        self,
+        job_requirements: JobRequirement,
+        candidates: list[CandidateData],
+    ) -> SemanticSkillMatcher:
+        """
+        Build a semantic matcher for a job and a batch of candidates.
+        
+        Taxonomy skill pairs come from the precomputed similarity matrix;
+        other terms use the shared embedding cache, and only unseen terms are
+        embedded, in one batched request.
+        """
+        matcher = SemanticSkillMatcher(
+            self.embedding_service,
+            self.semantic_threshold,
+            similarity_index=get_skill_similarity_index(),
+        )
+        
+        job_terms = (
+            job_requirements.required_skills
+            + job_requirements.preferred_skills
+            + job_requirements.culture_keywords
+        )
+        candidate_terms = [skill for c in candidates for skill in c.skills]
+        
+        await matcher.prepare(job_terms, candidate_terms)
+        return matcher
+
     def _calculate_skills_score(
         self,
         required_skills: list[str],
         preferred_skills: list[str],
         candidate_skills: list[str],
+        matcher: Optional[SemanticSkillMatcher] = None,
     ) -> float:
         """Calculate skills match score."""
         if not required_skills:
@@ -127,17 +216,23 @@ class FitScoringEngine:
         candidate_skills_lower = [s.lower() for s in candidate_skills]
         
         # Required skills match (70% weight)
-        required_matches = sum(
-            1 for s in required_skills
-            if s.lower() in candidate_skills_lower
-        )
+        if matcher is not None:
+            required_matches = matcher.count_matches(required_skills, candidate_skills)
+        else:
+            required_matches = sum(
+                1 for s in required_skills
+                if s.lower() in candidate_skills_lower
+            )
         required_score = (required_matches / len(required_skills)) * 100 if required_skills else 100
         
         # Preferred skills match (30% weight)
-        preferred_matches = sum(
-            1 for s in preferred_skills
-            if s.lower() in candidate_skills_lower
-        )
+        if matcher is not None:
+            preferred_matches = matcher.count_matches(preferred_skills, candidate_skills)
+        else:
+            preferred_matches = sum(
+                1 for s in preferred_skills
+                if s.lower() in candidate_skills_lower
+            )
         preferred_score = (preferred_matches / len(preferred_skills)) * 100 if preferred_skills else 100
         
         return required_score * 0.7 + preferred_score * 0.3
@@ -184,19 +279,23 @@ class FitScoringEngine:
         self,
         culture_keywords: list[str],
         candidate_data: CandidateData,
+        matcher: Optional[SemanticSkillMatcher] = None,
     ) -> float:
         """Calculate culture fit score using semantic similarity."""
         if not culture_keywords:
             return 75.0  # Default neutral score
         
-        # TODO: Use embeddings for semantic matching
-        # For now, use simple keyword matching
-        candidate_text = " ".join(candidate_data.skills)
-        
-        matches = sum(
-            1 for keyword in culture_keywords
-            if keyword.lower() in candidate_text.lower()
-        )
+        if matcher is not None:
+            matches = matcher.count_matches(culture_keywords, candidate_data.skills)
+        else:
+            # Exact mode: whole-word keyword matching over the candidate's skills
+            candidate_text = "\n".join(candidate_data.skills)
+            found = set(keyword_scanner(tuple(culture_keywords)).find(candidate_text))
+            
+            matches = sum(
+                1 for keyword in culture_keywords
+                if keyword.strip().lower() in found
+            )
         
         return min(100, (matches / len(culture_keywords)) * 100 + 50)
 
@@ -264,41 +363,160 @@ class FitScoringEngine:
         
         return recommendations
 
-    async def batch_score(
+    async def _score_candidate(
         self,
+        index: int,
         job_id: str,
         job_requirements: JobRequirement,
-        candidates: list[CandidateData],
-    ) -> list[FitScoreResult]:
-        """Score multiple candidates for a job."""
-        results = []
-        
-        for candidate in candidates:
+        candidate: CandidateData,
+        matcher: Optional[SemanticSkillMatcher],
+        include_explanation: bool,
+        pending_components: list,
+    ) -> tuple[int, Union[FitScoreResult, CandidateScoreError]]:
+        """Score one candidate of a batch, capturing failures as errors."""
+        try:
             score_data = await self.score(
                 talent_id=candidate.talent_id,
                 job_id=job_id,
                 job_requirements=job_requirements,
                 candidate_data=candidate,
+                matcher=matcher,
+                pending_components=pending_components,
             )
             
-            results.append(
-                FitScoreResult(
-                    talent_id=candidate.talent_id,
-                    job_id=job_id,
-                    **score_data,
+            result = FitScoreResult(
+                talent_id=candidate.talent_id,
+                job_id=job_id,
+                **score_data,
+            )
+            
+            if include_explanation:
+                result.explanation = await self.llm_service.calculate_fit_score_explanation(
+                    job_requirements.model_dump(),
+                    candidate.model_dump(),
+                    result.fit_score,
                 )
+            
+            return index, result
+            
+        except Exception as e:
+            logger.warning(f"Failed to score candidate {candidate.talent_id} for {job_id}: {e}")
+            return index, CandidateScoreError(
+                index=index,
+                talent_id=candidate.talent_id,
+                error=str(e),
             )
+
+    async def iter_batch_score(
+        self,
+        job_id: str,
+        job_requirements: JobRequirement,
+        candidates: list[CandidateData],
+        matching_mode: Optional[str] = None,
+        include_explanations: bool = False,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[tuple[int, Union[FitScoreResult, CandidateScoreError]]]:
+        """
+        Score candidates for a job, yielding (index, outcome) as each completes.
+        
+        Only the explanation path is fanned out: with explanations, each
+        candidate waits on an LLM call, so candidates are scored concurrently,
+        bounded by a semaphore (max_concurrency) to cap in-flight LLM calls.
+        Without explanations scoring is CPU-only and runs inline, in order,
+        which avoids per-candidate task overhead on large pools. In both
+        paths component scores are buffered and stored in one transaction
+        when the batch ends (or the stream is closed), so no candidate waits
+        on I/O of its own.
         
-        return results
+        Args:
+            job_id: Job identifier
+            job_requirements: Job requirements specification
+            candidates: Candidates to score
+            matching_mode: Override of the engine's matching mode
+            include_explanations: Generate an LLM explanation per candidate
+            max_concurrency: Maximum candidates in flight at once
+            
+        Yields:
+            Tuples of candidate index and FitScoreResult or CandidateScoreError
+        """
+        # One similarity matrix for the whole batch in semantic mode
+        matcher = None
+        if self._resolve_mode(matching_mode) == "semantic":
+            matcher = await self.prepare_matcher(job_requirements, candidates)
+        
+        pending_components: list = []
+        tasks: list[asyncio.Task] = []
+        
+        try:
+            if not include_explanations:
+                for index, candidate in enumerate(candidates):
+                    yield await self._score_candidate(
+                        index, job_id, job_requirements, candidate, matcher, False, pending_components
+                    )
+                return
+            
+            semaphore = asyncio.Semaphore(max_concurrency or settings.fit_scoring_max_concurrency)
+            
+            async def bounded(index: int, candidate: CandidateData):
+                async with semaphore:
+                    return await self._score_candidate(
+                        index, job_id, job_requirements, candidate, matcher, True, pending_components
+                    )
+            
+            tasks = [
+                asyncio.create_task(bounded(index, candidate))
+                for index, candidate in enumerate(candidates)
+            ]
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            # Client went away mid-stream: stop the remaining work
+            for task in tasks:
+                task.cancel()
+            # Store what was scored, in one transaction
+            await self.component_stores.upsert_many(job_id, pending_components)
+
+    async def batch_score(
+        self,
+        job_id: str,
+        job_requirements: JobRequirement,
+        candidates: list[CandidateData],
+        matching_mode: Optional[str] = None,
+        include_explanations: bool = False,
+        max_concurrency: Optional[int] = None,
+    ) -> list[Union[FitScoreResult, CandidateScoreError]]:
+        """
+        Score multiple candidates for a job.
+        
+        Returns one entry per candidate, in request order: a FitScoreResult,
+        or a CandidateScoreError if that candidate could not be scored.
+        """
+        outcomes: list[Union[FitScoreResult, CandidateScoreError, None]] = [None] * len(candidates)
+        
+        async for index, outcome in self.iter_batch_score(
+            job_id,
+            job_requirements,
+            candidates,
+            matching_mode=matching_mode,
+            include_explanations=include_explanations,
+            max_concurrency=max_concurrency,
+        ):
+            outcomes[index] = outcome
+        
+        return outcomes
 
     async def rank_candidates(
         self,
         job_id: str,
         job_requirements: JobRequirement,
         candidates: list[CandidateData],
+        matching_mode: Optional[str] = None,
     ) -> list[dict]:
         """Rank candidates by fit score."""
-        results = await self.batch_score(job_id, job_requirements, candidates)
+        outcomes = await self.batch_score(
+            job_id, job_requirements, candidates, matching_mode=matching_mode
+        )
+        results = [r for r in outcomes if isinstance(r, FitScoreResult)]
         
         # Sort by fit score descending
         ranked = sorted(results, key=lambda x: x.fit_score, reverse=True)
@@ -313,11 +531,97 @@ class FitScoringEngine:
             for i, r in enumerate(ranked)
         ]
 
+    def resolve_weights(self, weights: Optional[dict[str, float]] = None) -> dict[str, float]:
+        """
+        Merge weight overrides with the defaults and normalise them to sum to 1.
+        
+        Args:
+            weights: Partial or full mapping of component name to weight
+            
+        Returns:
+            Complete, normalised weights mapping
+        """
+        merged = {**self.weights, **(weights or {})}
+        
+        unknown = set(merged) - set(COMPONENTS)
+        if unknown:
+            raise ValueError(f"Unknown scoring components: {', '.join(sorted(unknown))}")
+        
+        if any(w < 0 for w in merged.values()):
+            raise ValueError("Scoring weights must be non-negative")
+        
+        total = sum(merged.values())
+        if total <= 0:
+            raise ValueError("At least one scoring weight must be positive")
+        
+        return {name: merged[name] / total for name in COMPONENTS}
+
+    async def rerank(
+        self,
+        job_id: str,
+        weights: Optional[dict[str, float]] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict]:
+        """
+        Re-rank previously scored candidates for a job under new weights.
+        
+        Only the weighted totals are recomputed (one matrix-vector product over
+        the stored component scores); no candidate is re-scored.
+        
+        Args:
+            job_id: Job identifier
+            weights: Weight overrides (merged with the defaults)
+            limit: Maximum number of ranked candidates to return
+            
+        Returns:
+            Ranked list of candidates with fit score and component breakdown
+        """
+        store = await self.component_stores.get(job_id)
+        if store is None or not len(store):
+            raise KeyError(f"No scored candidates for job: {job_id}")
+        
+        resolved = self.resolve_weights(weights)
+        weight_vector = np.array([resolved[name] for name in COMPONENTS])
+        
+        components = store.components
+        totals = store.weighted_totals(weight_vector)
+        order = np.argsort(-totals, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+        
+        return [
+            {
+                "rank": rank + 1,
+                "talent_id": store.talent_ids[row],
+                "fit_score": int(totals[row]),
+                "breakdown": dict(zip(COMPONENTS, components[row].tolist())),
+            }
+            for rank, row in enumerate(order.tolist())
+        ]
+
     async def get_stored_score(
         self,
         talent_id: str,
         job_id: str,
     ) -> Optional[dict]:
         """Retrieve a stored fit score."""
-        # TODO: Implement database retrieval
-        return None
+        store = await self.component_stores.get(job_id)
+        components = store.get(talent_id) if store is not None else None
+        
+        if components is None:
+            return None
+        
+        skills_score, experience_score, education_score, culture_score = components.tolist()
+        weight_vector = np.array([self.weights[name] for name in COMPONENTS])
+        
+        return {
+            "talent_id": talent_id,
+            "job_id": job_id,
+            "fit_score": int(components @ weight_vector),
+            "breakdown": ScoreBreakdown(
+                skills_match=skills_score,
+                experience_match=experience_score,
+                education_match=education_score,
+                culture_fit=culture_score,
+            ),
+        }
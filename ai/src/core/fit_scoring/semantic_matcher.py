@@ -0,0 +1,123 @@
+"""
+Semantic Skill Matcher
+
+Embedding-based matching of job terms (required/preferred skills, culture
+keywords) against candidate skills. One similarity matrix is computed per
+job/candidate batch; per-candidate lookups are slices of that matrix.
+
+Pairs of taxonomy skills are looked up in the precomputed skill similarity
+matrix; a batch made only of taxonomy skills needs no embedding calls.
+"""
+from typing import Optional
+
+import numpy as np
+
+from src.services.embedding_service import EmbeddingService
+from src.services.skill_similarity import SkillSimilarityIndex
+
+
+class SemanticSkillMatcher:
+    """Matches job terms to candidate skills by embedding similarity."""
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        threshold: float,
+        similarity_index: Optional[SkillSimilarityIndex] = None,
+    ):
+        self.embedding_service = embedding_service
+        self.threshold = threshold
+        self.similarity_index = similarity_index
+        self._job_index: dict[str, int] = {}
+        self._candidate_index: dict[str, int] = {}
+        self._similarity = np.zeros((0, 0), dtype=np.float32)
+
+    async def prepare(
+        self,
+        job_terms: list[str],
+        candidate_terms: list[str],
+    ) -> None:
+        """
+        Embed all terms (cache-first) and build the similarity matrix.
+
+        Args:
+            job_terms: Every skill/keyword the job asks for
+            candidate_terms: Union of skills over all candidates in the batch
+        """
+        job_terms = list(dict.fromkeys(t.lower() for t in job_terms if t))
+        candidate_terms = list(dict.fromkeys(t.lower() for t in candidate_terms if t))
+
+        self._job_index = {term: i for i, term in enumerate(job_terms)}
+        self._candidate_index = {term: i for i, term in enumerate(candidate_terms)}
+
+        job_positions = self._taxonomy_positions(job_terms)
+        candidate_positions = self._taxonomy_positions(candidate_terms)
+
+        if None in job_positions or None in candidate_positions:
+            vectors = await self.embedding_service.embed_texts(job_terms + candidate_terms)
+            job_vectors = vectors[: len(job_terms)]
+            candidate_vectors = vectors[len(job_terms):]
+            self._similarity = job_vectors @ candidate_vectors.T
+        else:
+            self._similarity = np.zeros((len(job_terms), len(candidate_terms)), dtype=np.float32)
+
+        # Taxonomy pairs use the precomputed matrix
+        rows = [i for i, p in enumerate(job_positions) if p is not None]
+        columns = [j for j, p in enumerate(candidate_positions) if p is not None]
+        if rows and columns:
+            self._similarity[np.ix_(rows, columns)] = self.similarity_index.similarity_block(
+                [job_positions[i] for i in rows],
+                [candidate_positions[j] for j in columns],
+            )
+
+        # Identical terms always match, even if embedding failed
+        for term, row in self._job_index.items():
+            column = self._candidate_index.get(term)
+            if column is not None:
+                self._similarity[row, column] = 1.0
+
+    def _taxonomy_positions(self, terms: list[str]) -> list[Optional[int]]:
+        """Similarity-matrix positions of terms (None if not in the taxonomy)."""
+        if self.similarity_index is None:
+            return [None] * len(terms)
+        return [self.similarity_index.position(t) for t in terms]
+
+    def similarity_block(
+        self,
+        job_terms: list[str],
+        candidate_terms: list[str],
+    ) -> np.ndarray:
+        """Similarity sub-matrix (job terms x candidate terms)."""
+        rows = [self._job_index.get(t.lower(), -1) for t in job_terms]
+        columns = [self._candidate_index.get(t.lower(), -1) for t in candidate_terms]
+
+        block = np.zeros((len(rows), len(columns)), dtype=np.float32)
+        known_rows = [i for i, r in enumerate(rows) if r >= 0]
+        known_columns = [j for j, c in enumerate(columns) if c >= 0]
+
+        if known_rows and known_columns:
+            block[np.ix_(known_rows, known_columns)] = self._similarity[
+                np.ix_([rows[i] for i in known_rows], [columns[j] for j in known_columns])
+            ]
+
+        return block
+
+    def covered(self, job_terms: list[str], candidate_terms: list[str]) -> np.ndarray:
+        """Boolean mask of job terms matched by at least one candidate term."""
+        if not job_terms or not candidate_terms:
+            return np.zeros(len(job_terms), dtype=bool)
+
+        block = self.similarity_block(job_terms, candidate_terms)
+        return block.max(axis=1) >= self.threshold
+
+    def relevant(self, job_terms: list[str], candidate_terms: list[str]) -> np.ndarray:
+        """Boolean mask of candidate terms matching at least one job term."""
+        if not job_terms or not candidate_terms:
+            return np.zeros(len(candidate_terms), dtype=bool)
+
+        block = self.similarity_block(job_terms, candidate_terms)
+        return block.max(axis=0) >= self.threshold
+
+    def count_matches(self, job_terms: list[str], candidate_terms: list[str]) -> int:
+        """Number of job terms matched by the candidate terms."""
+        return int(self.covered(job_terms, candidate_terms).sum())
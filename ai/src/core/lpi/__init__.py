@@ -1,7 +1,7 @@
 """
 LPI Engine Package
 """
-from src.core.lpi.summarizer import LPISummarizer
+from src.core.lpi.summarizer import LPISummarizer, lpi_summarizer
 from src.core.lpi.report_generator import LPIReportGenerator
 
-__all__ = ["LPISummarizer", "LPIReportGenerator"]
+__all__ = ["LPISummarizer", "LPIReportGenerator", "lpi_summarizer"]
@@ -2,11 +2,15 @@
 LPI Report Generator
 
 Generates weekly, monthly, and final competency reports.
+
+Reports are kept in an indexed store (by id, learner email, program and
+report type) and listed with cursor pagination.
 """
 from datetime import datetime, timedelta
 from typing import Optional
 import uuid
 
+from src.core.lpi.store import IndexedRecordStore, RecordPage
 from src.models.lpi import LPIReport, WeeklySummary, CompetencySignalLPI
 from src.services.llm_service import LLMService
 
@@ -17,34 +21,41 @@ class LPIReportGenerator:
     def __init__(self):
         self.llm_service = LLMService()
         # In-memory storage for demo (replace with database)
-        self._reports = []
+        self._reports: IndexedRecordStore[LPIReport] = IndexedRecordStore(
+            ("learner_email", "program", "report_type")
+        )
 
     async def list_reports(
         self,
         learner_email: Optional[str] = None,
         program: Optional[str] = None,
         report_type: Optional[str] = None,
-    ) -> list[dict]:
-        """List generated reports with optional filters."""
-        filtered = self._reports
-        
-        if learner_email:
-            filtered = [r for r in filtered if r.learner_email == learner_email]
-        
-        if program:
-            filtered = [r for r in filtered if r.program == program]
-        
-        if report_type:
-            filtered = [r for r in filtered if r.report_type == report_type]
-        
-        return [r.model_dump() for r in filtered]
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> RecordPage[dict]:
+        """
+        List generated reports with optional filters, oldest first.
+        
+        Args:
+            learner_email: Only this learner's reports
+            program: Only this program's reports
+            report_type: Only reports of this type (weekly, monthly, final)
+            cursor: next_cursor of the previous page
+            limit: Page size (None for every remaining report)
+            
+        Returns:
+            RecordPage of report dicts and the next page's cursor
+        """
+        page = self._reports.page(
+            {"learner_email": learner_email, "program": program, "report_type": report_type},
+            cursor=cursor,
+            limit=limit if limit is not None else len(self._reports),
+        )
+        return RecordPage([r.model_dump() for r in page.items], page.next_cursor)
 
     async def get_report(self, report_id: str) -> Optional[LPIReport]:
         """Get a specific report by ID."""
-        return next(
-            (r for r in self._reports if r.id == report_id),
-            None
-        )
+        return self._reports.get(report_id)
 
     async def generate_weekly(
         self,
@@ -104,7 +115,7 @@ class LPIReportGenerator:
             overall_score=68,
         )
         
-        self._reports.append(report)
+        self._reports.add(report.id, report)
         
         return {"job_id": job_id, "reports_generated": 1}
 
@@ -156,7 +167,7 @@ class LPIReportGenerator:
             overall_score=72,
         )
         
-        self._reports.append(report)
+        self._reports.add(report.id, report)
         
         return {"job_id": job_id, "reports_generated": 1}
 
@@ -213,6 +224,6 @@ class LPIReportGenerator:
             overall_score=82,
         )
         
-        self._reports.append(report)
+        self._reports.add(report.id, report)
         
         return report
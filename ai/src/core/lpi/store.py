@@ -0,0 +1,165 @@
+"""
+LPI Record Store
+
+In-memory store of LPI records (submission dicts, report models) with a
+primary-key index and secondary indexes on chosen fields, so lookups are
+constant-time and filtered listings read only the matching index bucket.
+
+Records are numbered in insertion order. Each index bucket is the sorted
+list of its records' numbers, so a page starts with a binary search for
+the cursor (the number of the last record returned) instead of a scan.
+Only cursor listings are sub-linear: page-number listings (offset) still
+step over the offset matching records before the page.
+"""
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Generic, NamedTuple, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class RecordPage(NamedTuple, Generic[T]):
+    """One page of a listing."""
+
+    items: list[T]
+    next_cursor: Optional[str]  # None on the last page
+
+
+def field_value(record: Any, field: str) -> Any:
+    """A field of a dict or model record."""
+    if isinstance(record, dict):
+        return record.get(field)
+    return getattr(record, field, None)
+
+
+class IndexedRecordStore(Generic[T]):
+    """Records by id, indexed on a fixed set of fields."""
+
+    def __init__(self, indexed_fields: tuple[str, ...]):
+        self.indexed_fields = indexed_fields
+        self._records: dict[str, T] = {}
+        self._numbers: dict[str, int] = {}
+        self._ids: dict[int, str] = {}
+        self._all: list[int] = []
+        # Field -> value -> sorted record numbers
+        self._indexes: dict[str, dict[Any, list[int]]] = {field: {} for field in indexed_fields}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._records
+
+    def add(self, record_id: str, record: T) -> None:
+        """Store a new record."""
+        if record_id in self._records:
+            raise ValueError(f"Record already exists: {record_id}")
+
+        number = len(self._all)
+        self._records[record_id] = record
+        self._numbers[record_id] = number
+        self._ids[number] = record_id
+        self._all.append(number)
+        for field in self.indexed_fields:
+            self._index(field, field_value(record, field), number)
+
+    def get(self, record_id: str) -> Optional[T]:
+        """Record by id."""
+        return self._records.get(record_id)
+
+    def update(self, record_id: str, **changes: Any) -> T:
+        """
+        Change fields of a record, keeping the indexes current.
+
+        Raises:
+            KeyError: Unknown record id
+        """
+        record = self._records[record_id]
+        number = self._numbers[record_id]
+
+        for field, value in changes.items():
+            current = field_value(record, field)
+            if field in self._indexes and current != value:
+                self._unindex(field, current, number)
+                self._index(field, value, number)
+            if isinstance(record, dict):
+                record[field] = value
+            else:
+                setattr(record, field, value)
+        return record
+
+    def count(self, field: Optional[str] = None, value: Any = None) -> int:
+        """Number of records with a value of an indexed field (or in total)."""
+        if field is None:
+            return len(self._records)
+        return len(self._indexes[field].get(value, ()))
+
+    def page(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> RecordPage[T]:
+        """
+        Records matching every filter, oldest first.
+
+        Args:
+            filters: Indexed field -> required value (None values are ignored)
+            cursor: next_cursor of the previous page
+            limit: Page size
+            offset: Matching records to skip first (page-number listings;
+                walks O(offset) records, unlike a cursor)
+
+        Returns:
+            RecordPage with the records and the cursor of the next page
+
+        Raises:
+            ValueError: Malformed cursor
+        """
+        active = {field: value for field, value in (filters or {}).items() if value is not None}
+
+        # Walk the smallest bucket; check the other filters per record
+        candidates = self._all
+        for field, value in active.items():
+            bucket = self._indexes[field].get(value, [])
+            if len(bucket) < len(candidates):
+                candidates = bucket
+
+        start = 0
+        if cursor:
+            try:
+                start = bisect_right(candidates, int(cursor))
+            except ValueError:
+                raise ValueError(f"Invalid cursor: {cursor}")
+
+        items: list[T] = []
+        last = None
+        if limit <= 0:
+            return RecordPage(items, None)
+        for position in range(start, len(candidates)):
+            record = self._records[self._ids[candidates[position]]]
+            if any(field_value(record, field) != value for field, value in active.items()):
+                continue
+            if offset:
+                offset -= 1
+                continue
+            if len(items) == limit:
+                return RecordPage(items, str(last))
+            items.append(record)
+            last = candidates[position]
+
+        return RecordPage(items, None)
+
+    def _index(self, field: str, value: Any, number: int) -> None:
+        if value is not None:
+            insort(self._indexes[field].setdefault(value, []), number)
+
+    def _unindex(self, field: str, value: Any, number: int) -> None:
+        bucket = self._indexes[field].get(value)
+        if not bucket:
+            return
+        position = bisect_left(bucket, number)
+        if position < len(bucket) and bucket[position] == number:
+            del bucket[position]
+        if not bucket:
+            del self._indexes[field][value]
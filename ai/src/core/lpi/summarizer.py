@@ -2,26 +2,74 @@
 LPI Summarizer
 
 Processes learner submissions and generates summaries.
+
+Submissions are queued on the durable work queue and summarized by
+background workers (started with the app), so submitting returns at once
+and queued work survives restarts. Failed attempts are retried with
+backoff; submission status and processing stats follow the queue, and
+summaries are stored with their jobs so they are restored after a restart.
+Submissions are kept in an indexed store (by id, program, status and
+learner email) and listed with cursor pagination.
+
+Uploaded files are kept in the content store and jobs reference them by
+hash, so failed or finished submissions can be processed again without a
+re-upload.
 """
+import base64
+import logging
 from datetime import datetime
 from typing import Optional
 import uuid
 
+from src.core.lpi.store import IndexedRecordStore, RecordPage
+from src.services.content_store import ContentStore, content_store
 from src.services.llm_service import LLMService
+from src.services.text_extraction import text_extraction_service
+from src.services.work_queue import (
+    COMPLETED,
+    FAILED,
+    PROCESSING,
+    QUEUED,
+    QueuedJob,
+    QueueWorkerPool,
+    SQLiteWorkQueue,
+    work_queue,
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUE_NAME = "lpi_submissions"
 
 
 class LPISummarizer:
     """Service for processing and summarizing learner submissions."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        queue: Optional[SQLiteWorkQueue] = None,
+        workers: Optional[int] = None,
+        contents: Optional[ContentStore] = None,
+    ):
         self.llm_service = LLMService()
+        self.contents = contents or content_store
         # In-memory storage for demo (replace with database)
-        self._submissions = []
-        self._processing_stats = {
-            "processed": 0,
-            "in_queue": 0,
-            "failed": 0,
-        }
+        self._submissions: IndexedRecordStore[dict] = IndexedRecordStore(("program", "status", "learner_email"))
+        self.queue = queue or work_queue
+        self.workers = QueueWorkerPool(
+            self.queue,
+            QUEUE_NAME,
+            self._handle_job,
+            workers=workers,
+            on_failure=self._job_failed,
+        )
+
+    def start(self) -> None:
+        """Start the background workers."""
+        self.workers.start()
+
+    async def shutdown(self) -> None:
+        """Stop the background workers (unfinished jobs stay queued)."""
+        await self.workers.stop()
 
     async def submit(
         self,
@@ -48,9 +96,10 @@ class LPISummarizer:
             notes: Additional notes
             
         Returns:
-            Dictionary with submission_id
+            Dictionary with submission_id (the submission is processed in the background)
         """
         submission_id = str(uuid.uuid4())
+        content_hash = await self.contents.put(content) if content is not None else None
         
         submission = {
             "id": submission_id,
@@ -64,111 +113,173 @@ class LPISummarizer:
             "link": link,
             "notes": notes,
             "has_file": content is not None,
+            "content_hash": content_hash,
         }
         
-        self._submissions.append(submission)
-        self._processing_stats["in_queue"] += 1
+        self._submissions.add(submission_id, submission)
         
-        # TODO: Queue for async processing
-        # For now, process immediately
-        await self._process_submission(submission_id, content)
+        # The job carries the submission (and the content's hash), so it can
+        # be processed after a restart
+        await self.queue.enqueue(
+            QUEUE_NAME,
+            {"submission": submission, "content_hash": content_hash},
+            job_id=submission_id,
+        )
         
         return {"submission_id": submission_id}
 
-    async def _process_submission(
-        self,
-        submission_id: str,
-        content: Optional[bytes],
-    ) -> None:
-        """Process a submission asynchronously."""
-        submission = next(
-            (s for s in self._submissions if s["id"] == submission_id),
-            None
-        )
+    async def _handle_job(self, job: QueuedJob) -> dict:
+        """Summarize a queued submission (failures are retried by the queue)."""
+        submission = self._restore(job)
+        self._submissions.update(job.id, status=PROCESSING, attempts=job.attempts)
         
-        if not submission:
-            return
+        await self._process_submission(submission, job.payload)
         
-        try:
-            submission["status"] = "processing"
-            
-            # Extract text from content
-            text = ""
-            if content:
-                text = content.decode("utf-8", errors="ignore")
-            elif submission.get("link"):
-                text = f"External link: {submission['link']}"
-            
-            if submission.get("notes"):
-                text += f"\n\nNotes: {submission['notes']}"
-            
-            # Generate summary using LLM
-            summary = await self.llm_service.summarize_submission(text)
-            
-            submission["summary"] = summary
-            submission["status"] = "completed"
-            
-            self._processing_stats["in_queue"] -= 1
-            self._processing_stats["processed"] += 1
-            
-        except Exception as e:
-            submission["status"] = "failed"
-            submission["failure_reason"] = str(e)
-            
-            self._processing_stats["in_queue"] -= 1
-            self._processing_stats["failed"] += 1
+        self._submissions.update(job.id, status=COMPLETED, failure_reason=None)
+        # Stored with the completed job
+        return {"summary": submission["summary"]}
+
+    async def _job_failed(self, job: QueuedJob, error: str, retry: bool) -> None:
+        """Record a failed attempt on the submission."""
+        if job.id in self._submissions:
+            self._submissions.update(job.id, status=QUEUED if retry else FAILED, failure_reason=error)
+
+    async def _process_submission(self, submission: dict, payload: dict) -> None:
+        """Extract a submission's text and summarize it."""
+        # Extract text from content
+        text = ""
+        if payload.get("content_hash"):
+            stored = await self.contents.open(payload["content_hash"])
+            if stored is None:
+                raise ValueError("Submitted file is no longer stored; please resubmit")
+            with stored:
+                # Raw blobs are memory-mapped; extraction workers read the file itself
+                text = await text_extraction_service.extract(
+                    stored.buffer, filename=submission.get("filename") or "", path=stored.path
+                )
+        elif payload.get("content"):
+            # Jobs queued before content was kept in the content store
+            text = await text_extraction_service.extract(
+                base64.b64decode(payload["content"]), filename=submission.get("filename") or ""
+            )
+        elif submission.get("link"):
+            text = f"External link: {submission['link']}"
+        
+        if submission.get("notes"):
+            text += f"\n\nNotes: {submission['notes']}"
+        
+        # Generate summary using LLM
+        submission["summary"] = await self.llm_service.summarize_submission(text)
+
+    def _restore(self, job: QueuedJob) -> dict:
+        """The submission of a job, recreated from the job (and its result) after a restart."""
+        submission = self._submissions.get(job.id)
+        if submission is None:
+            submission = dict(job.payload["submission"])
+            submission.update(job.result or {})
+            self._submissions.add(job.id, submission)
+        return submission
 
     async def list_submissions(
         self,
         program: Optional[str] = None,
         status: Optional[str] = None,
+        learner_email: Optional[str] = None,
+        cursor: Optional[str] = None,
         page: int = 1,
         limit: int = 20,
-    ) -> list[dict]:
-        """List submissions with optional filters."""
-        filtered = self._submissions
-        
-        if program:
-            filtered = [s for s in filtered if s["program"] == program]
-        
-        if status:
-            filtered = [s for s in filtered if s["status"] == status]
-        
-        # Pagination
-        start = (page - 1) * limit
-        end = start + limit
+    ) -> RecordPage[dict]:
+        """
+        List submissions with optional filters, oldest first.
         
-        return filtered[start:end]
+        Args:
+            program: Only this program's submissions
+            status: Only submissions with this status
+            learner_email: Only this learner's submissions
+            cursor: next_cursor of the previous page (takes precedence over page)
+            page: Page number, for listings without a cursor
+            limit: Page size
+            
+        Returns:
+            RecordPage of submissions and the next page's cursor
+        """
+        return self._submissions.page(
+            {"program": program, "status": status, "learner_email": learner_email},
+            cursor=cursor,
+            limit=limit,
+            offset=0 if cursor else max(page - 1, 0) * limit,
+        )
 
     async def get_submission(self, submission_id: str) -> Optional[dict]:
-        """Get a specific submission by ID."""
-        return next(
-            (s for s in self._submissions if s["id"] == submission_id),
-            None
+        """Get a specific submission by ID, with its queue state."""
+        job = await self.queue.get(submission_id)
+        if job is None:
+            return self._submissions.get(submission_id)
+        
+        self._restore(job)
+        next_attempt_at = None
+        if job.status == QUEUED and job.attempts:
+            next_attempt_at = datetime.utcfromtimestamp(job.available_at).isoformat()
+        return self._submissions.update(
+            submission_id,
+            status=job.status,
+            attempts=job.attempts,
+            failure_reason=job.last_error,
+            next_attempt_at=next_attempt_at,
         )
 
     async def retry_submission(self, submission_id: str) -> dict:
-        """Retry a failed submission."""
+        """Retry a failed submission (queued again with its stored content)."""
         submission = await self.get_submission(submission_id)
         
         if not submission:
             raise ValueError(f"Submission not found: {submission_id}")
         
-        if submission["status"] != "failed":
+        if submission["status"] != FAILED:
             raise ValueError("Can only retry failed submissions")
         
-        submission["status"] = "queued"
-        self._processing_stats["failed"] -= 1
-        self._processing_stats["in_queue"] += 1
+        await self._requeue(submission, (FAILED,))
+        return {"success": True}
+
+    async def resummarize_submission(self, submission_id: str) -> dict:
+        """Summarize a finished (or failed) submission again from its stored content."""
+        submission = await self.get_submission(submission_id)
         
-        # Re-process
-        await self._process_submission(submission_id, None)
+        if not submission:
+            raise ValueError(f"Submission not found: {submission_id}")
         
+        if submission["status"] not in (COMPLETED, FAILED):
+            raise ValueError("Submission is still being processed")
+        
+        await self._requeue(submission, (COMPLETED, FAILED))
         return {"success": True}
 
+    async def _requeue(self, submission: dict, statuses: tuple[str, ...]) -> None:
+        """Queue a submission's job again, if its content is still stored."""
+        content_hash = submission.get("content_hash")
+        if content_hash and not await self.contents.exists(content_hash):
+            raise ValueError("Submitted file is no longer stored; please resubmit")
+        
+        if not await self.queue.requeue(submission["id"], statuses=statuses):
+            raise ValueError(f"Submission is not queued for processing: {submission['id']}")
+        self._submissions.update(submission["id"], status=QUEUED)
+
     async def get_processing_status(self) -> dict:
-        """Get current processing status."""
+        """Get current processing status from the queue."""
+        counts = await self.queue.counts(QUEUE_NAME)
+        failed = await self.queue.failed(QUEUE_NAME)
         return {
-            **self._processing_stats,
+            "processed": counts[COMPLETED],
+            "in_queue": counts[QUEUED] + counts[PROCESSING],
+            "processing": counts[PROCESSING],
+            "failed": counts[FAILED],
+            "failed_items": [
+                {"submission_id": job.id, "attempts": job.attempts, "error": job.last_error}
+                for job in failed
+            ],
             "last_updated": datetime.utcnow().isoformat(),
         }
+
+
+# Singleton instance
+lpi_summarizer = LPISummarizer()
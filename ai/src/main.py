@@ -20,6 +20,13 @@ from src.api.routes import (
     cover_letter,
 )
 from src.config import settings
+from src.core.competency.batch import competency_batch_service
+from src.core.cv_parser.ingestion import cv_ingestion_pipeline
+from src.core.lpi.summarizer import lpi_summarizer
+from src.services.file_downloader import file_downloader
+from src.services.signal_store import signal_store
+from src.services.text_extraction import text_extraction_service
+from src.services.work_queue import work_queue
 
 
 @asynccontextmanager
@@ -28,8 +35,16 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 VeriTalent AI Service starting...")
     # Initialize services here (DB connections, model loading, etc.)
+    lpi_summarizer.start()
     yield
     # Shutdown
+    await lpi_summarizer.shutdown()
+    await cv_ingestion_pipeline.shutdown()
+    text_extraction_service.shutdown()
+    competency_batch_service.shutdown()
+    signal_store.close()
+    work_queue.close()
+    await file_downloader.aclose()
     print("👋 VeriTalent AI Service shutting down...")
 
 
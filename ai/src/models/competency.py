@@ -2,7 +2,7 @@
 Competency Signal Data Models
 """
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -65,6 +65,40 @@ class CompetencyRequest(BaseModel):
     courses: list[dict] = Field(default_factory=list, description="Course completions")
 
 
+class CompetencyBatchRequest(BaseModel):
+    """Request model for generating signals for a cohort of talents."""
+    
+    requests: list[CompetencyRequest] = Field(..., min_length=1, description="One request per talent")
+
+
+class CompetencyBatchResult(BaseModel):
+    """Signals generated for one talent within a batch."""
+    
+    index: int = Field(..., description="Position of the talent in the request")
+    talent_id: str
+    signals: list[CompetencySignal] = Field(default_factory=list)
+
+
+class CompetencyBatchError(BaseModel):
+    """Failure to generate signals for one talent within a batch."""
+    
+    index: int = Field(..., description="Position of the talent in the request")
+    talent_id: str
+    error: str
+
+
+class EvidenceEvent(BaseModel):
+    """A piece of evidence added to or removed from a talent's profile."""
+    
+    action: Literal["added", "removed"]
+    source: Literal["recommendation", "certification", "tapi", "reference", "work_sample"]
+    evidence_id: Optional[str] = Field(
+        default=None,
+        description="Evidence item id (defaults to the item's 'id', else a hash of its content)",
+    )
+    data: dict = Field(default_factory=dict, description="Evidence item, shaped as in CompetencyRequest")
+
+
 class CompetencyResponse(BaseModel):
     """Response model for competency signals."""
     
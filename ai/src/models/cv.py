@@ -5,6 +5,8 @@ from typing import Optional
 
 from pydantic import BaseModel, EmailStr, Field
 
+from src.models.backend_integration import FileMetadata
+
 
 class PersonalInfo(BaseModel):
     """Personal information extracted from CV."""
@@ -97,3 +99,33 @@ class CVParseResponse(BaseModel):
     message: str
     data: Optional[ParsedCV] = None
     errors: list[str] = Field(default_factory=list)
+
+
+class BulkIngestRequest(BaseModel):
+    """Request model for bulk CV ingestion."""
+    
+    files: list[FileMetadata] = Field(..., min_length=1, description="Manifest of CV files to ingest")
+    source: Optional[str] = Field(default=None, description="Where the archive comes from (employer, import, ...)")
+
+
+class IngestionItemError(BaseModel):
+    """A CV that failed during ingestion."""
+    
+    index: int
+    original_name: str
+    stage: str  # download, extract, parse, embed, store
+    error: str
+
+
+class IngestionJobStatus(BaseModel):
+    """Progress of a bulk ingestion job."""
+    
+    job_id: str
+    status: str  # queued, running, completed, completed_with_errors, cancelled, interrupted, failed
+    total: int
+    completed: int = 0
+    failed: int = 0
+    stages: dict[str, int] = Field(default_factory=dict, description="Items finished per stage")
+    errors: list[IngestionItemError] = Field(default_factory=list)
+    created_at: str
+    updated_at: str
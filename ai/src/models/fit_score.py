@@ -2,7 +2,7 @@
 Fit Score Data Models
 """
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -59,9 +59,18 @@ class FitScoreResult(BaseModel):
     recommendations: list[str] = Field(default_factory=list)
     matched_skills: list[str] = Field(default_factory=list)
     missing_skills: list[str] = Field(default_factory=list)
+    explanation: Optional[str] = None
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
+class CandidateScoreError(BaseModel):
+    """Failure to score a single candidate within a batch."""
+    
+    index: int = Field(..., description="Position of the candidate in the request")
+    talent_id: str
+    error: str
+
+
 class FitScoreRequest(BaseModel):
     """Request model for calculating fit score."""
     
@@ -69,6 +78,10 @@ class FitScoreRequest(BaseModel):
     job_id: str
     job_requirements: JobRequirement
     candidate_data: CandidateData
+    matching_mode: Optional[Literal["exact", "semantic"]] = Field(
+        default=None,
+        description="Skill matching mode (defaults to the service setting)",
+    )
 
 
 class FitScoreResponse(BaseModel):
@@ -89,6 +102,18 @@ class BatchFitScoreRequest(BaseModel):
     job_id: str
     job_requirements: JobRequirement
     candidates: list[CandidateData]
+    matching_mode: Optional[Literal["exact", "semantic"]] = Field(
+        default=None,
+        description="Skill matching mode (defaults to the service setting)",
+    )
+    include_explanations: bool = Field(
+        default=False,
+        description="Add an LLM-generated explanation to each result",
+    )
+    stream: bool = Field(
+        default=False,
+        description="Stream results as NDJSON in completion order",
+    )
 
 
 class BatchFitScoreResponse(BaseModel):
@@ -98,3 +123,15 @@ class BatchFitScoreResponse(BaseModel):
     job_id: str
     total_candidates: int
     results: list[FitScoreResult] = Field(default_factory=list)
+    errors: list[CandidateScoreError] = Field(default_factory=list)
+
+
+class RerankRequest(BaseModel):
+    """Request model for re-ranking scored candidates under new weights."""
+    
+    job_id: str
+    weights: dict[str, float] = Field(
+        default_factory=dict,
+        description="Weight overrides for skills, experience, education, culture",
+    )
+    limit: Optional[int] = Field(default=None, ge=1)
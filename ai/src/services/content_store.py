@@ -0,0 +1,216 @@
+"""
+Submission Content Store
+
+Content-addressed local store of uploaded files, so queued jobs reference
+content by hash instead of carrying it, identical uploads are stored once,
+and failed jobs can be replayed without a re-upload.
+
+- Blobs live under ``content_store_dir``, named by the SHA-256 of their
+  content. A blob is zlib-compressed only when that saves at least
+  ``content_store_min_compression_saving`` of its size (already-compressed
+  formats such as DOCX are kept raw).
+- Raw blobs are read back memory-mapped (no copy); compressed blobs are
+  decompressed off the event loop.
+- Blobs not written or read for ``content_store_ttl_hours`` are evicted;
+  expired blobs are swept at most every ``content_store_eviction_interval_seconds``.
+"""
+import asyncio
+import hashlib
+import logging
+import mmap
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional, Union
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Hash large uploads off the event loop (hashlib releases the GIL)
+HASH_IN_THREAD_BYTES = 1024 * 1024
+
+RAW_SUFFIX = ".raw"
+COMPRESSED_SUFFIX = ".z"
+
+
+class StoredContent:
+    """A stored blob opened for reading."""
+
+    def __init__(self, key: str, data: Optional[bytes] = None, path: Optional[Path] = None):
+        self.key = key
+        # Set for raw blobs, whose file holds the content as-is
+        self.path = path
+        self._data = data
+        self._mmap: Optional[mmap.mmap] = None
+
+    @property
+    def buffer(self) -> Union[bytes, mmap.mmap]:
+        """Content; memory-mapped (read-only) for raw blobs."""
+        if self._data is not None:
+            return self._data
+        if self._mmap is None:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def close(self) -> None:
+        """Release the mapping (the blob stays stored)."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def __enter__(self) -> "StoredContent":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ContentStore:
+    """Content-addressed blob store on local disk."""
+
+    def __init__(
+        self,
+        store_dir: Optional[str] = None,
+        ttl_hours: Optional[float] = None,
+        min_compression_saving: Optional[float] = None,
+    ):
+        self.store_dir = Path(store_dir or settings.content_store_dir)
+        self.ttl_seconds = (ttl_hours or settings.content_store_ttl_hours) * 3600
+        self.min_compression_saving = (
+            settings.content_store_min_compression_saving
+            if min_compression_saving is None else min_compression_saving
+        )
+        self.eviction_interval = settings.content_store_eviction_interval_seconds
+        self._last_eviction = 0.0
+
+    @staticmethod
+    async def key(content) -> str:
+        """Content hash (the blob's key)."""
+        digest = hashlib.sha256()
+        if len(content) > HASH_IN_THREAD_BYTES:
+            await asyncio.to_thread(digest.update, content)
+        else:
+            digest.update(content)
+        return digest.hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        """Disk location of a blob (sharded by key prefix)."""
+        return self.store_dir / key[:2] / f"{key}{suffix}"
+
+    async def put(self, content) -> str:
+        """
+        Store content (a no-op apart from refreshing its TTL if already stored).
+
+        Args:
+            content: File bytes (or any buffer)
+
+        Returns:
+            Content hash to read it back with
+        """
+        key = await self.key(content)
+        await asyncio.to_thread(self._write, key, content)
+
+        if time.time() - self._last_eviction >= self.eviction_interval:
+            self._last_eviction = time.time()
+            try:
+                await asyncio.to_thread(self.evict_expired)
+            except Exception as e:
+                logger.warning(f"Content store eviction failed: {e}")
+        return key
+
+    async def open(self, key: str) -> Optional[StoredContent]:
+        """
+        Open stored content.
+
+        Args:
+            key: Content hash returned by put()
+
+        Returns:
+            StoredContent (close it when done), or None if missing or evicted
+        """
+        return await asyncio.to_thread(self._open, key)
+
+    async def exists(self, key: str) -> bool:
+        """Whether content is still stored."""
+        return await asyncio.to_thread(self._find, key) is not None
+
+    def _find(self, key: str) -> Optional[Path]:
+        """Path of a stored blob, raw or compressed."""
+        for suffix in (RAW_SUFFIX, COMPRESSED_SUFFIX):
+            path = self._path(key, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def _open(self, key: str) -> Optional[StoredContent]:
+        path = self._find(key)
+        if path is None:
+            return None
+
+        try:
+            # Reads count as use for eviction
+            os.utime(path)
+            if path.suffix == COMPRESSED_SUFFIX:
+                return StoredContent(key, data=zlib.decompress(path.read_bytes()))
+            if path.stat().st_size == 0:
+                return StoredContent(key, data=b"")
+        except FileNotFoundError:
+            # Evicted meanwhile
+            return None
+        return StoredContent(key, path=path)
+
+    def _write(self, key: str, content) -> None:
+        """Write a blob atomically, compressed if that pays off."""
+        existing = self._find(key)
+        if existing is not None:
+            try:
+                os.utime(existing)
+                return
+            except FileNotFoundError:
+                # Evicted since _find: store it again
+                pass
+
+        compressed = zlib.compress(content, 6)
+        if len(compressed) <= len(content) * (1 - self.min_compression_saving):
+            path, data = self._path(key, COMPRESSED_SUFFIX), compressed
+        else:
+            path, data = self._path(key, RAW_SUFFIX), content
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def evict_expired(self) -> int:
+        """
+        Delete blobs unused for longer than the TTL.
+
+        Returns:
+            Number of blobs deleted
+        """
+        cutoff = time.time() - self.ttl_seconds
+        evicted = 0
+        for path in self.store_dir.glob("*/*"):
+            if path.suffix not in (RAW_SUFFIX, COMPRESSED_SUFFIX):
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    evicted += 1
+            except FileNotFoundError:
+                continue
+
+        if evicted:
+            logger.info(f"Evicted {evicted} expired blobs from the content store")
+        return evicted
+
+
+# Singleton instance
+content_store = ContentStore()
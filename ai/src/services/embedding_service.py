@@ -3,14 +3,49 @@ Embedding Service
 
 Service for generating and managing text embeddings using Azure OpenAI.
 """
-from typing import Any
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Any, Optional
 
+import numpy as np
 from openai import AzureOpenAI
 
 from src.config import settings
 from src.services.mongo_service import MongoDBVectorService
 
 
+class EmbeddingCache:
+    """In-memory LRU cache of normalised embedding vectors keyed by text hash."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._vectors: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Cache key for a text."""
+        return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Get the cached vector for a text."""
+        key = self.key(text)
+        vector = self._vectors.get(key)
+        if vector is not None:
+            self._vectors.move_to_end(key)
+        return vector
+
+    def put(self, text: str, vector: np.ndarray) -> None:
+        """Cache the vector for a text."""
+        self._vectors[self.key(text)] = vector
+        while len(self._vectors) > self.max_entries:
+            self._vectors.popitem(last=False)
+
+
+# Shared across service instances so job-side vectors are reused everywhere
+embedding_cache = EmbeddingCache(settings.embedding_cache_size)
+
+
 class EmbeddingService:
     """Service for text embeddings using Azure OpenAI and MongoDB."""
 
@@ -66,7 +101,8 @@ class EmbeddingService:
             List of embeddings
         """
         try:
-            response = self.client.embeddings.create(
+            response = await asyncio.to_thread(
+                self.client.embeddings.create,
                 input=texts,
                 model=self.deployment_name,
             )
@@ -77,6 +113,54 @@ class EmbeddingService:
             print(f"Batch embedding error: {e}")
             return [[] for _ in texts]
 
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts as a matrix of unit vectors, using the shared cache.
+        
+        Only texts missing from the cache are sent to Azure OpenAI, in as few
+        batch requests as possible. Texts that fail to embed get zero rows
+        (similarity 0 to everything) and are not cached.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Array of shape (len(texts), dimensions)
+        """
+        vectors: dict[str, np.ndarray] = {}
+        misses = []
+        
+        for text in dict.fromkeys(texts):
+            cached = embedding_cache.get(text)
+            if cached is not None:
+                vectors[text] = cached
+            else:
+                misses.append(text)
+        
+        batch_size = settings.embedding_batch_size
+        for start in range(0, len(misses), batch_size):
+            batch = misses[start:start + batch_size]
+            embeddings = await self.generate_batch_embeddings(batch)
+            
+            for text, embedding in zip(batch, embeddings):
+                if not embedding:
+                    continue
+                vector = np.asarray(embedding, dtype=np.float32)
+                norm = np.linalg.norm(vector)
+                if norm > 0:
+                    vector = vector / norm
+                embedding_cache.put(text, vector)
+                vectors[text] = vector
+        
+        dimensions = next((len(v) for v in vectors.values()), 0)
+        matrix = np.zeros((len(texts), dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vector = vectors.get(text)
+            if vector is not None:
+                matrix[row] = vector
+        
+        return matrix
+
     async def store_embedding(
         self,
         doc_id: str,
@@ -97,7 +181,8 @@ class EmbeddingService:
             Success status
         """
         try:
-            self.vector_db.store_embedding(
+            await asyncio.to_thread(
+                self.vector_db.store_embedding,
                 doc_id=doc_id,
                 embedding=embedding,
                 metadata=metadata or {},
@@ -1,84 +1,381 @@
 """
 File Downloader Service
 Downloads files from Cloudinary URLs for processing.
+
+- One long-lived, connection-pooled HTTP client is shared by all downloads.
+- Bodies are streamed and the download is aborted as soon as it exceeds
+  ``max_cv_size_mb``.
+- Bodies larger than ``download_spool_threshold_kb`` are spooled to the
+  temp dir and exposed as a memory-mapped buffer instead of a bytes copy.
+- Multi-file downloads run concurrently, bounded globally and per host,
+  with per-file retries and per-file error reporting.
 """
+import asyncio
 import httpx
 import logging
+import mmap
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, NamedTuple, Optional, Union
+from urllib.parse import urlsplit
+
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from src.config import settings
+from src.models.backend_integration import FileMetadata
 
 logger = logging.getLogger(__name__)
 
+CHUNK_SIZE = 64 * 1024
+
+
+class FileTooLargeError(ValueError):
+    """Raised when a download exceeds the configured size cap."""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Transient failures worth retrying: network errors, 429 and 5xx."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class DownloadedFile:
+    """A downloaded file, held in memory or spooled to disk."""
+
+    def __init__(
+        self,
+        filename: str,
+        data: Optional[bytes] = None,
+        path: Optional[Path] = None,
+        size: int = 0,
+    ):
+        self.filename = filename
+        self.path = path
+        self.size = len(data) if data is not None else size
+        self._data = data
+        self._mmap: Optional[mmap.mmap] = None
+
+    @property
+    def buffer(self) -> Union[bytes, mmap.mmap]:
+        """File content; memory-mapped (read-only) when spooled to disk."""
+        if self._data is not None:
+            return self._data
+        if self._mmap is None:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def read(self) -> bytes:
+        """Copy of the full content."""
+        return bytes(self.buffer)
+
+    def close(self) -> None:
+        """Release the mapping and delete the spool file."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+            self.path = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> "DownloadedFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class DownloadOutcome(NamedTuple):
+    """Result of one file in a multi-file download."""
+
+    index: int
+    filename: str
+    url: str
+    file: Optional[DownloadedFile]
+    error: Optional[str]
+    attempts: int
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was downloaded."""
+        return self.file is not None
+
 
 class FileDownloader:
     """Service for downloading files from URLs."""
-    
-    def __init__(self):
-        self.temp_dir = Path("/tmp/veritalent_ai")
+
+    def __init__(
+        self,
+        max_size_mb: Optional[int] = None,
+        spool_threshold_kb: Optional[int] = None,
+    ):
+        self.temp_dir = Path(settings.download_temp_dir)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
-    
+        self.max_bytes = (max_size_mb or settings.max_cv_size_mb) * 1024 * 1024
+        self.spool_threshold = (spool_threshold_kb or settings.download_spool_threshold_kb) * 1024
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=settings.download_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=settings.download_max_connections,
+                    max_keepalive_connections=settings.download_max_keepalive_connections,
+                ),
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def fetch(self, url: str, original_filename: str) -> DownloadedFile:
+        """
+        Stream a file from a URL, enforcing the size cap.
+
+        Args:
+            url: Cloudinary secure_url
+            original_filename: Original filename
+
+        Returns:
+            Downloaded file (the caller must close it)
+
+        Raises:
+            FileTooLargeError: If the body exceeds the size cap
+            httpx.HTTPError: If the request fails
+        """
+        logger.info(f"Downloading file from Cloudinary: {original_filename}")
+
+        async with self.client.stream("GET", url) as response:
+            response.raise_for_status()
+
+            declared = int(response.headers.get("content-length") or 0)
+            if declared > self.max_bytes:
+                raise FileTooLargeError(
+                    f"{original_filename} is {declared} bytes (limit {self.max_bytes})"
+                )
+
+            buffer = bytearray()
+            spool = None
+            size = 0
+
+            try:
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise FileTooLargeError(
+                            f"{original_filename} exceeds {self.max_bytes} bytes"
+                        )
+
+                    if spool is not None:
+                        spool.write(chunk)
+                        continue
+
+                    buffer += chunk
+                    if len(buffer) > self.spool_threshold:
+                        spool = tempfile.NamedTemporaryFile(
+                            dir=self.temp_dir, suffix=Path(original_filename).suffix, delete=False
+                        )
+                        spool.write(buffer)
+                        buffer = bytearray()
+            except BaseException:
+                if spool is not None:
+                    spool.close()
+                    os.unlink(spool.name)
+                raise
+
+        logger.info(f"Downloaded {size} bytes for {original_filename}")
+
+        if spool is None:
+            return DownloadedFile(original_filename, data=bytes(buffer))
+
+        spool.close()
+        return DownloadedFile(original_filename, path=Path(spool.name), size=size)
+
     async def download_from_url(
         self,
         url: str,
         original_filename: str,
-    ) -> Optional[bytes]:
+    ) -> Optional[DownloadedFile]:
         """
         Download file from Cloudinary URL.
-        
+
         Args:
             url: Cloudinary secure_url
             original_filename: Original filename for logging
-            
+
         Returns:
-            File content as bytes, or None if download fails
+            Downloaded file (the caller must close it), or None if download fails
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info(f"Downloading file from Cloudinary: {original_filename}")
-                response = await client.get(url)
-                response.raise_for_status()
-                
-                content = response.content
-                logger.info(
-                    f"Downloaded {len(content)} bytes for {original_filename}"
-                )
-                return content
-                
+            return await self.fetch(url, original_filename)
+
+        except FileTooLargeError as e:
+            logger.error(f"Rejected download from {url}: {e}")
+            return None
         except httpx.HTTPError as e:
             logger.error(f"Failed to download from {url}: {e}")
             return None
         except Exception as e:
             logger.error(f"Unexpected error downloading {original_filename}: {e}")
             return None
-    
+
+    def _retrying(self, max_attempts: Optional[int] = None) -> AsyncRetrying:
+        """Retry policy for transient download failures."""
+        return AsyncRetrying(
+            stop=stop_after_attempt(max_attempts or settings.download_max_attempts),
+            wait=wait_exponential_jitter(initial=settings.download_retry_backoff_seconds),
+            retry=retry_if_exception(is_retryable),
+            reraise=True,
+        )
+
+    async def fetch_with_retry(
+        self,
+        url: str,
+        original_filename: str,
+        max_attempts: Optional[int] = None,
+    ) -> DownloadedFile:
+        """
+        Stream a file from a URL, retrying transient failures with backoff.
+
+        Raises:
+            FileTooLargeError: If the body exceeds the size cap
+            httpx.HTTPError: If the last attempt fails
+        """
+        async for attempt in self._retrying(max_attempts):
+            with attempt:
+                return await self.fetch(url, original_filename)
+
+    async def _download_with_retry(
+        self,
+        index: int,
+        url: Optional[str],
+        filename: str,
+        limiter: asyncio.Semaphore,
+        host_limiters: dict[str, asyncio.Semaphore],
+        per_host_limit: int,
+        max_attempts: int,
+    ) -> DownloadOutcome:
+        """Download one file, retrying transient failures with backoff."""
+        if not url:
+            logger.warning(f"No URL provided for {filename}")
+            return DownloadOutcome(index, filename, "", None, "No URL provided", 0)
+
+        host = urlsplit(url).netloc
+        host_limiter = host_limiters.setdefault(host, asyncio.Semaphore(per_host_limit))
+        attempts = 0
+
+        try:
+            async for attempt in self._retrying(max_attempts):
+                with attempt:
+                    attempts = attempt.retry_state.attempt_number
+                    # Slots are held per attempt, not while backing off
+                    async with host_limiter, limiter:
+                        file = await self.fetch(url, filename)
+            return DownloadOutcome(index, filename, url, file, None, attempts)
+
+        except Exception as e:
+            logger.error(f"Failed to download {filename} after {attempts} attempt(s): {e}")
+            return DownloadOutcome(index, filename, url, None, str(e) or type(e).__name__, attempts)
+
+    async def iter_downloads(
+        self,
+        files: list[Union[FileMetadata, dict[str, str]]],
+        ordered: bool = False,
+        max_concurrency: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ) -> AsyncIterator[DownloadOutcome]:
+        """
+        Download files concurrently, yielding each outcome as it is ready.
+
+        Args:
+            files: FileMetadata or dicts with 'url' and 'original_name' keys
+            ordered: Yield in input order instead of completion order
+            max_concurrency: Maximum downloads in flight overall
+            per_host_limit: Maximum downloads in flight per host
+            max_attempts: Attempts per file (transient errors only)
+
+        Yields:
+            One outcome per input file; the caller must close each file
+        """
+        limiter = asyncio.Semaphore(max_concurrency or settings.download_max_concurrency)
+        host_limiters: dict[str, asyncio.Semaphore] = {}
+        per_host_limit = per_host_limit or settings.download_per_host_limit
+        max_attempts = max_attempts or settings.download_max_attempts
+
+        tasks = []
+        for index, file_info in enumerate(files):
+            if isinstance(file_info, FileMetadata):
+                url, filename = file_info.url, file_info.original_name
+            else:
+                url, filename = file_info.get("url"), file_info.get("original_name", "unknown")
+
+            tasks.append(asyncio.create_task(self._download_with_retry(
+                index, url, filename, limiter, host_limiters, per_host_limit, max_attempts,
+            )))
+
+        yielded = set()
+        try:
+            if ordered:
+                for task in tasks:
+                    outcome = await task
+                    yielded.add(outcome.index)
+                    yield outcome
+            else:
+                for next_done in asyncio.as_completed(tasks):
+                    outcome = await next_done
+                    yielded.add(outcome.index)
+                    yield outcome
+        finally:
+            # Early exit: stop the rest and drop files nobody will close
+            for task in tasks:
+                task.cancel()
+            for index, task in enumerate(tasks):
+                if index in yielded or not task.done() or task.cancelled():
+                    continue
+                outcome = task.result()
+                if outcome.file is not None:
+                    outcome.file.close()
+
     async def download_multiple(
         self,
-        files: list[dict[str, str]],
-    ) -> list[tuple[str, bytes]]:
+        files: list[Union[FileMetadata, dict[str, str]]],
+        max_concurrency: Optional[int] = None,
+    ) -> list[DownloadOutcome]:
         """
-        Download multiple files from URLs.
-        
+        Download multiple files from URLs concurrently.
+
         Args:
-            files: List of dicts with 'url' and 'original_name' keys
-            
+            files: FileMetadata or dicts with 'url' and 'original_name' keys
+            max_concurrency: Maximum downloads in flight overall
+
         Returns:
-            List of tuples (filename, content)
+            One outcome per file, in input order (failures carry an error);
+            the caller must close each downloaded file
         """
-        results = []
-        
-        for file_info in files:
-            url = file_info.get("url")
-            filename = file_info.get("original_name", "unknown")
-            
-            if not url:
-                logger.warning(f"No URL provided for {filename}")
-                continue
-            
-            content = await self.download_from_url(url, filename)
-            if content:
-                results.append((filename, content))
-        
-        return results
+        return [
+            outcome async for outcome in self.iter_downloads(
+                files, ordered=True, max_concurrency=max_concurrency
+            )
+        ]
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 
 # Singleton instance
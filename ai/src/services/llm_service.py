@@ -6,7 +6,7 @@ Uses streaming for reasoning model to get fast responses.
 """
 import json
 import logging
-from typing import Any
+from typing import Any, Optional
 import requests
 from concurrent.futures import ThreadPoolExecutor
 
@@ -17,6 +17,20 @@ logger = logging.getLogger(__name__)
 # Thread pool for running sync requests in async context
 _executor = ThreadPoolExecutor(max_workers=10)
 
+CV_PERSONAL_INFO_FIELDS = ("name", "email", "phone", "location", "linkedin", "github", "portfolio")
+
+# Output spec for each top-level CV field (personal_info is built per call)
+CV_FIELD_SPECS = {
+    "personal_info": None,
+    "summary": "brief professional summary",
+    "education": "[{institution, degree, field_of_study, start_date, end_date, grade}]",
+    "work_experience": "[{company, role, start_date, end_date, is_current, location, responsibilities[], achievements[], technologies[]}]",
+    "skills": "[skill names]",
+    "certifications": "[{name, issuer, date_obtained}]",
+    "projects": "[{name, description, technologies[], url}]",
+    "languages": "[language names]",
+}
+
 
 def _parse_sse_stream(response: requests.Response) -> str:
     """
@@ -145,29 +159,84 @@ class LLMService:
         """Parse CV and extract structured information (alias for extract_cv_data)."""
         return await self.extract_cv_data(cv_text)
 
-    async def extract_cv_data(self, text: str) -> dict[str, Any]:
+    def _cv_prompt(self, fields: list[str], known: Optional[dict[str, Any]] = None) -> str:
+        """
+        System prompt asking for some CV fields.
+
+        Fields already extracted by rules (``known``) are left out: personal
+        info fields are dropped, and only skills beyond the known ones are
+        requested.
+        """
+        known = known or {}
+        known_personal = {k for k, v in (known.get("personal_info") or {}).items() if v and k != "name"}
+        specs = []
+
+        for field in fields:
+            spec = CV_FIELD_SPECS[field]
+            if field == "personal_info":
+                spec = "{" + ", ".join(f for f in CV_PERSONAL_INFO_FIELDS if f not in known_personal) + "}"
+            elif field == "skills" and known.get("skills"):
+                spec += " - only skills NOT in this already-extracted list: " + ", ".join(known["skills"])
+            specs.append(f"- {field}: {spec}")
+
+        specs.append("- confidence: float 0-1 indicating extraction confidence")
+        field_list = "\n".join(specs)
+
+        return f"""You are an expert CV parser. Extract structured information from the CV text.
+Return a JSON object with these fields:
+{field_list}
+
+Be thorough but only include information actually present in the CV."""
+
+    async def extract_cv_section(
+        self,
+        fields: list[str],
+        text: str,
+        known: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """
+        Extract some CV fields from one section of a CV.
+
+        Args:
+            fields: Top-level CV fields to extract (keys of CV_FIELD_SPECS)
+            text: Section text
+            known: Fields already extracted by rules
+
+        Returns:
+            Dictionary with the requested fields (empty, with ``error`` and
+            ``fallback`` set, if the call fails)
+        """
+        try:
+            content = await self._call_llm(
+                system_prompt=self._cv_prompt(fields, known),
+                user_content=f"Parse this CV section:\n\n{text}",
+            )
+            return self._parse_json_response(content)
+
+        except Exception as e:
+            logger.error(f"Azure AI CV section parsing failed ({', '.join(fields)}): {e}")
+            empty = {field: {} if field == "personal_info" else [] for field in fields}
+            if "summary" in empty:
+                empty["summary"] = None
+            return {**empty, "confidence": 0.0, "error": str(e), "fallback": True}
+
+    async def extract_cv_data(
+        self,
+        text: str,
+        known: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
         """
         Extract structured data from CV text using Azure AI (Grok).
         
         Args:
             text: Raw CV text
+            known: Fields already extracted by rules (``personal_info``
+                fields and ``skills``); the model is not asked for them
             
         Returns:
             Dictionary with extracted CV components
         """
-        system_prompt = """You are an expert CV parser. Extract structured information from the CV text.
-Return a JSON object with these fields:
-- personal_info: {name, email, phone, location, linkedin, github, portfolio}
-- summary: brief professional summary
-- education: [{institution, degree, field_of_study, start_date, end_date, grade}]
-- work_experience: [{company, role, start_date, end_date, is_current, location, responsibilities[], achievements[], technologies[]}]
-- skills: [skill names]
-- certifications: [{name, issuer, date_obtained}]
-- projects: [{name, description, technologies[], url}]
-- languages: [language names]
-- confidence: float 0-1 indicating extraction confidence
-
-Be thorough but only include information actually present in the CV."""
+        system_prompt = self._cv_prompt(list(CV_FIELD_SPECS), known)
 
         try:
             logger.info(f"Calling Azure AI for CV parsing with model: {self.model} (streaming)")
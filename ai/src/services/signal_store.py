@@ -0,0 +1,264 @@
+"""
+Competency Signal Store
+
+Durable store of the latest competency signals per talent, so profile views
+read stored signals instead of regenerating them.
+
+- SQLite file (``competency_store_path``) as the local backend; every save
+  is a new version, tagged with the fingerprint of the inputs it came from.
+  Saving signals for an unchanged fingerprint is a no-op.
+- In-memory read-through LRU of the latest version per talent.
+- The evidence index each talent's signals were scored from is kept in the
+  same file (one row per talent, replaced on every change), so evidence
+  events can be applied after a restart.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from pydantic import ValidationError
+
+from src.config import settings
+from src.models.competency import CompetencySignal
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS competency_signals (
+    talent_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    signals TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (talent_id, version)
+);
+CREATE TABLE IF NOT EXISTS competency_evidence (
+    talent_id TEXT PRIMARY KEY,
+    skills TEXT NOT NULL,
+    items TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+class StoredSignals(NamedTuple):
+    """A stored version of a talent's signals."""
+
+    talent_id: str
+    version: int
+    fingerprint: str
+    signals: list[CompetencySignal]
+    created_at: str
+
+
+class StoredEvidence(NamedTuple):
+    """A talent's declared skills and evidence index rows (see EvidenceIndex.dump())."""
+
+    talent_id: str
+    skills: list[str]
+    items: list
+    updated_at: str
+
+
+def input_fingerprint(inputs: Any) -> str:
+    """Stable hash of the inputs signals were generated from."""
+    payload = json.dumps(inputs, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompetencySignalStore:
+    """Versioned SQLite store of competency signals with an LRU in front."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        cache_size: Optional[int] = None,
+        max_versions: Optional[int] = None,
+    ):
+        self.path = Path(path or settings.competency_store_path)
+        self.cache_size = cache_size or settings.competency_store_cache_size
+        self.max_versions = max_versions or settings.competency_store_max_versions
+        self._cache: OrderedDict[str, StoredSignals] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (called from worker threads)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _remember(self, stored: StoredSignals) -> None:
+        """Cache the latest version of a talent's signals."""
+        self._cache[stored.talent_id] = stored
+        self._cache.move_to_end(stored.talent_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def get(self, talent_id: str) -> Optional[StoredSignals]:
+        """
+        Latest stored signals for a talent.
+
+        Args:
+            talent_id: Talent identifier
+
+        Returns:
+            The latest version, or None if nothing is stored
+        """
+        stored = self._cache.get(talent_id)
+        if stored is not None:
+            self._cache.move_to_end(talent_id)
+            return stored
+
+        stored = await asyncio.to_thread(self._read_latest, talent_id)
+        if stored is not None:
+            self._remember(stored)
+        return stored
+
+    async def save(
+        self,
+        talent_id: str,
+        fingerprint: str,
+        signals: list[CompetencySignal],
+    ) -> StoredSignals:
+        """
+        Store signals as a new version, unless the fingerprint is unchanged.
+
+        Args:
+            talent_id: Talent identifier
+            fingerprint: Fingerprint of the inputs the signals came from
+            signals: Complete signal set
+
+        Returns:
+            The stored (or already current) version
+        """
+        latest = await self.get(talent_id)
+        if latest is not None and latest.fingerprint == fingerprint:
+            return latest
+
+        payload = json.dumps([signal.model_dump(mode="json") for signal in signals])
+        stored = await asyncio.to_thread(self._write, talent_id, fingerprint, payload, signals)
+        self._remember(stored)
+        return stored
+
+    async def get_evidence(self, talent_id: str) -> Optional[StoredEvidence]:
+        """Stored evidence index of a talent, or None if none is stored."""
+        return await asyncio.to_thread(self._read_evidence, talent_id)
+
+    async def save_evidence(self, talent_id: str, skills: list[str], items: list) -> None:
+        """
+        Store a talent's evidence index, replacing the previous one.
+
+        Args:
+            talent_id: Talent identifier
+            skills: Declared skill names
+            items: EvidenceIndex.dump() rows
+        """
+        await asyncio.to_thread(self._write_evidence, talent_id, json.dumps(skills), json.dumps(items))
+
+    async def delete(self, talent_id: str) -> None:
+        """Remove every version of a talent's signals, and its evidence."""
+        self._cache.pop(talent_id, None)
+        await asyncio.to_thread(self._delete, talent_id)
+
+    def clear_cache(self) -> None:
+        """Drop the in-memory tier (stored versions are kept)."""
+        self._cache.clear()
+
+    def _read_latest(self, talent_id: str) -> Optional[StoredSignals]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT version, fingerprint, signals, created_at FROM competency_signals "
+                "WHERE talent_id = ? ORDER BY version DESC LIMIT 1",
+                (talent_id,),
+            ).fetchone()
+
+        if row is None:
+            return None
+        version, fingerprint, payload, created_at = row
+        try:
+            signals = [CompetencySignal.model_validate(item) for item in json.loads(payload)]
+        except ValidationError as e:
+            # Written out of bounds by an older build: regenerate rather than fail every read
+            logger.warning(f"Ignoring invalid stored signals for {talent_id} (version {version}): {e}")
+            return None
+        return StoredSignals(talent_id, version, fingerprint, signals, created_at)
+
+    def _write(
+        self,
+        talent_id: str,
+        fingerprint: str,
+        payload: str,
+        signals: list[CompetencySignal],
+    ) -> StoredSignals:
+        created_at = datetime.utcnow().isoformat()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                (current,) = conn.execute(
+                    "SELECT COALESCE(MAX(version), 0) FROM competency_signals WHERE talent_id = ?",
+                    (talent_id,),
+                ).fetchone()
+                version = current + 1
+                conn.execute(
+                    "INSERT INTO competency_signals VALUES (?, ?, ?, ?, ?)",
+                    (talent_id, version, fingerprint, payload, created_at),
+                )
+                # Keep a short history per talent
+                conn.execute(
+                    "DELETE FROM competency_signals WHERE talent_id = ? AND version <= ?",
+                    (talent_id, version - self.max_versions),
+                )
+
+        return StoredSignals(talent_id, version, fingerprint, list(signals), created_at)
+
+    def _read_evidence(self, talent_id: str) -> Optional[StoredEvidence]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT skills, items, updated_at FROM competency_evidence WHERE talent_id = ?",
+                (talent_id,),
+            ).fetchone()
+
+        if row is None:
+            return None
+        skills, items, updated_at = row
+        return StoredEvidence(talent_id, json.loads(skills), json.loads(items), updated_at)
+
+    def _write_evidence(self, talent_id: str, skills: str, items: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO competency_evidence VALUES (?, ?, ?, ?)",
+                    (talent_id, skills, items, datetime.utcnow().isoformat()),
+                )
+
+    def _delete(self, talent_id: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM competency_signals WHERE talent_id = ?", (talent_id,))
+                conn.execute("DELETE FROM competency_evidence WHERE talent_id = ?", (talent_id,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Singleton instance
+signal_store = CompetencySignalStore()
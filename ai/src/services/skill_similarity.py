@@ -0,0 +1,167 @@
+"""
+Skill Similarity Service
+
+Precomputed pairwise similarity between every skill in the skills taxonomy.
+
+The matrix is built once with:
+
+    uv run python -m src.services.skill_similarity
+
+which embeds each taxonomy skill (name plus aliases) in a single batch and
+writes a compact float16 matrix to ``settings.skill_similarity_path``. At
+runtime, relatedness between two taxonomy skills ("React" vs "Next.js") is
+an O(1) array lookup with no embedding calls.
+"""
+import argparse
+import asyncio
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.config import settings
+from src.utils.skills_taxonomy import SkillsTaxonomy, get_skills_taxonomy
+
+logger = logging.getLogger(__name__)
+
+
+class SkillSimilarityIndex:
+    """Lookup over the precomputed taxonomy similarity matrix."""
+
+    def __init__(
+        self,
+        taxonomy: SkillsTaxonomy,
+        skill_ids: list[str],
+        matrix: np.ndarray,
+    ):
+        self.taxonomy = taxonomy
+        self.skill_ids = skill_ids
+        self.matrix = matrix
+        self._position = {skill_id: i for i, skill_id in enumerate(skill_ids)}
+
+    @classmethod
+    def load(
+        cls,
+        path: Optional[Path] = None,
+        taxonomy: Optional[SkillsTaxonomy] = None,
+    ) -> Optional["SkillSimilarityIndex"]:
+        """Load the index from disk; returns None if it has not been built."""
+        path = Path(path or settings.skill_similarity_path)
+        if not path.exists():
+            logger.info(f"Skill similarity matrix not found at {path}")
+            return None
+
+        with np.load(path, allow_pickle=False) as data:
+            skill_ids = [str(s) for s in data["skill_ids"]]
+            matrix = data["matrix"]
+
+        return cls(taxonomy or get_skills_taxonomy(), skill_ids, matrix)
+
+    def position(self, term: str) -> Optional[int]:
+        """Matrix row of a skill name or alias, if it is in the taxonomy."""
+        skill_id = self.taxonomy.resolve(term)
+        return self._position.get(skill_id) if skill_id else None
+
+    def similarity(self, term1: str, term2: str) -> Optional[float]:
+        """
+        Similarity between two skills (0-1).
+
+        Returns None if either term is not a taxonomy skill.
+        """
+        i, j = self.position(term1), self.position(term2)
+        if i is None or j is None:
+            return None
+        return float(self.matrix[i, j])
+
+    def similarity_block(self, rows: list[int], columns: list[int]) -> np.ndarray:
+        """Similarity sub-matrix for taxonomy positions (rows x columns)."""
+        return self.matrix[np.ix_(rows, columns)].astype(np.float32)
+
+    def neighbours(
+        self,
+        term: str,
+        limit: int = 5,
+        min_similarity: float = 0.0,
+    ) -> list[tuple[str, float]]:
+        """Most similar taxonomy skills to a skill, as (skill name, similarity)."""
+        i = self.position(term)
+        if i is None:
+            return []
+
+        row = self.matrix[i].astype(np.float32)
+        order = np.argsort(-row, kind="stable")
+
+        results = []
+        for j in order.tolist():
+            if j == i:
+                continue
+            if row[j] < min_similarity or len(results) >= limit:
+                break
+            skill = self.taxonomy.get(self.skill_ids[j])
+            results.append((skill.name if skill else self.skill_ids[j], float(row[j])))
+
+        return results
+
+
+async def build_skill_similarity_matrix(
+    output_path: Optional[Path] = None,
+    taxonomy: Optional[SkillsTaxonomy] = None,
+) -> Path:
+    """
+    Embed every taxonomy skill once and store the similarity matrix.
+
+    Args:
+        output_path: Destination .npz file (defaults to the configured path)
+        taxonomy: Taxonomy to embed (defaults to data/skills_taxonomy.json)
+
+    Returns:
+        Path of the written matrix
+    """
+    from src.services.embedding_service import EmbeddingService
+
+    taxonomy = taxonomy or get_skills_taxonomy()
+    output_path = Path(output_path or settings.skill_similarity_path)
+
+    texts = [
+        ", ".join((skill.name, *skill.aliases)) for skill in taxonomy.skills
+    ]
+    vectors = await EmbeddingService().embed_texts(texts)
+
+    if vectors.shape[1] == 0 or not np.any(vectors, axis=1).all():
+        raise RuntimeError("Embedding failed for one or more taxonomy skills")
+
+    matrix = np.clip(vectors @ vectors.T, 0.0, 1.0).astype(np.float16)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        output_path,
+        skill_ids=np.array([skill.id for skill in taxonomy.skills]),
+        matrix=matrix,
+        version=np.array(taxonomy.version),
+    )
+
+    logger.info(f"Wrote {matrix.shape[0]}x{matrix.shape[1]} skill similarity matrix to {output_path}")
+    return output_path
+
+
+@lru_cache
+def get_skill_similarity_index() -> Optional[SkillSimilarityIndex]:
+    """Get the cached similarity index (None if it has not been built)."""
+    return SkillSimilarityIndex.load()
+
+
+def main() -> None:
+    """Command-line entry point for building the similarity matrix."""
+    parser = argparse.ArgumentParser(description="Build the skill similarity matrix")
+    parser.add_argument("--output", type=Path, default=None, help="Output .npz path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    path = asyncio.run(build_skill_similarity_matrix(args.output))
+    print(f"Skill similarity matrix written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Extracted Text Cache
+
+Caches text extracted from documents, keyed by a hash of the document
+content, so a repeat upload of the same file skips PDF/DOCX parsing.
+
+- Memory tier: LRU bounded by total text size.
+- Disk tier: zlib-compressed files under ``text_cache_dir``, bounded by
+  total size; least recently used files are pruned first.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Hash large documents off the event loop (hashlib releases the GIL)
+HASH_IN_THREAD_BYTES = 1024 * 1024
+
+
+class ExtractedTextCache:
+    """Two-tier (memory + compressed disk) cache of extracted text."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_memory_mb: Optional[int] = None,
+        max_disk_mb: Optional[int] = None,
+    ):
+        self.cache_dir = Path(cache_dir or settings.text_cache_dir)
+        self.max_memory_chars = (max_memory_mb or settings.text_cache_memory_mb) * 1024 * 1024
+        self.max_disk_bytes = (max_disk_mb or settings.text_cache_disk_mb) * 1024 * 1024
+        self._texts: OrderedDict[str, str] = OrderedDict()
+        self._memory_chars = 0
+        self._disk_bytes: Optional[int] = None
+
+    @staticmethod
+    async def key(content, variant: str = "") -> str:
+        """
+        Cache key for document content.
+
+        Args:
+            content: Document bytes (or any buffer, e.g. a memory map)
+            variant: Extraction settings that change the output
+
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.sha256(variant.encode("utf-8"))
+        if len(content) > HASH_IN_THREAD_BYTES:
+            await asyncio.to_thread(digest.update, content)
+        else:
+            digest.update(content)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Disk location of an entry (sharded by key prefix)."""
+        return self.cache_dir / key[:2] / f"{key}.z"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get cached text, checking memory then disk."""
+        text = self._texts.get(key)
+        if text is not None:
+            self._texts.move_to_end(key)
+            return text
+
+        try:
+            text = await asyncio.to_thread(self._read, key)
+        except Exception as e:
+            logger.warning(f"Text cache read failed for {key[:12]}: {e}")
+            return None
+
+        if text is not None:
+            self._remember(key, text)
+        return text
+
+    async def put(self, key: str, text: str) -> None:
+        """Cache text in memory and on disk."""
+        self._remember(key, text)
+        try:
+            await asyncio.to_thread(self._write, key, text)
+        except Exception as e:
+            logger.warning(f"Text cache write failed for {key[:12]}: {e}")
+
+    def _remember(self, key: str, text: str) -> None:
+        """Add to the memory tier, evicting least recently used entries."""
+        previous = self._texts.pop(key, None)
+        if previous is not None:
+            self._memory_chars -= len(previous)
+
+        self._texts[key] = text
+        self._memory_chars += len(text)
+
+        while self._memory_chars > self.max_memory_chars and len(self._texts) > 1:
+            _, evicted = self._texts.popitem(last=False)
+            self._memory_chars -= len(evicted)
+
+    def _read(self, key: str) -> Optional[str]:
+        """Read and decompress an entry from disk."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        # Reads count as use for pruning
+        os.utime(path)
+        return zlib.decompress(data).decode("utf-8")
+
+    def _write(self, key: str, text: str) -> None:
+        """Compress an entry to disk, atomically."""
+        path = self._path(key)
+        if path.exists():
+            return
+
+        data = zlib.compress(text.encode("utf-8"), 6)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(p.stat().st_size for p in self.cache_dir.glob("*/*.z"))
+        else:
+            self._disk_bytes += len(data)
+
+        if self._disk_bytes > self.max_disk_bytes:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Delete least recently used files until under 90% of the disk budget."""
+        entries = []
+        for path in self.cache_dir.glob("*/*.z"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_disk_bytes * 0.9
+
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+        self._disk_bytes = total
+
+    def clear_memory(self) -> None:
+        """Drop the memory tier (the disk tier is kept)."""
+        self._texts.clear()
+        self._memory_chars = 0
+
+
+# Singleton instance
+text_cache = ExtractedTextCache()
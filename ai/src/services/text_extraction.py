@@ -0,0 +1,552 @@
+"""
+Text Extraction Service
+
+Extracts text from PDF and DOCX documents in a process pool so CPU-bound
+parsing never blocks the event loop.
+
+- Workers are recycled after ``extraction_max_tasks_per_child`` documents
+  to bound memory growth from parser libraries.
+- Each document has a timeout; the pool a job overran on is killed and
+  rebuilt, so one pathological file cannot stall other requests. Other jobs
+  caught in a torn-down pool are resubmitted once to the fresh pool.
+- PDFs are capped at ``extraction_max_pages`` pages.
+- Long PDFs are split into page ranges extracted in parallel across
+  workers and streamed back in page order, stopping early once the
+  character budget is reached.
+- Documents already on disk are passed to workers by path, so their
+  content is never copied through the pool.
+- Results are cached by content hash, so re-uploads skip parsing.
+- DOCX files are read by streaming the main document XML straight out of
+  the zip (python-docx is only a fallback).
+"""
+import asyncio
+import io
+import logging
+import multiprocessing
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import AsyncIterator, Optional, Union
+from xml.etree import ElementTree
+
+from src.config import settings
+from src.services.text_cache import ExtractedTextCache, text_cache
+
+logger = logging.getLogger(__name__)
+
+PDF_MIME = "application/pdf"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Raw document bytes, or the path of a document on disk
+DocumentSource = Union[bytes, str]
+
+# Bump when extraction output changes, to invalidate cached text
+EXTRACTOR_VERSION = 2
+
+# Pools a job may run on before a crashing pool fails it
+MAX_POOL_ATTEMPTS = 2
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+OFFICE_DOCUMENT_REL = "/officeDocument"
+
+
+class DocumentExtractionError(RuntimeError):
+    """Raised when text cannot be extracted from a document."""
+
+
+class DocumentExtractionTimeout(DocumentExtractionError):
+    """Raised when extraction exceeds the per-document timeout."""
+
+
+def _as_file(source: DocumentSource):
+    """File path as-is, bytes wrapped in a stream."""
+    return source if isinstance(source, str) else io.BytesIO(source)
+
+
+def _open_fitz(source: DocumentSource):
+    """Open a PDF with PyMuPDF from bytes or a path."""
+    import fitz  # PyMuPDF
+
+    if isinstance(source, str):
+        return fitz.open(source)
+    return fitz.open(stream=source, filetype="pdf")
+
+
+def extract_pdf_sync(content: DocumentSource, max_pages: Optional[int] = None) -> str:
+    """
+    Extract text from PDF content (runs in a worker process).
+
+    Args:
+        content: PDF file content or path
+        max_pages: Maximum number of pages to read
+
+    Returns:
+        Extracted text
+    """
+    try:
+        with _open_fitz(content) as doc:
+            page_count = doc.page_count if max_pages is None else min(doc.page_count, max_pages)
+            return "\n\n".join(doc[i].get_text() for i in range(page_count))
+
+    except ImportError:
+        pass
+
+    # Fallback to pdfplumber
+    try:
+        import pdfplumber
+
+        with pdfplumber.open(_as_file(content)) as pdf:
+            text_parts = []
+            for page in pdf.pages[:max_pages]:
+                text = page.extract_text()
+                if text:
+                    text_parts.append(text)
+
+            return "\n\n".join(text_parts)
+
+    except ImportError:
+        pass
+
+    # Fallback to pypdf
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(_as_file(content))
+        text_parts = []
+        for page in reader.pages[:max_pages]:
+            text = page.extract_text()
+            if text:
+                text_parts.append(text)
+
+        return "\n\n".join(text_parts)
+
+    except ImportError:
+        raise RuntimeError("No PDF library available. Install pymupdf, pdfplumber or pypdf.")
+
+
+def extract_pdf_range_sync(content: DocumentSource, start: int, stop: int) -> str:
+    """
+    Extract text from pages [start, stop) of a PDF (runs in a worker process).
+
+    Args:
+        content: PDF file content or path
+        start: First page (0-based)
+        stop: Page after the last one to read
+
+    Returns:
+        Extracted text of the page range
+    """
+    try:
+        with _open_fitz(content) as doc:
+            stop = min(stop, doc.page_count)
+            return "\n\n".join(doc[i].get_text() for i in range(start, stop))
+
+    except ImportError:
+        pass
+
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(_as_file(content))
+        pages = reader.pages[start:stop]
+        return "\n\n".join(text for page in pages if (text := page.extract_text()))
+
+    except ImportError:
+        # pdfplumber offers no cheap random page access; read from the start
+        text = extract_pdf_sync(content, stop)
+        return text if start == 0 else ""
+
+
+def extract_pdf_head_sync(content: DocumentSource, stop: int) -> tuple[int, str]:
+    """
+    Count the pages of a PDF and extract its first range in one pass.
+
+    Returns:
+        Tuple of (page count, text of pages [0, stop))
+    """
+    try:
+        with _open_fitz(content) as doc:
+            page_count = doc.page_count
+            text = "\n\n".join(doc[i].get_text() for i in range(min(stop, page_count)))
+            return page_count, text
+
+    except ImportError:
+        pass
+
+    try:
+        from pypdf import PdfReader
+
+        page_count = len(PdfReader(_as_file(content)).pages)
+    except ImportError:
+        # Without page counts, extract everything up to the cap in one go
+        return stop, extract_pdf_sync(content, stop)
+
+    return page_count, extract_pdf_range_sync(content, 0, stop)
+
+
+def extract_docx_sync(content: DocumentSource) -> str:
+    """
+    Extract text from DOCX content (runs in a worker process).
+
+    Args:
+        content: DOCX file content or path
+
+    Returns:
+        Extracted text
+    """
+    try:
+        from docx import Document
+    except ImportError:
+        raise RuntimeError("python-docx not installed. Install with: pip install python-docx")
+
+    doc = Document(_as_file(content))
+    text_parts = []
+
+    for para in doc.paragraphs:
+        if para.text.strip():
+            text_parts.append(para.text)
+
+    # Also extract from tables
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if cell.text.strip():
+                    text_parts.append(cell.text)
+
+    return "\n\n".join(text_parts)
+
+
+def _main_document_part(package: zipfile.ZipFile) -> str:
+    """Name of the main document part, from the package relationships."""
+    try:
+        rels = ElementTree.fromstring(package.read("_rels/.rels"))
+    except KeyError:
+        return "word/document.xml"
+
+    for rel in rels.iter(f"{REL_NS}Relationship"):
+        if rel.get("Type", "").endswith(OFFICE_DOCUMENT_REL):
+            return rel.get("Target", "word/document.xml").lstrip("/")
+    return "word/document.xml"
+
+
+def extract_docx_fast_sync(content: DocumentSource) -> str:
+    """
+    Extract text from DOCX content by streaming its XML (runs in a worker process).
+
+    Paragraphs and table cells come out in document order. Cells that
+    continue a vertical (or legacy horizontal) merge are skipped, so merged
+    cells are not repeated the way python-docx repeats them.
+
+    Args:
+        content: DOCX file content or path
+
+    Returns:
+        Extracted text
+    """
+    text_parts = []
+    runs: list[str] = []
+    # One entry per open table cell (tables can nest)
+    cells: list[dict] = []
+
+    with zipfile.ZipFile(_as_file(content)) as package:
+        with package.open(_main_document_part(package)) as xml:
+            for event, elem in ElementTree.iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+
+                if event == "start":
+                    if tag == f"{W_NS}tc":
+                        cells.append({"paragraphs": [], "continuation": False})
+                    continue
+
+                if tag == f"{W_NS}t":
+                    runs.append(elem.text or "")
+                elif tag == f"{W_NS}tab":
+                    runs.append("\t")
+                elif tag in (f"{W_NS}br", f"{W_NS}cr"):
+                    runs.append("\n")
+                elif tag in (f"{W_NS}vMerge", f"{W_NS}hMerge"):
+                    # Only val="restart" starts a merge; the rest continue one
+                    if cells and elem.get(f"{W_NS}val", "continue") == "continue":
+                        cells[-1]["continuation"] = True
+                elif tag == f"{W_NS}p":
+                    paragraph = "".join(runs)
+                    runs.clear()
+                    if cells:
+                        cells[-1]["paragraphs"].append(paragraph)
+                    elif paragraph.strip():
+                        text_parts.append(paragraph)
+                    elem.clear()
+                elif tag == f"{W_NS}tc":
+                    cell = cells.pop()
+                    text = "\n".join(p for p in cell["paragraphs"] if p.strip())
+                    if text and not cell["continuation"]:
+                        if cells:
+                            # Nested table: text belongs to the enclosing cell
+                            cells[-1]["paragraphs"].append(text)
+                        else:
+                            text_parts.append(text)
+                    elem.clear()
+
+    return "\n\n".join(text_parts)
+
+
+def extract_document_sync(
+    content: DocumentSource,
+    content_type: str,
+    max_pages: Optional[int] = None,
+) -> str:
+    """Extract text from a document of a known type (worker entry point)."""
+    if content_type == PDF_MIME:
+        return extract_pdf_sync(content, max_pages)
+    if content_type == DOCX_MIME:
+        try:
+            return extract_docx_fast_sync(content)
+        except (KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+            # Unusual packaging; let python-docx have a go
+            return extract_docx_sync(content)
+    if isinstance(content, str):
+        return Path(content).read_text(encoding="utf-8", errors="ignore")
+    return content.decode("utf-8", errors="ignore")
+
+
+def resolve_content_type(content: bytes, content_type: Optional[str], filename: str = "") -> str:
+    """
+    Resolve the MIME type to extract with, sniffing content when unclear.
+
+    Backend payloads and uploads sometimes carry generic or loose MIME
+    types ("application/octet-stream", "application/msword"), so fall back
+    to magic bytes and the filename.
+    """
+    if content_type in (PDF_MIME, DOCX_MIME, "text/plain"):
+        return content_type
+
+    from src.utils.document_loader import detect_file_type
+
+    detected = detect_file_type(content, filename)
+    if detected in (PDF_MIME, DOCX_MIME):
+        return detected
+    if content_type and "word" in content_type and content[:4] == b"PK\x03\x04":
+        return DOCX_MIME
+    return content_type or detected
+
+
+class TextExtractionService:
+    """Process-pool backed document text extraction."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_pages: Optional[int] = None,
+        cache: Optional[ExtractedTextCache] = None,
+    ):
+        self.max_workers = max_workers or settings.extraction_workers
+        self.max_tasks_per_child = max_tasks_per_child or settings.extraction_max_tasks_per_child
+        self.timeout = timeout or settings.extraction_timeout_seconds
+        self.max_pages = max_pages or settings.extraction_max_pages
+        self.pages_per_chunk = settings.extraction_pages_per_chunk
+        self.char_budget = settings.extraction_char_budget
+        self.cache = cache if cache is not None else (text_cache if settings.text_cache_enabled else None)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """Worker pool, created on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                max_tasks_per_child=self.max_tasks_per_child,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def _recycle_pool(self, pool: ProcessPoolExecutor) -> bool:
+        """
+        Kill the workers of a pool and start over with a fresh one.
+
+        Args:
+            pool: Pool to tear down (a no-op if it was already replaced)
+
+        Returns:
+            True if the pool was torn down by this call
+        """
+        if pool is not self._pool:
+            return False
+        self._pool = None
+
+        # ProcessPoolExecutor has no public way to stop a running task
+        for process in list(getattr(pool, "_processes", {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+        return True
+
+    async def extract(
+        self,
+        content,
+        content_type: Optional[str] = None,
+        filename: str = "",
+        path: Optional[Path] = None,
+    ) -> str:
+        """
+        Extract text from a document.
+
+        Args:
+            content: Raw file content (bytes or a memory-mapped buffer)
+            content_type: MIME type (sniffed from content/filename if unclear)
+            filename: Original filename
+            path: File on disk holding the same content; workers read it
+                directly instead of receiving a copy of the content
+
+        Returns:
+            Extracted text
+        """
+        content_type = resolve_content_type(content, content_type, filename)
+
+        # Plain text needs no parsing
+        if content_type not in (PDF_MIME, DOCX_MIME):
+            return bytes(content).decode("utf-8", errors="ignore")
+
+        cache_key = None
+        if self.cache is not None:
+            variant = f"{EXTRACTOR_VERSION}:{content_type}:{self.max_pages}:{self.char_budget}"
+            cache_key = await self.cache.key(content, variant)
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Extracted text cache hit for {filename or content_type}")
+                return cached
+
+        source = str(path) if path is not None else bytes(content)
+
+        if content_type == PDF_MIME:
+            parts = [part async for part in self.iter_pdf_text(source, filename=filename)]
+            text = "\n\n".join(parts)[: self.char_budget]
+        else:
+            text = await self._run(extract_document_sync, source, content_type, self.max_pages,
+                                   filename=filename, timeout=self.timeout)
+
+        if cache_key is not None:
+            await self.cache.put(cache_key, text)
+        return text
+
+    async def iter_pdf_text(
+        self,
+        content: DocumentSource,
+        char_budget: Optional[int] = None,
+        filename: str = "",
+    ) -> AsyncIterator[str]:
+        """
+        Stream the text of a PDF in page order, one page range at a time.
+
+        The first range is extracted together with the page count. Remaining
+        ranges are extracted in parallel across workers, with at most one
+        range per worker (plus one) in flight, so an early stop wastes
+        little work and the PDF bytes are not copied to every range at once.
+
+        Args:
+            content: PDF file content or path
+            char_budget: Stop once this many characters have been yielded
+            filename: Original filename (for logging)
+
+        Yields:
+            Text of consecutive page ranges
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        char_budget = char_budget or self.char_budget
+        chunk = self.pages_per_chunk
+
+        page_count, head = await self._run(
+            extract_pdf_head_sync, content, chunk, filename=filename, timeout=deadline - loop.time()
+        )
+        page_count = min(page_count, self.max_pages)
+
+        yield head
+        extracted = len(head)
+
+        ranges = [(start, min(start + chunk, page_count)) for start in range(chunk, page_count, chunk)]
+        window = self.max_workers + 1
+        pending: list[asyncio.Future] = []
+
+        def submit(start: int, stop: int) -> asyncio.Future:
+            return self._submit(extract_pdf_range_sync, content, start, stop,
+                                filename=filename, deadline=deadline)
+
+        try:
+            for start, stop in ranges[:window]:
+                pending.append(submit(start, stop))
+            next_range = window
+
+            while pending and extracted < char_budget:
+                text = await pending.pop(0)
+
+                if next_range < len(ranges):
+                    pending.append(submit(*ranges[next_range]))
+                    next_range += 1
+
+                yield text
+                extracted += len(text)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _submit(self, fn, *args, filename: str, deadline: float) -> asyncio.Future:
+        """Schedule a function on the worker pool, failing it at a loop-time deadline."""
+        return asyncio.ensure_future(self._execute(fn, args, filename, deadline))
+
+    async def _run(self, fn, *args, filename: str, timeout: float):
+        """Run a function on the worker pool with a timeout."""
+        deadline = asyncio.get_running_loop().time() + timeout
+        return await self._submit(fn, *args, filename=filename, deadline=deadline)
+
+    async def _execute(self, fn, args: tuple, filename: str, deadline: float):
+        """
+        Run a function on the worker pool.
+
+        A ProcessPoolExecutor breaks as soon as one of its workers dies, so a
+        job that overruns its deadline tears down the pool it ran on (that
+        pool only, once). Jobs that were queued or running on a torn-down
+        pool, including one broken by a crashed worker, are resubmitted to
+        the fresh pool; a job whose pool breaks MAX_POOL_ATTEMPTS times fails.
+        """
+        loop = asyncio.get_running_loop()
+        name = filename or "document"
+
+        for attempt in range(1, MAX_POOL_ATTEMPTS + 1):
+            pool = self.pool
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(pool, fn, *args),
+                    timeout=max(0.0, deadline - loop.time()),
+                )
+            except asyncio.TimeoutError:
+                logger.error(f"Text extraction timed out after {self.timeout}s for {name}")
+                self._recycle_pool(pool)
+                raise DocumentExtractionTimeout(
+                    f"Text extraction timed out after {self.timeout}s"
+                )
+            except (BrokenProcessPool, asyncio.CancelledError) as e:
+                # Cancelled by our caller, not by a pool shutdown
+                if asyncio.current_task().cancelling():
+                    raise
+                if self._recycle_pool(pool):
+                    logger.error(f"Extraction worker crashed on {name}: {e}")
+                if attempt == MAX_POOL_ATTEMPTS:
+                    raise DocumentExtractionError("Extraction worker crashed") from e
+                logger.warning(f"Resubmitting {name} to a fresh extraction pool")
+            except RuntimeError:
+                raise
+            except Exception as e:
+                raise DocumentExtractionError(f"Failed to extract text: {e}") from e
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Singleton instance
+text_extraction_service = TextExtractionService()
@@ -0,0 +1,460 @@
+"""
+Durable Work Queue
+
+Local stand-in for a hosted job queue: jobs are rows in a SQLite file (WAL
+mode), so queued work survives restarts.
+
+- Workers claim a job by leasing it for a visibility timeout. A job whose
+  worker died (or hung) becomes claimable again once its lease expires;
+  a lease that expires on the job's last attempt fails the job instead.
+- A completed job keeps its handler's result, so results survive restarts
+  along with the jobs.
+- Every claim gets a new lease token. Completing or failing a job needs
+  the token of its current lease, so a worker whose lease expired cannot
+  overwrite the outcome of the worker that reclaimed the job.
+- A failed attempt is retried after an exponential backoff, up to the
+  job's max attempts; then the job is marked failed and kept for replay.
+- QueueWorkerPool runs handlers for one named queue on a few asyncio tasks,
+  woken as soon as a job is enqueued in-process and polling otherwise.
+"""
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    queue TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_expires_at REAL,
+    last_error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    lease_token TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_claimable ON jobs (queue, status, available_at);
+"""
+
+# Job statuses
+QUEUED = "queued"
+PROCESSING = "processing"
+COMPLETED = "completed"
+FAILED = "failed"
+JOB_STATUSES = (QUEUED, PROCESSING, COMPLETED, FAILED)
+
+# Columns added after the first release, created on open if missing
+ADDED_COLUMNS = {"lease_token": "TEXT", "result": "TEXT"}
+
+
+class QueuedJob(NamedTuple):
+    """A job as stored in the queue."""
+
+    id: str
+    queue: str
+    payload: dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    available_at: float
+    last_error: Optional[str]
+    created_at: str
+    updated_at: str
+    lease_token: Optional[str] = None  # Set while claimed
+    result: Optional[dict[str, Any]] = None  # Handler result of the last completed run
+
+
+COLUMNS = ", ".join(
+    ("id", "queue", "payload", "status", "attempts", "max_attempts",
+     "available_at", "last_error", "created_at", "updated_at", "lease_token", "result")
+)
+
+
+def _job(row: tuple) -> QueuedJob:
+    """Job from a row of COLUMNS."""
+    return QueuedJob(row[0], row[1], json.loads(row[2]), *row[3:11], json.loads(row[11]) if row[11] else None)
+
+
+class SQLiteWorkQueue:
+    """Durable job queue in a SQLite file."""
+
+    def __init__(self, path: Optional[str] = None, max_attempts: Optional[int] = None):
+        self.path = Path(path or settings.work_queue_path)
+        self.max_attempts = max_attempts or settings.work_queue_max_attempts
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Set when a job is enqueued, so idle in-process workers wake up
+        self._wakeups: dict[str, asyncio.Event] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (called from worker threads)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, definition in ADDED_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {definition}")
+            self._conn = conn
+        return self._conn
+
+    def wakeup(self, queue: str) -> asyncio.Event:
+        """Event set when a job is added to a queue."""
+        return self._wakeups.setdefault(queue, asyncio.Event())
+
+    async def enqueue(
+        self,
+        queue: str,
+        payload: dict[str, Any],
+        job_id: Optional[str] = None,
+        max_attempts: Optional[int] = None,
+    ) -> str:
+        """
+        Add a job.
+
+        Args:
+            queue: Queue name
+            payload: JSON-serialisable job data
+            job_id: Job id (defaults to a new UUID)
+            max_attempts: Attempts before the job is marked failed
+
+        Returns:
+            Job id
+        """
+        job_id = job_id or str(uuid.uuid4())
+        now = datetime.utcnow().isoformat()
+        row = (
+            job_id, queue, json.dumps(payload), QUEUED, 0, max_attempts or self.max_attempts,
+            time.time(), None, now, now, None, None,
+        )
+        await asyncio.to_thread(self._execute, f"INSERT INTO jobs ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+        self.wakeup(queue).set()
+        return job_id
+
+    async def claim(self, queue: str, visibility_timeout: float) -> Optional[QueuedJob]:
+        """
+        Lease the next due job of a queue.
+
+        Queued jobs past their backoff are due, as are processing jobs whose
+        lease has expired (their worker is gone) and that have attempts
+        left; expired jobs without attempts left are marked failed.
+
+        Args:
+            queue: Queue name
+            visibility_timeout: Seconds the job stays leased to the caller
+
+        Returns:
+            The claimed job (attempts counted, lease token set), or None if none is due
+        """
+        return await asyncio.to_thread(self._claim, queue, visibility_timeout)
+
+    async def complete(self, job: QueuedJob, result: Optional[dict[str, Any]] = None) -> bool:
+        """
+        Mark a claimed job done.
+
+        Args:
+            job: The job as returned by claim()
+            result: JSON-serialisable handler result, stored with the job
+
+        Returns:
+            False if the claim's lease was lost (the job was reclaimed)
+        """
+        updated = await asyncio.to_thread(
+            self._execute,
+            "UPDATE jobs SET status = ?, lease_expires_at = NULL, lease_token = NULL, last_error = NULL, "
+            "result = ?, updated_at = ? WHERE id = ? AND status = ? AND lease_token = ?",
+            (
+                COMPLETED,
+                json.dumps(result) if result is not None else None,
+                datetime.utcnow().isoformat(),
+                job.id,
+                PROCESSING,
+                job.lease_token,
+            ),
+        )
+        return updated > 0
+
+    async def fail(self, job: QueuedJob, error: str, backoff: float) -> Optional[bool]:
+        """
+        Record a failed attempt.
+
+        Args:
+            job: The job as returned by claim()
+            error: Failure reason
+            backoff: Base retry delay in seconds (doubled on every attempt)
+
+        Returns:
+            True if the job will be retried, False if it is now failed, or
+            None if the claim's lease was lost (the job was reclaimed)
+        """
+        return await asyncio.to_thread(self._fail, job, error, backoff)
+
+    async def requeue(
+        self,
+        job_id: str,
+        payload: Optional[dict[str, Any]] = None,
+        statuses: tuple[str, ...] = (FAILED,),
+    ) -> bool:
+        """
+        Queue a finished job again, with its attempts reset.
+
+        Args:
+            job_id: Failed (or otherwise finished) job
+            payload: Replacement payload (defaults to the stored one)
+            statuses: Statuses the job may be requeued from
+
+        Returns:
+            False if the job is unknown or not in one of the statuses
+        """
+        updated = await asyncio.to_thread(self._requeue, job_id, payload, statuses)
+        if updated is not None:
+            self.wakeup(updated).set()
+        return updated is not None
+
+    async def get(self, job_id: str) -> Optional[QueuedJob]:
+        """Get a job by id."""
+        row = await asyncio.to_thread(
+            self._fetchone, f"SELECT {COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+        )
+        return _job(row) if row else None
+
+    async def counts(self, queue: str) -> dict[str, int]:
+        """Number of jobs per status."""
+        rows = await asyncio.to_thread(
+            self._fetchall, "SELECT status, COUNT(*) FROM jobs WHERE queue = ? GROUP BY status", (queue,)
+        )
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update(dict(rows))
+        return counts
+
+    async def failed(self, queue: str, limit: int = 50) -> list[QueuedJob]:
+        """Most recently failed jobs."""
+        rows = await asyncio.to_thread(
+            self._fetchall,
+            f"SELECT {COLUMNS} FROM jobs WHERE queue = ? AND status = ? ORDER BY updated_at DESC LIMIT ?",
+            (queue, FAILED, limit),
+        )
+        return [_job(row) for row in rows]
+
+    def _execute(self, sql: str, params: tuple) -> int:
+        with self._lock:
+            return self._connect().execute(sql, params).rowcount
+
+    def _fetchone(self, sql: str, params: tuple) -> Optional[tuple]:
+        with self._lock:
+            return self._connect().execute(sql, params).fetchone()
+
+    def _fetchall(self, sql: str, params: tuple) -> list[tuple]:
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def _claim(self, queue: str, visibility_timeout: float) -> Optional[QueuedJob]:
+        now = time.time()
+        updated_at = datetime.utcnow().isoformat()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # A job that keeps killing (or hanging) its worker is not retried forever
+                conn.execute(
+                    "UPDATE jobs SET status = ?, lease_expires_at = NULL, lease_token = NULL, last_error = ?, "
+                    "updated_at = ? WHERE queue = ? AND status = ? AND lease_expires_at <= ? "
+                    "AND attempts >= max_attempts",
+                    (FAILED, "Lease expired on the last attempt", updated_at, queue, PROCESSING, now),
+                )
+                row = conn.execute(
+                    f"SELECT {COLUMNS} FROM jobs WHERE queue = ? AND ("
+                    "(status = ? AND available_at <= ?) OR (status = ? AND lease_expires_at <= ?)"
+                    ") ORDER BY available_at LIMIT 1",
+                    (queue, QUEUED, now, PROCESSING, now),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                lease_token = uuid.uuid4().hex
+                conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, lease_expires_at = ?, lease_token = ?, "
+                    "updated_at = ? WHERE id = ?",
+                    (PROCESSING, now + visibility_timeout, lease_token, updated_at, row[0]),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        job = _job(row)
+        return job._replace(
+            status=PROCESSING, attempts=job.attempts + 1, updated_at=updated_at, lease_token=lease_token
+        )
+
+    def _fail(self, job: QueuedJob, error: str, backoff: float) -> Optional[bool]:
+        now = time.time()
+        updated_at = datetime.utcnow().isoformat()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND status = ? AND lease_token = ?",
+                (job.id, PROCESSING, job.lease_token),
+            ).fetchone()
+            if row is None:
+                return None
+
+            attempts, max_attempts = row
+            retry = attempts < max_attempts
+            conn.execute(
+                "UPDATE jobs SET status = ?, available_at = ?, lease_expires_at = NULL, lease_token = NULL, "
+                "last_error = ?, updated_at = ? WHERE id = ?",
+                (
+                    QUEUED if retry else FAILED,
+                    now + backoff * 2 ** (attempts - 1) if retry else now,
+                    error,
+                    updated_at,
+                    job.id,
+                ),
+            )
+        return retry
+
+    def _requeue(
+        self,
+        job_id: str,
+        payload: Optional[dict[str, Any]],
+        statuses: tuple[str, ...],
+    ) -> Optional[str]:
+        """Requeue a finished job; returns its queue name, or None if nothing was requeued."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT queue, status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None or row[1] not in statuses or row[1] in (QUEUED, PROCESSING):
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, attempts = 0, available_at = ?, payload = COALESCE(?, payload), "
+                "updated_at = ? WHERE id = ?",
+                (QUEUED, time.time(), json.dumps(payload) if payload is not None else None,
+                 datetime.utcnow().isoformat(), job_id),
+            )
+        return row[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class QueueWorkerPool:
+    """Runs a handler for every job of one queue on a fixed number of workers."""
+
+    def __init__(
+        self,
+        queue: SQLiteWorkQueue,
+        name: str,
+        handler: Callable[[QueuedJob], Awaitable[Optional[dict[str, Any]]]],
+        workers: Optional[int] = None,
+        visibility_timeout: Optional[float] = None,
+        retry_backoff: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+        on_failure: Optional[Callable[[QueuedJob, str, bool], Awaitable[None]]] = None,
+    ):
+        self.queue = queue
+        self.name = name
+        self.handler = handler
+        self.workers = workers or settings.work_queue_workers
+        self.visibility_timeout = visibility_timeout or settings.work_queue_visibility_timeout_seconds
+        self.retry_backoff = settings.work_queue_retry_backoff_seconds if retry_backoff is None else retry_backoff
+        self.poll_interval = poll_interval or settings.work_queue_poll_interval_seconds
+        self.on_failure = on_failure
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether workers are started."""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start the workers (call from the running event loop)."""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"Started {self.workers} workers for queue {self.name}")
+
+    async def stop(self) -> None:
+        """Stop the workers; jobs in progress are reclaimed after their lease."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def process_next(self) -> bool:
+        """
+        Claim and handle one due job.
+
+        Returns:
+            False if no job was due
+        """
+        job = await self.queue.claim(self.name, self.visibility_timeout)
+        if job is None:
+            return False
+
+        try:
+            # A handler outliving its lease could run twice
+            result = await asyncio.wait_for(self.handler(job), timeout=self.visibility_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            retry = await self.queue.fail(job, error, self.retry_backoff)
+            if retry is None:
+                logger.warning(f"Job {job.id} on {self.name} failed after its lease expired; not recorded: {error}")
+                return True
+            logger.warning(
+                f"Job {job.id} on {self.name} failed (attempt {job.attempts}/{job.max_attempts}"
+                f"{', will retry' if retry else ''}): {error}"
+            )
+            if self.on_failure is not None:
+                await self.on_failure(job, error, retry)
+        else:
+            if not await self.queue.complete(job, result):
+                logger.warning(f"Job {job.id} on {self.name} finished after its lease expired; not recorded")
+        return True
+
+    async def _worker(self) -> None:
+        """Handle due jobs, forever; sleep until woken or the poll interval passes."""
+        wakeup = self.queue.wakeup(self.name)
+        while True:
+            # Cleared before claiming, so a job enqueued meanwhile still wakes us
+            wakeup.clear()
+            try:
+                if await self.process_next():
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Worker for queue {self.name} failed: {e}", exc_info=True)
+
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+# Singleton instance
+work_queue = SQLiteWorkQueue()
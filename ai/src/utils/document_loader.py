@@ -2,9 +2,10 @@
 Document Loader
 
 Utilities for loading and extracting text from various document formats.
+
+PDF and DOCX parsing runs in the shared text extraction process pool.
 """
-import io
-from typing import Optional
+from src.services.text_extraction import text_extraction_service
 
 
 async def load_document(
@@ -23,15 +24,7 @@ async def load_document(
     Returns:
         Extracted text content
     """
-    if content_type == "application/pdf":
-        return await extract_pdf_text(content)
-    elif content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        return await extract_docx_text(content)
-    elif content_type == "text/plain":
-        return content.decode("utf-8", errors="ignore")
-    else:
-        # Try to decode as text
-        return content.decode("utf-8", errors="ignore")
+    return await text_extraction_service.extract(content, content_type, filename)
 
 
 async def extract_pdf_text(content: bytes) -> str:
@@ -44,34 +37,7 @@ async def extract_pdf_text(content: bytes) -> str:
     Returns:
         Extracted text
     """
-    try:
-        import fitz  # PyMuPDF
-        
-        doc = fitz.open(stream=content, filetype="pdf")
-        text_parts = []
-        
-        for page in doc:
-            text_parts.append(page.get_text())
-        
-        doc.close()
-        return "\n\n".join(text_parts)
-        
-    except ImportError:
-        # Fallback to pdfplumber
-        try:
-            import pdfplumber
-            
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
-                text_parts = []
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_parts.append(text)
-                
-                return "\n\n".join(text_parts)
-                
-        except ImportError:
-            raise RuntimeError("No PDF library available. Install pymupdf or pdfplumber.")
+    return await text_extraction_service.extract(content, "application/pdf")
 
 
 async def extract_docx_text(content: bytes) -> str:
@@ -84,27 +50,10 @@ async def extract_docx_text(content: bytes) -> str:
     Returns:
         Extracted text
     """
-    try:
-        from docx import Document
-        
-        doc = Document(io.BytesIO(content))
-        text_parts = []
-        
-        for para in doc.paragraphs:
-            if para.text.strip():
-                text_parts.append(para.text)
-        
-        # Also extract from tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    if cell.text.strip():
-                        text_parts.append(cell.text)
-        
-        return "\n\n".join(text_parts)
-        
-    except ImportError:
-        raise RuntimeError("python-docx not installed. Install with: pip install python-docx")
+    return await text_extraction_service.extract(
+        content,
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    )
 
 
 def detect_file_type(content: bytes, filename: str) -> str:
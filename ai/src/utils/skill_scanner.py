@@ -0,0 +1,159 @@
+"""
+Skill Scanner
+
+Aho-Corasick automaton over skill terms (names and aliases). One linear pass
+over a text finds every term occurrence; matches are kept only on word
+boundaries and resolved leftmost-longest, so "react.js" wins over "react"
+and "java" is not found in "javascript".
+"""
+from functools import lru_cache
+from typing import Iterable, NamedTuple
+
+# Characters that continue a term ("c" in "c++", "java" in "javascript")
+TERM_CHARS = frozenset("+#_")
+
+
+class SkillMention(NamedTuple):
+    """A skill term found in text."""
+
+    skill_id: str
+    start: int
+    end: int
+
+
+class ScanTerm(NamedTuple):
+    """A term to scan for, and the key it reports."""
+
+    term: str
+    skill_id: str
+    case_sensitive: bool = False
+
+
+def _is_term_char(char: str) -> bool:
+    """Whether a character would continue a term."""
+    return char.isalnum() or char in TERM_CHARS
+
+
+def _fold(text: str) -> str:
+    """Lowercase without changing length, so offsets map back to the text."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters lowercase to two ("İ"); keep those as written
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class SkillScanner:
+    """Multi-term matcher built once and reused across texts."""
+
+    def __init__(self, terms: Iterable[ScanTerm]):
+        # Trie transitions, failure links and (term length, term index) outputs
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, int]]] = [[]]
+        self._terms: list[ScanTerm] = []
+
+        seen = set()
+        for entry in terms:
+            term = entry.term.strip()
+            key = (term if entry.case_sensitive else term.lower(), entry.case_sensitive)
+            if not term or key in seen:
+                continue
+            seen.add(key)
+            self._add(ScanTerm(term, entry.skill_id, entry.case_sensitive))
+
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def _add(self, entry: ScanTerm) -> None:
+        """Insert a term into the trie (case-sensitive terms are verified on match)."""
+        state = 0
+        for char in _fold(entry.term):
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+
+        self._out[state].append((len(entry.term), len(self._terms)))
+        self._terms.append(entry)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first, merging outputs along them."""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def _bounded(self, text: str, start: int, end: int) -> bool:
+        """Whether a match is a whole term rather than part of a word or domain."""
+        if start > 0 and _is_term_char(text[start - 1]):
+            return False
+        if end < len(text):
+            if _is_term_char(text[end]):
+                return False
+            # "github.com" is a domain, not Git
+            if text[end] == "." and end + 1 < len(text) and text[end + 1].isalnum():
+                return False
+        return True
+
+    def scan(self, text: str) -> list[SkillMention]:
+        """
+        Find skill terms in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Non-overlapping mentions in text order (leftmost, then longest)
+        """
+        if not text or not self._terms:
+            return []
+
+        goto, fail, out, terms = self._goto, self._fail, self._out, self._terms
+        candidates = []
+        state = 0
+
+        for index, char in enumerate(_fold(text)):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for length, term_index in out[state]:
+                start, end = index + 1 - length, index + 1
+                entry = terms[term_index]
+                if entry.case_sensitive and text[start:end] != entry.term:
+                    continue
+                if self._bounded(text, start, end):
+                    candidates.append((start, -end, entry.skill_id))
+
+        # Leftmost first and, at the same start, longest first
+        mentions = []
+        covered = 0
+        for start, negative_end, skill_id in sorted(candidates):
+            if start >= covered:
+                mentions.append(SkillMention(skill_id, start, -negative_end))
+                covered = -negative_end
+        return mentions
+
+    def find(self, text: str) -> list[str]:
+        """Skill ids mentioned in text, in order of first mention."""
+        return list(dict.fromkeys(mention.skill_id for mention in self.scan(text)))
+
+
+@lru_cache(maxsize=256)
+def keyword_scanner(keywords: tuple[str, ...]) -> SkillScanner:
+    """Cached case-insensitive scanner reporting each keyword in lowercase."""
+    return SkillScanner(ScanTerm(keyword, keyword.strip().lower()) for keyword in keywords)
@@ -0,0 +1,167 @@
+"""
+Skills Taxonomy
+
+Loader for data/skills_taxonomy.json with canonical-id lookup by skill name
+or alias, and skill scanners that find taxonomy skills in free text.
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+from src.config import settings
+from src.utils.skill_scanner import ScanTerm, SkillMention, SkillScanner
+
+# Terms too ambiguous to spot in free text ("CV", "5 PM", "next year")
+AMBIGUOUS_TERMS = frozenset({"cv", "pm", "next", "node", "express", "nest", "rails", "spring", "tf", "dl"})
+
+# Skill names that are everyday words: only matched as written ("Go", "Swift")
+CASE_SENSITIVE_TERMS = frozenset({"go", "swift", "rust", "ruby", "flask", "excel"})
+
+
+class TaxonomySkill(NamedTuple):
+    """A canonical skill from the taxonomy."""
+
+    id: str
+    name: str
+    category: str
+    aliases: tuple[str, ...]
+
+
+class SkillsTaxonomy:
+    """In-memory view of the skills taxonomy."""
+
+    def __init__(self, data: dict):
+        self.version = data.get("version", "1.0")
+        self.data = data
+        self.skills: list[TaxonomySkill] = []
+        self._by_id: dict[str, TaxonomySkill] = {}
+        self._lookup: dict[str, str] = {}
+
+        for category in data.get("categories", []):
+            for entry in category.get("skills", []):
+                skill = TaxonomySkill(
+                    id=entry["id"],
+                    name=entry["name"],
+                    category=category["id"],
+                    aliases=tuple(entry.get("aliases", [])),
+                )
+                self.skills.append(skill)
+                self._by_id[skill.id] = skill
+
+        # Names win over aliases when both claim the same term
+        for skill in self.skills:
+            for alias in (skill.id, *skill.aliases):
+                self._lookup.setdefault(alias.lower(), skill.id)
+        for skill in self.skills:
+            self._lookup[skill.name.lower()] = skill.id
+
+        self._scanner: Optional[SkillScanner] = None
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def resolve(self, term: str) -> Optional[str]:
+        """Canonical skill id for a name or alias (case-insensitive)."""
+        return self._lookup.get(term.strip().lower()) if term else None
+
+    def get(self, skill_id: str) -> Optional[TaxonomySkill]:
+        """Get a skill by canonical id."""
+        return self._by_id.get(skill_id)
+
+    def terms(self) -> dict[str, str]:
+        """All names and aliases (lowercase) mapped to canonical ids."""
+        return dict(self._lookup)
+
+    def key(self, term: str) -> str:
+        """Canonical id for a taxonomy skill, else the lowercased term."""
+        return self.resolve(term) or term.strip().lower()
+
+    def _scan_terms(self, skill_id: str) -> list[ScanTerm]:
+        """Name and aliases of a skill, under the ambiguity/case policy."""
+        skill = self._by_id[skill_id]
+        terms = [
+            ScanTerm(term, skill_id)
+            for term in (skill.name, skill.id, *skill.aliases)
+            if term.lower() not in AMBIGUOUS_TERMS
+            and term.lower() not in CASE_SENSITIVE_TERMS
+            and self._lookup.get(term.lower()) == skill_id
+        ]
+        if skill.name.lower() in CASE_SENSITIVE_TERMS:
+            # Everyday words: only the name as written
+            terms.append(ScanTerm(skill.name, skill_id, case_sensitive=True))
+        return terms
+
+    @property
+    def scanner(self) -> SkillScanner:
+        """Scanner over every skill in the taxonomy (built on first use)."""
+        if self._scanner is None:
+            self._scanner = SkillScanner(
+                term for skill in self.skills for term in self._scan_terms(skill.id)
+            )
+        return self._scanner
+
+    def scanner_for(self, skills: Iterable[str]) -> SkillScanner:
+        """
+        Scanner for a given set of skills, reporting them by ``key``.
+
+        Taxonomy skills are also found by their name and aliases; any other
+        skill only as written.
+
+        Args:
+            skills: Skill names (e.g. a talent's declared skills)
+
+        Returns:
+            Scanner whose mentions carry ``self.key(skill)``
+        """
+        terms = []
+        for skill in skills:
+            if not skill or not skill.strip():
+                continue
+            skill_id = self.resolve(skill)
+            if skill_id is None:
+                terms.append(ScanTerm(skill, skill.strip().lower()))
+                continue
+
+            terms.extend(self._scan_terms(skill_id))
+            if skill.strip().lower() in AMBIGUOUS_TERMS:
+                # Declared explicitly, so worth looking for despite the ambiguity
+                terms.append(ScanTerm(skill, skill_id))
+        return SkillScanner(terms)
+
+    def scan(self, text: str) -> list[SkillMention]:
+        """
+        Find taxonomy skill mentions in free text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Mentions (canonical id and character offsets) in text order
+        """
+        return self.scanner.scan(text)
+
+    def find_skills(self, text: str) -> list[str]:
+        """
+        Find taxonomy skills mentioned in free text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Canonical skill ids, in order of first mention
+        """
+        return self.scanner.find(text)
+
+
+def load_skills_taxonomy(path: Optional[Path] = None) -> SkillsTaxonomy:
+    """Load the skills taxonomy from disk."""
+    path = Path(path or settings.skills_taxonomy_path)
+    with path.open(encoding="utf-8") as f:
+        return SkillsTaxonomy(json.load(f))
+
+
+@lru_cache
+def get_skills_taxonomy() -> SkillsTaxonomy:
+    """Get the cached skills taxonomy instance."""
+    return load_skills_taxonomy()
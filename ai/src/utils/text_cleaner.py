@@ -6,6 +6,17 @@ Utilities for cleaning and normalizing text.
 import re
 from typing import Optional
 
+# Precompiled patterns (hot path for rule-based CV extraction)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+LOOSE_EMAIL_PATTERN = re.compile(r"\S+@\S+\.\S+")
+PHONE_PATTERN = re.compile(r"\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}")
+US_PHONE_PATTERN = re.compile(r"\(\d{3}\)\s*\d{3}[-.\s]?\d{4}")
+URL_PATTERN = re.compile(r"https?://\S+")
+LINKEDIN_PATTERN = re.compile(r"linkedin\.com/in/[\w-]+", re.IGNORECASE)
+GITHUB_PATTERN = re.compile(r"github\.com/[\w-]+", re.IGNORECASE)
+
 
 def clean_text(text: str) -> str:
     """
@@ -21,10 +32,10 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove excessive whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = WHITESPACE_PATTERN.sub(" ", text)
     
     # Remove control characters
-    text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]", "", text)
+    text = CONTROL_CHARS_PATTERN.sub("", text)
     
     # Normalize quotes
     text = text.replace(""", '"').replace(""", '"')
@@ -38,57 +49,44 @@ def clean_text(text: str) -> str:
 
 def remove_emails(text: str) -> str:
     """Remove email addresses from text."""
-    return re.sub(r"\S+@\S+\.\S+", "[EMAIL]", text)
+    return LOOSE_EMAIL_PATTERN.sub("[EMAIL]", text)
 
 
 def remove_phone_numbers(text: str) -> str:
     """Remove phone numbers from text."""
     # Various phone number patterns
-    patterns = [
-        r"\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}",
-        r"\(\d{3}\)\s*\d{3}[-.\s]?\d{4}",
-    ]
-    
-    for pattern in patterns:
-        text = re.sub(pattern, "[PHONE]", text)
+    for pattern in (PHONE_PATTERN, US_PHONE_PATTERN):
+        text = pattern.sub("[PHONE]", text)
     
     return text
 
 
 def remove_urls(text: str) -> str:
     """Remove URLs from text."""
-    return re.sub(r"https?://\S+", "[URL]", text)
+    return URL_PATTERN.sub("[URL]", text)
 
 
 def extract_email(text: str) -> Optional[str]:
     """Extract first email address from text."""
-    match = re.search(r"[\w.+-]+@[\w-]+\.[\w.-]+", text)
+    match = EMAIL_PATTERN.search(text)
     return match.group(0) if match else None
 
 
 def extract_phone(text: str) -> Optional[str]:
     """Extract first phone number from text."""
-    patterns = [
-        r"\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}",
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0)
-    
-    return None
+    match = PHONE_PATTERN.search(text)
+    return match.group(0) if match else None
 
 
 def extract_linkedin(text: str) -> Optional[str]:
     """Extract LinkedIn URL from text."""
-    match = re.search(r"linkedin\.com/in/[\w-]+", text, re.IGNORECASE)
+    match = LINKEDIN_PATTERN.search(text)
     return f"https://{match.group(0)}" if match else None
 
 
 def extract_github(text: str) -> Optional[str]:
     """Extract GitHub URL from text."""
-    match = re.search(r"github\.com/[\w-]+", text, re.IGNORECASE)
+    match = GITHUB_PATTERN.search(text)
     return f"https://{match.group(0)}" if match else None
 
 
@@ -167,9 +167,12 @@ class TestCompetencyEndpoints:
     @pytest.mark.asyncio
     async def test_get_skills_taxonomy_endpoint(self):
         """Test /ai/competency/skills/taxonomy endpoint."""
-        async with AsyncClient(app=app, base_url="http://test") as client:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
             response = await client.get("/ai/competency/skills/taxonomy")
-            assert response.status_code in [200, 404]
+            assert response.status_code == 200
+            data = response.json()
+            assert "categories" in data
+            assert "levels" in data
     
     @pytest.mark.asyncio
     async def test_generate_competency_signals_endpoint(self):
@@ -1,8 +1,38 @@
 """
 Competency Signal Tests
 """
+import pickle
+
+import numpy as np
 import pytest
-from src.models.competency import CompetencySignal, Evidence
+from src.core.competency.batch import CompetencyBatchService
+from src.core.competency.evidence_index import IndexedEvidence
+from src.core.competency.records import SignalRecord
+from src.core.competency.scoring import score_signals
+from src.core.competency.semantic_linker import split_sentences
+from src.core.competency.signal_generator import CompetencySignalGenerator
+from src.models.competency import (
+    CompetencyBatchError,
+    CompetencyBatchResult,
+    CompetencyRequest,
+    CompetencySignal,
+    Evidence,
+)
+from src.services.signal_store import CompetencySignalStore, input_fingerprint
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Signal store in a temporary SQLite file."""
+    store = CompetencySignalStore(str(tmp_path / "signals.db"), cache_size=8)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def generator(store):
+    """Generator persisting to the temporary store."""
+    return CompetencySignalGenerator(store=store)
 
 
 class TestCompetencySignal:
@@ -51,3 +81,322 @@ class TestCompetencySignal:
         
         assert signal_min.score == 0
         assert signal_max.score == 100
+
+
+class TestSignalEvidenceMatching:
+    """Tests for how the generator finds skills in evidence text."""
+
+    @pytest.mark.asyncio
+    async def test_evidence_matches_whole_skill_terms(self, generator):
+        """Test evidence matches aliases but not substrings of other skills."""
+        signals = await generator.generate(
+            talent_id="talent-1",
+            cv_data={
+                "skills": ["Java", "JavaScript"],
+                "work_experience": [{"responsibilities": ["Built JS dashboards in javascript"]}],
+            },
+            work_references=[{"feedback": "A dependable Java engineer"}],
+        )
+        by_skill = {signal.skill: signal for signal in signals}
+
+        assert [e.source for e in by_skill["JavaScript"].evidence] == ["CV"]
+        assert [e.source for e in by_skill["Java"].evidence] == ["Ref"]
+
+    @pytest.mark.asyncio
+    async def test_evidence_from_every_source(self, generator):
+        """Test each source contributes evidence with its confidence and verification."""
+        signals = await generator.generate(
+            talent_id="talent-1",
+            cv_data={"skills": ["Python", "Docker"]},
+            professional_recommendations=[{"text": "Excellent Python mentor", "issuer": "Ada"}],
+            verified_certifications=[{"name": "Cloud Native Cert", "skills": ["docker"], "issuer": "CNCF"}],
+            tapi_data=[{"summary": "Python data task", "performance_score": 80}],
+            work_samples=[{"description": "CLI tool", "technologies": ["Python"]}],
+        )
+        python, docker = signals
+
+        assert [(e.source, e.confidence) for e in python.evidence] == [
+            ("PR", 0.9), ("TAPI", 0.8), ("CV", 0.85),
+        ]
+        assert python.verified and python.verified_by == "Ada"
+        assert [e.source for e in docker.evidence] == ["V.Cert"]
+        assert docker.verified and docker.verified_by is None
+
+
+class FakeEmbeddingService:
+    """Embeds Python-ecosystem and leadership texts on their own axes, anything else as zeros."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        self.batches.append(list(texts))
+        vectors = np.zeros((len(texts), 2), dtype=np.float32)
+        for row, text in enumerate(texts):
+            if "Python" in text or "Django" in text:
+                vectors[row, 0] = 1.0
+            elif "Leadership" in text or "Mentored" in text:
+                vectors[row, 1] = 1.0
+        return vectors
+
+
+class TestSemanticEvidenceLinking:
+    """Tests for linking evidence to skills it does not name."""
+
+    def test_split_sentences(self):
+        """Test evidence splits on sentence ends and drops short fragments."""
+        text = "Built REST services in Django. Great!\nLed the data platform migration; on time."
+
+        assert split_sentences(text) == [
+            "Built REST services in Django.",
+            "Led the data platform migration;",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_semantic_links_in_one_batch(self, store):
+        """Test similar sentences link evidence, with every sentence embedded in one call."""
+        generator = CompetencySignalGenerator(store=store, matching_mode="semantic")
+        embeddings = FakeEmbeddingService()
+        generator._embedding_service = embeddings
+
+        signals = await generator.generate(
+            talent_id="talent-1",
+            cv_data={"skills": ["Python", "Leadership"]},
+            work_references=[
+                {"feedback": "Built REST services in Django. Always reliable under pressure."},
+                {"feedback": "Mentored juniors through a tough release."},
+            ],
+            tapi_data=[{"summary": "Completed the Django migration task", "performance_score": 90}],
+        )
+        python, leadership = signals
+
+        assert [e.source for e in python.evidence] == ["TAPI", "Ref"]
+        assert [e.snippet for e in leadership.evidence] == ["Mentored juniors through a tough release."]
+        assert len(embeddings.batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_exact_mode_needs_literal_mentions(self, generator):
+        """Test the default mode does not embed evidence."""
+        signals = await generator.generate(
+            talent_id="talent-1",
+            cv_data={"skills": ["Python"]},
+            work_references=[{"feedback": "Built REST services in Django."}],
+        )
+
+        assert signals[0].evidence == []
+
+
+class TestIncrementalSignals:
+    """Tests for evidence added/removed events."""
+
+    @pytest.mark.asyncio
+    async def test_event_rescores_only_affected_skills(self, generator):
+        """Test an added certification returns just the skills it mentions."""
+        request = {
+            "talent_id": "talent-1",
+            "cv_data": {"skills": ["Python", "Docker", "SQL"]},
+            "work_references": [{"feedback": "Strong Python and SQL work"}],
+        }
+        await generator.generate(**request)
+        cert = {"id": "cert-1", "name": "Docker Certified Associate", "issuer": "Docker"}
+
+        changed = await generator.apply_evidence_event("talent-1", "added", "certification", cert)
+
+        assert [s.skill for s in changed] == ["Docker"]
+        assert changed[0].verified
+        full = await generator.generate(**request, verified_certifications=[cert])
+        docker = next(s for s in full if s.skill == "Docker")
+        assert changed[0].score == docker.score
+        assert changed[0].source_breakdown == docker.source_breakdown
+
+    @pytest.mark.asyncio
+    async def test_removed_evidence_drops_from_signal(self, generator):
+        """Test removing a reference by id rescores the skills it mentioned."""
+        await generator.generate(
+            talent_id="talent-1",
+            cv_data={"skills": ["Python", "Docker"]},
+            work_references=[{"id": "ref-1", "feedback": "Great Python engineer"}],
+        )
+
+        changed = await generator.apply_evidence_event("talent-1", "removed", "reference", item_id="ref-1")
+
+        assert [s.skill for s in changed] == ["Python"]
+        assert changed[0].evidence == [] and not changed[0].verified
+
+    @pytest.mark.asyncio
+    async def test_events_apply_after_restart(self, generator, store):
+        """Test a new generator reads the evidence index back from the store."""
+        await generator.generate(
+            talent_id="talent-1",
+            cv_data={"skills": ["Python", "Docker"]},
+            work_references=[{"id": "ref-1", "feedback": "Great Python engineer"}],
+        )
+
+        restarted = CompetencySignalGenerator(store=store)
+        changed = await restarted.apply_evidence_event("talent-1", "removed", "reference", item_id="ref-1")
+
+        assert [s.skill for s in changed] == ["Python"]
+        assert changed[0].evidence == []
+
+    @pytest.mark.asyncio
+    async def test_replayed_event_replaces_evidence(self, generator):
+        """Test adding evidence under an id already held does not count it twice."""
+        await generator.generate(talent_id="talent-1", cv_data={"skills": ["Docker"]})
+        cert = {"id": "cert-1", "name": "Docker Certified Associate", "issuer": "Docker"}
+
+        first = await generator.apply_evidence_event("talent-1", "added", "certification", cert)
+        replayed = await generator.apply_evidence_event("talent-1", "added", "certification", cert)
+
+        assert len(replayed[0].evidence) == 1
+        assert replayed[0].score == first[0].score
+
+    @pytest.mark.asyncio
+    async def test_event_for_unknown_talent(self, generator):
+        """Test events need generated signals first."""
+        with pytest.raises(KeyError):
+            await generator.apply_evidence_event("nobody", "added", "reference", {"text": "x"})
+
+
+class TestCompetencySignalStore:
+    """Tests for the persistent signal store."""
+
+    @pytest.mark.asyncio
+    async def test_versions_follow_input_fingerprint(self, store):
+        """Test a new version is only written when the inputs change."""
+        signals = [CompetencySignal(skill="Python", score=40, level="Low")]
+
+        first = await store.save("talent-1", input_fingerprint({"a": 1}), signals)
+        again = await store.save("talent-1", input_fingerprint({"a": 1}), signals)
+        changed = await store.save("talent-1", input_fingerprint({"a": 2}), signals)
+
+        assert (first.version, again.version, changed.version) == (1, 1, 2)
+
+    @pytest.mark.asyncio
+    async def test_reads_survive_cache_loss(self, store):
+        """Test stored signals are read back from SQLite after the LRU is cleared."""
+        await store.save("talent-1", "fp", [CompetencySignal(skill="Python", score=40, level="Low")])
+        store.clear_cache()
+
+        stored = await store.get("talent-1")
+
+        assert stored.version == 1
+        assert stored.signals[0].skill == "Python"
+        assert await store.get("talent-2") is None
+
+    @pytest.mark.asyncio
+    async def test_out_of_range_tapi_score_round_trips(self, generator, store):
+        """Test an out-of-range performance_score is clamped, so stored signals validate."""
+        await generator.generate(
+            talent_id="talent-1",
+            cv_data={"skills": ["Python"]},
+            tapi_data=[{"summary": "Python pipeline", "performance_score": 400}],
+        )
+        store.clear_cache()
+
+        (signal,) = await generator.get_stored_signals("talent-1")
+
+        assert signal.evidence[0].confidence == 1.0
+        assert signal.confidence <= 1.0
+        assert signal.source_breakdown.tapi_intelligence <= 20.0
+
+    @pytest.mark.asyncio
+    async def test_generated_signals_are_served_from_store(self, generator):
+        """Test generate persists signals and events update the stored set."""
+        await generator.generate(
+            talent_id="talent-1",
+            cv_data={"skills": ["Python", "Docker"]},
+        )
+        await generator.apply_evidence_event(
+            "talent-1", "added", "reference", {"feedback": "Great Docker work"}
+        )
+
+        stored = await generator.get_stored_signals("talent-1")
+
+        assert [s.skill for s in stored] == ["Python", "Docker"]
+        assert [e.source for e in stored[1].evidence] == ["Ref"]
+        assert (await generator.store.get("talent-1")).version == 2
+
+
+class TestCohortGeneration:
+    """Tests for process-pool cohort generation."""
+
+    @pytest.mark.asyncio
+    async def test_cohort_results_stream_and_are_stored(self, generator):
+        """Test every talent gets a result or an error, and results are stored."""
+        requests = [
+            CompetencyRequest(
+                talent_id=f"talent-{i}",
+                cv_data={"skills": ["Python"]},
+                work_references=[{"feedback": f"Python work #{i}"}],
+            )
+            for i in range(5)
+        ]
+        requests.append(CompetencyRequest(talent_id="broken", cv_data={"skills": 7}))
+        service = CompetencyBatchService(generator=generator, max_workers=2, shard_size=2)
+
+        try:
+            outcomes = [outcome async for outcome in service.iter_generate(requests)]
+        finally:
+            service.shutdown()
+
+        assert sorted(o.index for o in outcomes) == list(range(6))
+        errors = [o for o in outcomes if isinstance(o, CompetencyBatchError)]
+        assert [e.talent_id for e in errors] == ["broken"]
+        result = next(o for o in outcomes if isinstance(o, CompetencyBatchResult) and o.index == 3)
+        assert result.signals[0].evidence[0].source == "Ref"
+        assert (await generator.get_stored_signals("talent-3"))[0].skill == "Python"
+
+    def test_late_crash_keeps_replacement_pool(self, generator):
+        """Test a shard failing late from a crashed pool does not reset the new pool."""
+        service = CompetencyBatchService(generator=generator, max_workers=1)
+        crashed = service.pool
+
+        service._reset_pool(crashed)
+        replacement = service.pool
+        service._reset_pool(crashed)
+
+        assert replacement is not crashed
+        assert service.pool is replacement
+        service.shutdown()
+
+
+class TestVectorizedScoring:
+    """Tests for scoring all signals in one pass."""
+
+    def test_scores_match_weighting_rules(self):
+        """Test per-source contributions, levels and confidence."""
+        cv = IndexedEvidence("cv", "CV", 0.7, "")
+        ref = IndexedEvidence("reference", "Ref", 0.85, "")
+        cert = IndexedEvidence("certification", "V.Cert", 1.0, "")
+
+        scored = score_signals([[], [cv], [cv, cv, cv, ref, ref, cert, cert]])
+
+        assert scored.scores.tolist() == [10, 13, 57]
+        assert scored.levels == ["Poor", "Poor", "Good"]
+        assert scored.breakdown[1].tolist() == pytest.approx([15 * 0.7 / 3, 0, 0, 0, 0])
+        assert scored.breakdown[2].tolist() == pytest.approx([10.5, 0, 20.0, 0, 17.0])
+        assert scored.confidences[0] == 0.0
+        assert scored.confidences[1] == pytest.approx(0.7)
+
+
+class TestSignalRecords:
+    """Tests for internal signal records."""
+
+    def test_record_converts_to_model(self):
+        """Test evidence contributions and breakdown on the public model."""
+        record = SignalRecord(
+            skill="Python",
+            score=41,
+            level="Low",
+            evidence=[IndexedEvidence("cv", "CV", 0.7, "Python"), IndexedEvidence("tapi", "TAPI", 0.85, "")],
+            contributions=[3.5, 0.0, 20.0, 5.67, 0.0],
+            confidence=0.775,
+        )
+
+        signal = pickle.loads(pickle.dumps(record)).to_model()
+
+        assert signal.skill == "Python"
+        assert [e.weight_contribution for e in signal.evidence] == [3.5, 5.67]
+        assert signal.source_breakdown.verified_certifications == 20.0
+        assert signal.source_breakdown.base_signal == 10.0
+        assert signal.model_dump()["evidence"][0]["source"] == "CV"
@@ -13,6 +13,19 @@ from src.core.cv_parser.normalizers import (
     parse_date,
     calculate_experience_years,
 )
+from src.config import settings
+from src.core.cv_parser.parser import CVParserService
+from src.core.cv_parser.rule_extractor import extract_rule_based, merge_extracted
+from src.core.cv_parser.segmenter import segment_cv
+from src.utils.skills_taxonomy import get_skills_taxonomy
+
+SAMPLE_CV = """Jane Doe
+Lagos, Nigeria | jane.doe@example.com | +234 803 123 4567
+linkedin.com/in/janedoe | github.com/janedoe
+
+Experience
+2019-2021 Backend Engineer, Acme: Python, Django, PostgreSQL and Docker.
+"""
 
 
 class TestExtractors:
@@ -131,3 +144,146 @@ class TestNormalizers:
         """Test parsing invalid date returns None."""
         assert parse_date("") is None
         assert parse_date("invalid") is None
+
+
+class TestRuleExtractor:
+    """Tests for rule-based CV pre-extraction."""
+
+    def test_contact_fields(self):
+        """Test contact details and profile links are found."""
+        personal = extract_rule_based(SAMPLE_CV)["personal_info"]
+
+        assert personal["name"] == "Jane Doe"
+        assert personal["email"] == "jane.doe@example.com"
+        assert personal["phone"] == "+234 803 123 4567"
+        assert personal["linkedin"] == "https://linkedin.com/in/janedoe"
+        assert personal["github"] == "https://github.com/janedoe"
+
+    def test_date_range_not_taken_for_phone(self):
+        """Test year ranges are not mistaken for phone numbers."""
+        assert "phone" not in extract_rule_based("Engineer 2019-2021")["personal_info"]
+
+    def test_taxonomy_skills(self):
+        """Test skills are found and named canonically."""
+        skills = extract_rule_based(SAMPLE_CV)["skills"]
+
+        assert skills == ["Python", "Django", "PostgreSQL", "Docker"]
+
+    def test_ambiguous_terms_skipped(self):
+        """Test everyday words are not read as skills."""
+        taxonomy = get_skills_taxonomy()
+
+        assert taxonomy.find_skills("Attached my CV; I will go next week at 5 PM") == []
+        assert taxonomy.find_skills("Services in Go and node.js, C++ and C#") == [
+            "go", "nodejs", "cpp", "csharp",
+        ]
+
+    def test_merge_keeps_contacts_when_llm_falls_back(self):
+        """Test rule results survive an LLM fallback."""
+        rules = extract_rule_based(SAMPLE_CV)
+        fallback = {"personal_info": {"name": "Unable to parse"}, "skills": [], "fallback": True}
+
+        merged = merge_extracted(fallback, rules)
+
+        assert merged["personal_info"]["name"] == "Jane Doe"
+        assert merged["personal_info"]["email"] == "jane.doe@example.com"
+        assert merged["skills"] == rules["skills"]
+
+    def test_merge_unions_skills_by_canonical_id(self):
+        """Test skills already returned by the LLM are not duplicated."""
+        merged = merge_extracted(
+            {"personal_info": {"name": "J. Doe"}, "skills": ["python", "Kafka"]},
+            {"personal_info": {"name": "Jane Doe"}, "skills": ["Python", "Docker"]},
+        )
+
+        assert merged["personal_info"]["name"] == "J. Doe"
+        assert merged["skills"] == ["python", "Kafka", "Docker"]
+
+    @pytest.mark.asyncio
+    async def test_parse_text_asks_llm_only_for_the_rest(self, monkeypatch):
+        """Test the LLM gets the rule results and they end up in the CV."""
+        service = CVParserService()
+        calls = []
+
+        async def extract_cv_data(text, known=None):
+            calls.append(known)
+            return {"personal_info": {"name": "Jane Doe", "location": "Lagos"}, "skills": ["Kafka"]}
+
+        monkeypatch.setattr(service.llm_service, "extract_cv_data", extract_cv_data)
+
+        parsed = await service.parse_text(SAMPLE_CV)
+
+        assert calls[0]["personal_info"]["email"] == "jane.doe@example.com"
+        assert parsed.personal_info.email == "jane.doe@example.com"
+        assert parsed.personal_info.location == "Lagos"
+        assert "Docker" in parsed.skills
+
+
+SECTIONED_CV = """Jane Doe
+jane.doe@example.com
+
+PROFESSIONAL SUMMARY
+Backend engineer with six years of experience.
+
+Work Experience
+Acme Corp - Senior Engineer (2020 - Present)
+Built payment APIs in Python.
+
+Education:
+University of Lagos - BSc Computer Science
+
+Technical Skills
+Python, Django, Kafka
+
+Languages
+English, Yoruba
+"""
+
+
+class TestSegmenter:
+    """Tests for CV section segmentation."""
+
+    def test_sections_split_on_headings(self):
+        """Test heading lines start sections and are dropped."""
+        sections = segment_cv(SECTIONED_CV)
+
+        assert list(sections) == ["header", "summary", "experience", "education", "skills", "languages"]
+        assert sections["education"] == "University of Lagos - BSc Computer Science"
+        assert "Work Experience" not in sections["experience"]
+
+    def test_long_lines_are_not_headings(self):
+        """Test sentences mentioning a heading word are kept as content."""
+        sections = segment_cv("Experience\nMy experience in education technology spans years")
+
+        assert list(sections) == ["experience"]
+
+    @pytest.mark.asyncio
+    async def test_long_cv_parsed_per_section(self, monkeypatch):
+        """Test each section gets its own LLM call and results are merged."""
+        monkeypatch.setattr(settings, "cv_section_parsing_min_chars", 100)
+        service = CVParserService()
+        calls = {}
+
+        async def extract_cv_section(fields, text, known=None):
+            calls[tuple(fields)] = text
+            if fields == ["work_experience"]:
+                return {"work_experience": [{"company": "Acme Corp", "role": "Senior Engineer"}], "confidence": 0.9}
+            if fields == ["education"]:
+                return {"education": [{"institution": "University of Lagos"}], "confidence": 0.7}
+            if fields == ["skills"]:
+                return {"skills": ["Kafka"], "confidence": 0.9}
+            return {"personal_info": {"name": "Jane Doe"}, "summary": "Backend engineer", "confidence": 0.8}
+
+        monkeypatch.setattr(service.llm_service, "extract_cv_section", extract_cv_section)
+
+        parsed = await service.parse_text(SECTIONED_CV)
+
+        assert set(calls) == {
+            ("work_experience",), ("education",), ("skills",),
+            ("personal_info", "summary", "certifications", "languages", "projects"),
+        }
+        assert "Acme Corp" not in calls[("skills",)]
+        assert parsed.work_experience[0].company == "Acme Corp"
+        assert parsed.education[0].institution == "University of Lagos"
+        assert parsed.personal_info.email == "jane.doe@example.com"
+        assert parsed.confidence_score == 0.7
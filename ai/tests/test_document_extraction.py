@@ -0,0 +1,240 @@
+"""
+Document Extraction Tests
+"""
+import asyncio
+import io
+import time
+import zipfile
+
+import pytest
+from src.services.text_cache import ExtractedTextCache
+from src.services.text_extraction import (
+    DOCX_MIME,
+    PDF_MIME,
+    DocumentExtractionTimeout,
+    TextExtractionService,
+    extract_docx_fast_sync,
+    resolve_content_type,
+)
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+PACKAGE_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+<w:body>{body}</w:body>
+</w:document>"""
+
+
+def slow_extract(seconds: float) -> str:
+    """Stand-in for a pathological document (runs in a pool worker)."""
+    time.sleep(seconds)
+    return "never"
+
+
+def make_docx(body: str) -> bytes:
+    """Build a minimal DOCX package around a document.xml body."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", CONTENT_TYPES)
+        docx.writestr("_rels/.rels", PACKAGE_RELS)
+        docx.writestr("word/document.xml", DOCUMENT.format(body=body))
+    return buffer.getvalue()
+
+
+def paragraph(text: str) -> str:
+    """A single-run paragraph."""
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def cell(text: str, properties: str = "") -> str:
+    """A table cell holding one paragraph."""
+    return f"<w:tc><w:tcPr>{properties}</w:tcPr>{paragraph(text) if text else '<w:p/>'}</w:tc>"
+
+
+class TestFastDocxExtraction:
+    """Tests for the streaming DOCX extractor."""
+
+    def test_document_order_kept(self):
+        """Test paragraphs and tables come out in document order."""
+        body = (
+            paragraph("Jane Doe")
+            + f"<w:tbl><w:tr>{cell('Python')}{cell('5 years')}</w:tr></w:tbl>"
+            + paragraph("References available")
+        )
+
+        text = extract_docx_fast_sync(make_docx(body))
+
+        assert text.split("\n\n") == ["Jane Doe", "Python", "5 years", "References available"]
+
+    def test_merged_cells_not_repeated(self):
+        """Test vertical-merge continuation cells are skipped."""
+        restart = '<w:vMerge w:val="restart"/>'
+        body = (
+            "<w:tbl>"
+            f"<w:tr>{cell('Acme Corp', restart)}{cell('Engineer')}</w:tr>"
+            f"<w:tr>{cell('Acme Corp', '<w:vMerge/>')}{cell('Lead Engineer')}</w:tr>"
+            "</w:tbl>"
+        )
+
+        text = extract_docx_fast_sync(make_docx(body))
+
+        assert text.count("Acme Corp") == 1
+        assert "Lead Engineer" in text
+
+    def test_tabs_and_breaks(self):
+        """Test tab and break runs become whitespace."""
+        body = "<w:p><w:r><w:t>Skills:</w:t><w:tab/><w:t>SQL</w:t><w:br/><w:t>Excel</w:t></w:r></w:p>"
+
+        assert extract_docx_fast_sync(make_docx(body)) == "Skills:\tSQL\nExcel"
+
+
+class TestContentTypeResolution:
+    """Tests for MIME type resolution."""
+
+    def test_sniffs_pdf_from_magic_bytes(self):
+        """Test generic MIME types are resolved from content."""
+        assert resolve_content_type(b"%PDF-1.7 ...", "application/octet-stream") == PDF_MIME
+
+    def test_loose_word_mime_resolves_to_docx(self):
+        """Test 'word' MIME types with a zip payload are treated as DOCX."""
+        assert resolve_content_type(make_docx(""), "application/msword", "cv") == DOCX_MIME
+
+    def test_plain_text_kept(self):
+        """Test plain text is left alone."""
+        assert resolve_content_type(b"hello", "text/plain") == "text/plain"
+
+
+class TestTextExtractionService:
+    """Tests for TextExtractionService."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create a small extraction service with a private cache."""
+        service = TextExtractionService(
+            max_workers=1, timeout=60, cache=ExtractedTextCache(str(tmp_path))
+        )
+        yield service
+        service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_plain_text_is_decoded_inline(self, service):
+        """Test text files bypass the worker pool."""
+        text = await service.extract("Jane Doe, Engineer".encode(), "text/plain")
+
+        assert text == "Jane Doe, Engineer"
+        assert service._pool is None
+
+    @pytest.mark.asyncio
+    async def test_docx_extracted_in_worker(self, service):
+        """Test DOCX text is extracted rather than decoded as bytes."""
+        content = make_docx(paragraph("Senior Python Developer") + paragraph("Lagos, Nigeria"))
+
+        text = await service.extract(content, DOCX_MIME, "cv.docx")
+
+        assert "Senior Python Developer" in text
+        assert "Lagos, Nigeria" in text
+        assert "PK" not in text
+
+    @pytest.mark.asyncio
+    async def test_repeat_extraction_served_from_cache(self, service):
+        """Test the same document is only parsed once."""
+        content = make_docx(paragraph("Data Analyst"))
+
+        first = await service.extract(content, DOCX_MIME, "cv.docx")
+        service.shutdown()
+        second = await service.extract(content, DOCX_MIME, "copy.docx")
+
+        assert second == first
+        assert service._pool is None
+
+    @pytest.mark.asyncio
+    async def test_pdf_ranges_stream_in_page_order(self, service):
+        """Test page ranges come back in order and stop at the char budget."""
+        fitz = pytest.importorskip("fitz")
+        doc = fitz.open()
+        for number in range(20):
+            doc.new_page().insert_text((72, 72), f"Page {number:02d}")
+        content = doc.tobytes()
+        service.pages_per_chunk = 4
+
+        parts = [part async for part in service.iter_pdf_text(content)]
+        text = "".join(parts)
+
+        assert len(parts) == 5
+        assert [text.index(f"Page {n:02d}") for n in range(20)] == sorted(
+            text.index(f"Page {n:02d}") for n in range(20)
+        )
+
+        early = [part async for part in service.iter_pdf_text(content, char_budget=1)]
+        assert len(early) == 1
+        assert "Page 04" not in early[0]
+
+
+    @pytest.mark.asyncio
+    async def test_timeout_spares_queued_documents(self, service):
+        """Test a healthy document queued behind one that times out still succeeds."""
+        content = make_docx(paragraph("Product Designer"))
+
+        slow, healthy = await asyncio.gather(
+            service._run(slow_extract, 30.0, filename="slow.pdf", timeout=2),
+            service._run(extract_docx_fast_sync, content, filename="cv.docx", timeout=30),
+            return_exceptions=True,
+        )
+
+        assert isinstance(slow, DocumentExtractionTimeout)
+        assert "Product Designer" in healthy
+
+
+class TestExtractedTextCache:
+    """Tests for ExtractedTextCache."""
+
+    @pytest.mark.asyncio
+    async def test_key_depends_on_content_and_variant(self):
+        """Test keys differ by content and by extraction settings."""
+        key = await ExtractedTextCache.key(b"abc", "v1")
+
+        assert key == await ExtractedTextCache.key(b"abc", "v1")
+        assert key != await ExtractedTextCache.key(b"abd", "v1")
+        assert key != await ExtractedTextCache.key(b"abc", "v2")
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        """Test entries are read back from disk by a new instance."""
+        await ExtractedTextCache(str(tmp_path)).put("ab" * 32, "Jane Doe")
+
+        restarted = ExtractedTextCache(str(tmp_path))
+        assert await restarted.get("ab" * 32) == "Jane Doe"
+        assert await restarted.get("cd" * 32) is None
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_is_bounded(self, tmp_path):
+        """Test the memory tier evicts least recently used text."""
+        cache = ExtractedTextCache(str(tmp_path))
+        cache.max_memory_chars = 10
+
+        await cache.put("a" * 64, "x" * 6)
+        await cache.put("b" * 64, "y" * 6)
+
+        assert list(cache._texts) == ["b" * 64]
+        assert await cache.get("a" * 64) == "x" * 6  # still on disk
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_is_pruned(self, tmp_path):
+        """Test the disk tier stays within its budget."""
+        cache = ExtractedTextCache(str(tmp_path))
+        cache.max_disk_bytes = 600
+
+        for i in range(10):
+            await cache.put(f"{i:02d}" * 32, bytes(range(256)).hex())
+
+        assert sum(p.stat().st_size for p in tmp_path.glob("*/*.z")) <= 600
@@ -0,0 +1,157 @@
+"""
+File Downloader Tests
+"""
+import asyncio
+
+import httpx
+import pytest
+from src.config import settings
+from src.services.file_downloader import FileDownloader, FileTooLargeError
+
+
+def serve(routes: dict[str, bytes]):
+    """Mock transport serving fixed bodies by path."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = routes.get(request.url.path)
+        if body is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=body)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def make_downloader(tmp_path):
+    """Build a downloader whose shared client uses a mock transport."""
+    def factory(routes: dict[str, bytes], **kwargs) -> FileDownloader:
+        downloader = FileDownloader(**kwargs)
+        downloader.temp_dir = tmp_path
+        downloader._client = httpx.AsyncClient(transport=serve(routes))
+        return downloader
+
+    return factory
+
+
+class TestFileDownloader:
+    """Tests for FileDownloader."""
+
+    @pytest.mark.asyncio
+    async def test_small_body_kept_in_memory(self, make_downloader):
+        """Test bodies under the spool threshold stay in memory."""
+        downloader = make_downloader({"/cv.txt": b"Jane Doe"})
+
+        with await downloader.fetch("https://files.test/cv.txt", "cv.txt") as download:
+            assert download.path is None
+            assert download.buffer == b"Jane Doe"
+            assert len(download) == 8
+
+    @pytest.mark.asyncio
+    async def test_large_body_spooled_and_mapped(self, make_downloader):
+        """Test large bodies are spooled to disk and memory-mapped."""
+        body = b"%PDF" + b"x" * 5000
+        downloader = make_downloader({"/cv.pdf": body}, spool_threshold_kb=1)
+
+        download = await downloader.fetch("https://files.test/cv.pdf", "cv.pdf")
+        path = download.path
+
+        assert path is not None and path.exists()
+        assert download.buffer[:4] == b"%PDF"
+        assert download.read() == body
+
+        download.close()
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_size_cap_enforced(self, make_downloader, tmp_path):
+        """Test downloads over the size cap are aborted and cleaned up."""
+        downloader = make_downloader({"/big.pdf": b"x" * (2 * 1024 * 1024)},
+                                     max_size_mb=1, spool_threshold_kb=1)
+
+        with pytest.raises(FileTooLargeError):
+            await downloader.fetch("https://files.test/big.pdf", "big.pdf")
+
+        assert await downloader.download_from_url("https://files.test/big.pdf", "big.pdf") is None
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_http_error_returns_none(self, make_downloader):
+        """Test failed requests return None."""
+        downloader = make_downloader({})
+
+        assert await downloader.download_from_url("https://files.test/missing", "cv.pdf") is None
+
+
+class TestMultipleDownloads:
+    """Tests for concurrent multi-file downloads."""
+
+    @pytest.fixture(autouse=True)
+    def fast_backoff(self, monkeypatch):
+        """Keep retry backoff short."""
+        monkeypatch.setattr(settings, "download_retry_backoff_seconds", 0.01)
+
+    @pytest.mark.asyncio
+    async def test_failures_reported_per_file_in_order(self, make_downloader):
+        """Test every file gets an outcome, in input order."""
+        downloader = make_downloader({"/a.txt": b"A", "/c.txt": b"C"})
+        files = [
+            {"url": "https://files.test/a.txt", "original_name": "a.txt"},
+            {"url": "https://files.test/b.txt", "original_name": "b.txt"},
+            {"original_name": "no-url.txt"},
+            {"url": "https://files.test/c.txt", "original_name": "c.txt"},
+        ]
+
+        outcomes = await downloader.download_multiple(files)
+
+        assert [o.filename for o in outcomes] == ["a.txt", "b.txt", "no-url.txt", "c.txt"]
+        assert [o.ok for o in outcomes] == [True, False, False, True]
+        assert "404" in outcomes[1].error
+        assert outcomes[1].attempts == 1  # 4xx is not retried
+        assert outcomes[3].file.read() == b"C"
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_retried(self, make_downloader):
+        """Test 5xx responses are retried until they succeed."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, content=b"ok")
+
+        downloader = make_downloader({})
+        downloader._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        [outcome] = await downloader.download_multiple(
+            [{"url": "https://files.test/cv.pdf", "original_name": "cv.pdf"}]
+        )
+
+        assert outcome.ok
+        assert outcome.attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self, make_downloader):
+        """Test no more than the per-host limit run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, content=b"x")
+
+        downloader = make_downloader({})
+        downloader._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        files = [{"url": f"https://files.test/{i}", "original_name": f"{i}"} for i in range(12)]
+
+        outcomes = [
+            outcome async for outcome in downloader.iter_downloads(
+                files, max_concurrency=10, per_host_limit=3
+            )
+        ]
+
+        assert sorted(o.index for o in outcomes) == list(range(12))
+        assert peak == 3
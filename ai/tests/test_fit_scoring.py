@@ -1,8 +1,17 @@
 """
 Fit Scoring Tests
 """
+import asyncio
+
+import numpy as np
 import pytest
+from benchmarks.bench_fit_scoring import compare_to_baseline
+from benchmarks.synthetic import SyntheticPool
+from src.core.fit_scoring.component_store import ComponentStoreRegistry
 from src.core.fit_scoring.scorer import FitScoringEngine
+from src.core.fit_scoring.semantic_matcher import SemanticSkillMatcher
+from src.services.skill_similarity import SkillSimilarityIndex
+from src.utils.skills_taxonomy import get_skills_taxonomy
 from src.models.fit_score import JobRequirement, CandidateData
 
 
@@ -10,9 +19,13 @@ class TestFitScoringEngine:
     """Tests for FitScoringEngine."""
 
     @pytest.fixture
-    def engine(self):
-        """Create engine instance."""
-        return FitScoringEngine()
+    def engine(self, tmp_path):
+        """Create engine instance storing components in a temporary file."""
+        engine = FitScoringEngine(
+            component_stores=ComponentStoreRegistry(str(tmp_path / "components.db"))
+        )
+        yield engine
+        engine.component_stores.close()
 
     @pytest.fixture
     def sample_job(self):
@@ -112,3 +125,225 @@ class TestFitScoringEngine:
         
         assert result["fit_score"] < 50
         assert len(result["missing_skills"]) >= 2
+
+    @pytest.mark.asyncio
+    async def test_rerank_uses_stored_components(
+        self, engine, sample_job, strong_candidate, weak_candidate
+    ):
+        """Test re-ranking with new weights without re-scoring."""
+        await engine.batch_score("JOB-001", sample_job, [weak_candidate, strong_candidate])
+        
+        ranked = await engine.rerank("JOB-001")
+        assert [r["talent_id"] for r in ranked] == ["VT/001", "VT/002"]
+        
+        # Only culture counts: both candidates get the neutral culture score
+        culture_only = await engine.rerank(
+            "JOB-001",
+            weights={"skills": 0, "experience": 0, "education": 0, "culture": 1},
+        )
+        assert all(r["fit_score"] == 75 for r in culture_only)
+
+    @pytest.mark.asyncio
+    async def test_batch_stores_components_in_one_write(
+        self, engine, sample_job, strong_candidate, weak_candidate, monkeypatch
+    ):
+        """Test a batch buffers component scores and stores them together."""
+        writes = []
+        original = engine.component_stores._write
+        
+        def counting_write(job_id, rows):
+            writes.append(len(rows))
+            original(job_id, rows)
+        
+        monkeypatch.setattr(engine.component_stores, "_write", counting_write)
+        await engine.batch_score("JOB-001", sample_job, [weak_candidate, strong_candidate])
+        
+        assert writes == [2]
+        assert len(await engine.rerank("JOB-001")) == 2
+
+    @pytest.mark.asyncio
+    async def test_stored_components_survive_restart(
+        self, engine, sample_job, strong_candidate, tmp_path
+    ):
+        """Test component scores are read back from SQLite by a new store."""
+        await engine.score(strong_candidate.talent_id, "JOB-001", sample_job, strong_candidate)
+        stored = await engine.get_stored_score("VT/001", "JOB-001")
+        
+        restarted = FitScoringEngine(
+            component_stores=ComponentStoreRegistry(str(tmp_path / "components.db"))
+        )
+        assert await restarted.get_stored_score("VT/001", "JOB-001") == stored
+        assert [r["talent_id"] for r in await restarted.rerank("JOB-001")] == ["VT/001"]
+        restarted.component_stores.close()
+
+    @pytest.mark.asyncio
+    async def test_rerank_unknown_job(self, engine):
+        """Test re-ranking a job that was never scored."""
+        with pytest.raises(KeyError):
+            await engine.rerank("JOB-UNKNOWN")
+
+    @pytest.mark.asyncio
+    async def test_batch_score_reports_errors_per_candidate(
+        self, engine, sample_job, strong_candidate, weak_candidate, monkeypatch
+    ):
+        """Test one failing candidate does not fail the batch."""
+        original = engine._calculate_education_score
+        
+        def failing_education_score(requirements, candidate_education):
+            if "Marketing" in candidate_education:
+                raise RuntimeError("education lookup failed")
+            return original(requirements, candidate_education)
+        
+        monkeypatch.setattr(engine, "_calculate_education_score", failing_education_score)
+        
+        outcomes = await engine.batch_score("JOB-001", sample_job, [weak_candidate, strong_candidate])
+        
+        assert outcomes[0].talent_id == "VT/002"
+        assert "education lookup failed" in outcomes[0].error
+        assert outcomes[1].fit_score >= 80
+
+    @pytest.mark.asyncio
+    async def test_batch_score_with_explanations_preserves_order(
+        self, engine, sample_job, strong_candidate, weak_candidate, monkeypatch
+    ):
+        """Test concurrent explanations keep results in request order."""
+        async def fake_explanation(job_requirements, candidate_data, score):
+            # Finish the first candidate last
+            await asyncio.sleep(0.02 if candidate_data["talent_id"] == "VT/001" else 0)
+            return f"{candidate_data['talent_id']} scored {score}"
+        
+        monkeypatch.setattr(engine.llm_service, "calculate_fit_score_explanation", fake_explanation)
+        
+        outcomes = await engine.batch_score(
+            "JOB-001",
+            sample_job,
+            [strong_candidate, weak_candidate],
+            include_explanations=True,
+            max_concurrency=2,
+        )
+        
+        assert [o.talent_id for o in outcomes] == ["VT/001", "VT/002"]
+        assert outcomes[0].explanation.startswith("VT/001 scored")
+
+    def test_resolve_weights_normalises(self, engine):
+        """Test weight overrides are merged and normalised."""
+        weights = engine.resolve_weights({"skills": 0.85})
+        
+        assert abs(sum(weights.values()) - 1.0) < 1e-9
+        assert weights["skills"] > weights["experience"]
+        
+        with pytest.raises(ValueError):
+            engine.resolve_weights({"salary": 1.0})
+
+
+class FakeEmbeddingService:
+    """Embeds terms onto fixed unit vectors for deterministic similarity."""
+
+    VECTORS = {
+        "python": [1.0, 0.0, 0.0],
+        "django": [0.9, 0.436, 0.0],
+        "teamwork": [0.0, 0.0, 1.0],
+        "collaboration": [0.0, 0.2, 0.98],
+    }
+
+    def __init__(self):
+        self.calls = 0
+
+    async def embed_texts(self, texts):
+        self.calls += 1
+        return np.array(
+            [self.VECTORS.get(t, [0.0, 1.0, 0.0]) for t in texts], dtype=np.float32
+        )
+
+
+class TestSemanticSkillMatcher:
+    """Tests for SemanticSkillMatcher."""
+
+    @pytest.mark.asyncio
+    async def test_semantic_matches_above_threshold(self):
+        """Test related terms match and unrelated ones do not."""
+        service = FakeEmbeddingService()
+        matcher = SemanticSkillMatcher(service, threshold=0.8)
+        
+        await matcher.prepare(["Python", "Teamwork"], ["Django", "Collaboration", "Excel"])
+        
+        assert service.calls == 1
+        assert matcher.covered(["Python", "Teamwork"], ["Django"]).tolist() == [True, False]
+        assert matcher.count_matches(["Teamwork"], ["Collaboration"]) == 1
+        assert matcher.count_matches(["Python"], ["Excel"]) == 0
+
+    @pytest.mark.asyncio
+    async def test_identical_terms_always_match(self):
+        """Test exact matches survive failed embeddings."""
+        class FailingEmbeddingService:
+            async def embed_texts(self, texts):
+                return np.zeros((len(texts), 0), dtype=np.float32)
+        
+        matcher = SemanticSkillMatcher(FailingEmbeddingService(), threshold=0.8)
+        await matcher.prepare(["SQL"], ["sql", "Python"])
+        
+        assert matcher.relevant(["SQL"], ["sql", "Python"]).tolist() == [True, False]
+
+
+class TestSkillSimilarityIndex:
+    """Tests for the precomputed taxonomy similarity lookup."""
+
+    @pytest.fixture
+    def index(self):
+        """Index over a hand-built matrix for three taxonomy skills."""
+        matrix = np.array(
+            [
+                [1.0, 0.9, 0.1],
+                [0.9, 1.0, 0.2],
+                [0.1, 0.2, 1.0],
+            ],
+            dtype=np.float16,
+        )
+        return SkillSimilarityIndex(get_skills_taxonomy(), ["react", "nextjs", "sql"], matrix)
+
+    def test_taxonomy_resolves_aliases(self):
+        """Test names and aliases resolve to canonical ids."""
+        taxonomy = get_skills_taxonomy()
+        
+        assert taxonomy.resolve("React.js") == "react"
+        assert taxonomy.resolve("golang") == "go"
+        assert taxonomy.resolve("Underwater Basket Weaving") is None
+
+    def test_similarity_lookup(self, index):
+        """Test related skills are looked up by name or alias."""
+        assert index.similarity("ReactJS", "Next.js") == pytest.approx(0.9, abs=1e-3)
+        assert index.similarity("React", "Cobol") is None
+        assert index.neighbours("react", limit=1)[0][0] == "Next.js"
+
+    @pytest.mark.asyncio
+    async def test_taxonomy_only_batch_skips_embeddings(self, index):
+        """Test matching taxonomy skills needs no embedding calls."""
+        service = FakeEmbeddingService()
+        matcher = SemanticSkillMatcher(service, threshold=0.8, similarity_index=index)
+        
+        await matcher.prepare(["Next.js"], ["React", "SQL"])
+        
+        assert service.calls == 0
+        assert matcher.relevant(["Next.js"], ["React", "SQL"]).tolist() == [True, False]
+
+
+class TestBenchmarkSupport:
+    """Tests for the synthetic data and regression checks used by benchmarks."""
+
+    def test_synthetic_pool_is_deterministic(self):
+        """Test the same seed yields the same job and candidates."""
+        first, second = SyntheticPool(seed=7), SyntheticPool(seed=7)
+        
+        assert first.job() == second.job()
+        assert first.candidates(50) == second.candidates(50)
+        assert all(c.skills for c in SyntheticPool(seed=7).candidates(50))
+
+    def test_compare_to_baseline_flags_regressions(self):
+        """Test throughput drops beyond the threshold are reported."""
+        baseline = {"results": {"1000": {"score": {"throughput_per_s": 1000.0, "peak_memory_mb": 10.0}}}}
+        current = {"results": {"1000": {"score": {"throughput_per_s": 700.0, "peak_memory_mb": 10.5}}}}
+        
+        regressions = compare_to_baseline(current, baseline, max_regression=0.2, max_memory_growth=0.25)
+        
+        assert len(regressions) == 1
+        assert regressions[0].startswith("score@1000: throughput")
@@ -0,0 +1,127 @@
+"""
+Bulk CV Ingestion Tests
+"""
+import httpx
+import numpy as np
+import pytest
+from src.core.cv_parser import ingestion
+from src.core.cv_parser.ingestion import CVIngestionPipeline
+from src.models.backend_integration import FileMetadata
+from src.models.cv import ParsedCV, PersonalInfo
+from src.services.file_downloader import FileDownloader
+
+
+class FakeParser:
+    """Parses 'CV' text files without an LLM."""
+
+    async def parse_text(self, text: str) -> ParsedCV:
+        if "unparseable" in text:
+            return ParsedCV(personal_info=PersonalInfo(name="Unknown"), confidence_score=0.0)
+        return ParsedCV(personal_info=PersonalInfo(name=text.strip()), skills=["Python"], confidence_score=0.9)
+
+
+class FakeEmbeddingService:
+    """Embeds everything as the same vector and records stored documents."""
+
+    def __init__(self):
+        self.stored = {}
+
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+    async def store_embedding(self, doc_id, embedding, metadata=None, text=""):
+        self.stored[doc_id] = metadata
+        return True
+
+
+def cv_file(name: str) -> FileMetadata:
+    """Manifest entry for a text CV."""
+    return FileMetadata(
+        original_name=f"{name}.txt",
+        mime_type="text/plain",
+        size_bytes=10,
+        url=f"https://files.test/{name}.txt",
+        public_id=name,
+    )
+
+
+@pytest.fixture
+def routes():
+    """CV bodies served by the mock file host."""
+    return {"/ada.txt": b"Ada Obi", "/bola.txt": b"Bola Ade", "/chi.txt": b"unparseable"}
+
+
+@pytest.fixture
+def pipeline(tmp_path, routes, monkeypatch):
+    """Pipeline with fake LLM/embeddings and a mock file host."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = routes.get(request.url.path)
+        return httpx.Response(200, content=body) if body is not None else httpx.Response(404)
+
+    downloader = FileDownloader()
+    downloader.temp_dir = tmp_path
+    downloader._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(ingestion, "file_downloader", downloader)
+
+    return CVIngestionPipeline(
+        cv_parser=FakeParser(),
+        embedding_service=FakeEmbeddingService(),
+        checkpoint_dir=str(tmp_path / "checkpoints"),
+    )
+
+
+async def run_to_end(pipeline: CVIngestionPipeline, job_id: str):
+    """Wait for a job's background task."""
+    task = pipeline._tasks.get(job_id)
+    if task:
+        await task
+    return pipeline.status(job_id)
+
+
+class TestCVIngestionPipeline:
+    """Tests for CVIngestionPipeline."""
+
+    @pytest.mark.asyncio
+    async def test_items_flow_through_every_stage(self, pipeline):
+        """Test good files are stored and bad ones reported per stage."""
+        files = [cv_file("ada"), cv_file("missing"), cv_file("bola"), cv_file("chi")]
+
+        job_id = await pipeline.submit(files)
+        status = await run_to_end(pipeline, job_id)
+
+        assert status.status == "completed_with_errors"
+        assert status.completed == 2
+        assert set(pipeline.embedding_service.stored) == {"cv:ada", "cv:bola"}
+        assert pipeline.embedding_service.stored["cv:ada"]["parsed_cv"]["personal_info"]["name"] == "Ada Obi"
+        assert {(e.original_name, e.stage) for e in status.errors} == {
+            ("missing.txt", "download"), ("chi.txt", "parse"),
+        }
+        assert status.stages["download"] == 3
+        assert status.stages["store"] == 2
+
+    @pytest.mark.asyncio
+    async def test_resume_only_retries_unfinished_items(self, pipeline, routes, tmp_path):
+        """Test a resumed job (from its checkpoint) skips stored items."""
+        job_id = await pipeline.submit([cv_file("ada"), cv_file("late")])
+        await run_to_end(pipeline, job_id)
+        assert pipeline.status(job_id).failed == 1
+
+        # The file becomes available; a fresh process resumes the job
+        routes["/late.txt"] = b"Late Comer"
+        restarted = CVIngestionPipeline(
+            cv_parser=FakeParser(),
+            embedding_service=FakeEmbeddingService(),
+            checkpoint_dir=str(tmp_path / "checkpoints"),
+        )
+        await restarted.resume(job_id)
+        status = await run_to_end(restarted, job_id)
+
+        assert status.status == "completed"
+        assert status.completed == 2
+        assert set(restarted.embedding_service.stored) == {"cv:late"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self, pipeline):
+        """Test unknown jobs raise KeyError."""
+        with pytest.raises(KeyError):
+            await pipeline.get_status("nope")
@@ -1,18 +1,54 @@
 """
 LPI Agent Tests
 """
+import asyncio
+import os
+import time
+
 import pytest
 from src.core.lpi.summarizer import LPISummarizer
 from src.core.lpi.report_generator import LPIReportGenerator
+from src.core.lpi.store import IndexedRecordStore
+from src.services.content_store import ContentStore
+from src.services.work_queue import SQLiteWorkQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Work queue in a temporary SQLite file."""
+    queue = SQLiteWorkQueue(str(tmp_path / "queue.db"), max_attempts=2)
+    yield queue
+    queue.close()
+
+
+@pytest.fixture
+def contents(tmp_path):
+    """Content store in a temporary directory."""
+    return ContentStore(str(tmp_path / "content"), ttl_hours=1)
+
+
+class FakeLLMService:
+    """Summarizes instantly, failing the first `failures` calls."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.texts = []
+
+    async def summarize_submission(self, text: str) -> dict:
+        self.texts.append(text)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("LLM unavailable")
+        return {"highlights": ["Done"], "quality_score": 80}
 
 
 class TestLPISummarizer:
     """Tests for LPISummarizer."""
 
     @pytest.fixture
-    def summarizer(self):
+    def summarizer(self, queue, contents):
         """Create summarizer instance."""
-        return LPISummarizer()
+        return LPISummarizer(queue=queue, contents=contents)
 
     @pytest.mark.asyncio
     async def test_submit_with_notes(self, summarizer):
@@ -42,7 +78,7 @@ class TestLPISummarizer:
         
         submissions = await summarizer.list_submissions()
         
-        assert len(submissions) >= 1
+        assert len(submissions.items) >= 1
 
     @pytest.mark.asyncio
     async def test_get_processing_status(self, summarizer):
@@ -54,6 +90,258 @@ class TestLPISummarizer:
         assert "failed" in status
 
 
+class TestLPIQueue:
+    """Tests for background submission processing."""
+
+    @pytest.fixture
+    def summarizer(self, queue, contents):
+        """Summarizer with a fake LLM and no backoff between attempts."""
+        summarizer = LPISummarizer(queue=queue, contents=contents)
+        summarizer.llm_service = FakeLLMService()
+        summarizer.workers.retry_backoff = 0.0
+        return summarizer
+
+    async def submit(self, summarizer: LPISummarizer, notes: str = "Built a dashboard") -> str:
+        result = await summarizer.submit(
+            learner_name="Test Learner",
+            learner_email="test@example.com",
+            program="Python 101",
+            submission_type="Project",
+            notes=notes,
+        )
+        return result["submission_id"]
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_before_processing(self, summarizer):
+        """Test submissions stay queued until a worker picks them up."""
+        submission_id = await self.submit(summarizer)
+
+        assert (await summarizer.get_submission(submission_id))["status"] == "queued"
+        assert summarizer.llm_service.texts == []
+        assert (await summarizer.get_processing_status())["in_queue"] == 1
+
+        assert await summarizer.workers.process_next()
+
+        submission = await summarizer.get_submission(submission_id)
+        assert submission["status"] == "completed"
+        assert submission["summary"]["quality_score"] == 80
+        status = await summarizer.get_processing_status()
+        assert (status["processed"], status["in_queue"]) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_failed_attempts_retry_then_fail(self, summarizer):
+        """Test attempts are retried up to the limit, then retried on request."""
+        summarizer.llm_service.failures = 3
+        submission_id = await self.submit(summarizer)
+
+        assert await summarizer.workers.process_next()
+        submission = await summarizer.get_submission(submission_id)
+        assert (submission["status"], submission["attempts"]) == ("queued", 1)
+
+        assert await summarizer.workers.process_next()
+        submission = await summarizer.get_submission(submission_id)
+        assert submission["status"] == "failed"
+        assert submission["failure_reason"] == "LLM unavailable"
+        assert (await summarizer.get_processing_status())["failed_items"][0]["submission_id"] == submission_id
+        assert not await summarizer.workers.process_next()
+
+        await summarizer.retry_submission(submission_id)
+        summarizer.llm_service.failures = 0
+        assert await summarizer.workers.process_next()
+        assert (await summarizer.get_submission(submission_id))["status"] == "completed"
+        assert summarizer.llm_service.texts[-1] == "\n\nNotes: Built a dashboard"
+
+    @pytest.mark.asyncio
+    async def test_retry_replays_stored_file(self, summarizer, queue):
+        """Test a failed upload is retried and resummarized from stored content."""
+        summarizer.llm_service.failures = 2
+        result = await summarizer.submit(
+            learner_name="Test Learner",
+            learner_email="test@example.com",
+            program="Python 101",
+            submission_type="Report",
+            content=b"Quarterly analysis of churn",
+            filename="report.txt",
+        )
+        submission_id = result["submission_id"]
+
+        job = await queue.get(submission_id)
+        assert "content" not in job.payload
+        assert job.payload["content_hash"] == (await summarizer.get_submission(submission_id))["content_hash"]
+
+        while await summarizer.workers.process_next():
+            pass
+        await summarizer.retry_submission(submission_id)
+        assert await summarizer.workers.process_next()
+        await summarizer.resummarize_submission(submission_id)
+        assert await summarizer.workers.process_next()
+
+        assert summarizer.llm_service.texts == ["Quarterly analysis of churn"] * 4
+        assert (await summarizer.get_submission(submission_id))["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_summary_survives_restart(self, summarizer, queue, contents):
+        """Test a completed submission's summary is restored from its job."""
+        submission_id = await self.submit(summarizer)
+        assert await summarizer.workers.process_next()
+
+        restarted = LPISummarizer(queue=queue, contents=contents)
+        submission = await restarted.get_submission(submission_id)
+
+        assert submission["status"] == "completed"
+        assert submission["summary"]["quality_score"] == 80
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, queue):
+        """Test a job whose worker vanished is handed out again after its lease."""
+        job_id = await queue.enqueue("jobs", {"n": 1})
+
+        first = await queue.claim("jobs", visibility_timeout=0.0)
+        again = await queue.claim("jobs", visibility_timeout=60.0)
+
+        assert first.id == again.id == job_id
+        assert again.attempts == 2
+        assert await queue.claim("jobs", visibility_timeout=60.0) is None
+
+    @pytest.mark.asyncio
+    async def test_reclaims_stop_at_max_attempts(self, queue):
+        """Test a job whose lease keeps expiring is failed after its last attempt."""
+        job_id = await queue.enqueue("jobs", {"n": 1})
+
+        assert await queue.claim("jobs", visibility_timeout=0.0)
+        assert await queue.claim("jobs", visibility_timeout=0.0)
+        assert await queue.claim("jobs", visibility_timeout=60.0) is None
+
+        job = await queue.get(job_id)
+        assert (job.status, job.attempts) == ("failed", 2)
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_cannot_finish_job(self, queue):
+        """Test only the worker holding the current lease records the outcome."""
+        job_id = await queue.enqueue("jobs", {"n": 1})
+        stale = await queue.claim("jobs", visibility_timeout=0.0)
+        current = await queue.claim("jobs", visibility_timeout=60.0)
+
+        assert not await queue.complete(stale)
+        assert await queue.fail(stale, "timed out", backoff=0.0) is None
+        assert (await queue.get(job_id)).status == "processing"
+
+        assert await queue.complete(current)
+        assert (await queue.get(job_id)).status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_workers_process_in_background(self, summarizer):
+        """Test started workers pick up new submissions without polling delay."""
+        summarizer.start()
+        try:
+            submission_id = await self.submit(summarizer)
+            for _ in range(100):
+                if (await summarizer.get_submission(submission_id))["status"] == "completed":
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await summarizer.shutdown()
+
+        assert (await summarizer.get_submission(submission_id))["status"] == "completed"
+
+
+class TestContentStore:
+    """Tests for the content-addressed submission store."""
+
+    @pytest.mark.asyncio
+    async def test_compresses_only_when_it_helps(self, contents):
+        """Test text is stored compressed, incompressible bytes raw and memory-mapped."""
+        text = b"weekly progress notes " * 200
+        noise = os.urandom(4096)
+
+        text_key = await contents.put(text)
+        noise_key = await contents.put(noise)
+
+        assert await contents.put(text) == text_key
+        assert list(contents.store_dir.glob(f"*/{text_key}.*"))[0].suffix == ".z"
+        assert list(contents.store_dir.glob(f"*/{noise_key}.*"))[0].suffix == ".raw"
+
+        with await contents.open(text_key) as stored:
+            assert stored.path is None and bytes(stored.buffer) == text
+        with await contents.open(noise_key) as stored:
+            assert stored.path is not None and stored.buffer[:] == noise
+
+    @pytest.mark.asyncio
+    async def test_expired_blobs_are_evicted(self, contents):
+        """Test blobs unused for longer than the TTL are deleted."""
+        old_key = await contents.put(b"old submission")
+        new_key = await contents.put(b"new submission")
+        stale = time.time() - 2 * 3600
+        for path in contents.store_dir.glob(f"*/{old_key}.*"):
+            os.utime(path, (stale, stale))
+
+        assert contents.evict_expired() == 1
+        assert await contents.open(old_key) is None
+        assert await contents.exists(new_key)
+
+    @pytest.mark.asyncio
+    async def test_put_rewrites_blob_evicted_meanwhile(self, contents):
+        """Test a blob evicted between lookup and TTL refresh is written again."""
+        content = b"resubmitted work"
+        key = await contents.put(content)
+        found = contents._find(key)
+
+        def find_then_evict(key):
+            for path in contents.store_dir.glob(f"*/{key}.*"):
+                path.unlink()
+            return found
+
+        contents._find = find_then_evict
+        assert await contents.put(content) == key
+        del contents._find
+
+        with await contents.open(key) as stored:
+            assert bytes(stored.buffer) == content
+
+
+class TestIndexedRecordStore:
+    """Tests for indexed LPI record storage."""
+
+    @pytest.fixture
+    def store(self):
+        """Store of 10 submissions across two programs."""
+        store = IndexedRecordStore(("program", "status", "learner_email"))
+        for i in range(10):
+            store.add(f"s{i}", {
+                "id": f"s{i}",
+                "program": "Python 101" if i % 2 else "Data 201",
+                "status": "queued",
+                "learner_email": f"learner{i % 3}@example.com",
+            })
+        return store
+
+    def test_cursor_pages_follow_filters(self, store):
+        """Test cursor pages walk the filtered records oldest first, without repeats."""
+        first = store.page({"program": "Python 101"}, limit=2)
+        second = store.page({"program": "Python 101"}, cursor=first.next_cursor, limit=2)
+        last = store.page({"program": "Python 101"}, cursor=second.next_cursor, limit=2)
+
+        assert [r["id"] for r in first.items + second.items + last.items] == ["s1", "s3", "s5", "s7", "s9"]
+        assert last.next_cursor is None
+        assert [r["id"] for r in store.page({"program": "Data 201", "learner_email": "learner0@example.com"}).items] == ["s0", "s6"]
+        assert store.page({"program": "Unknown"}).items == []
+
+    def test_updates_keep_indexes_current(self, store):
+        """Test a status change moves the record between status listings."""
+        store.update("s3", status="failed")
+
+        assert [r["id"] for r in store.page({"status": "failed"}).items] == ["s3"]
+        assert "s3" not in [r["id"] for r in store.page({"status": "queued"}, limit=20).items]
+        assert (store.count("status", "queued"), store.count("status", "failed")) == (9, 1)
+        assert store.get("s3")["status"] == "failed"
+
+    def test_page_numbers_and_bad_cursor(self, store):
+        """Test offset listings and cursor validation."""
+        assert [r["id"] for r in store.page(limit=3, offset=3).items] == ["s3", "s4", "s5"]
+        with pytest.raises(ValueError):
+            store.page(cursor="not-a-cursor")
+
+
 class TestLPIReportGenerator:
     """Tests for LPIReportGenerator."""
 
@@ -85,4 +373,4 @@ class TestLPIReportGenerator:
         
         reports = await generator.list_reports()
         
-        assert isinstance(reports, list)
+        assert isinstance(reports.items, list)
@@ -0,0 +1,67 @@
+"""
+Skill Scanner Tests
+"""
+from src.utils.skill_scanner import ScanTerm, SkillMention, SkillScanner, keyword_scanner
+from src.utils.skills_taxonomy import get_skills_taxonomy
+
+
+class TestSkillScanner:
+    """Tests for the Aho-Corasick SkillScanner."""
+
+    def test_offsets_and_canonical_ids(self):
+        """Test mentions carry ids and the matched span."""
+        scanner = SkillScanner([ScanTerm("react", "react"), ScanTerm("react.js", "react")])
+        text = "Built UIs in React.js"
+
+        assert scanner.scan(text) == [SkillMention("react", 13, 21)]
+        assert text[13:21] == "React.js"
+
+    def test_word_boundaries(self):
+        """Test terms inside longer words or domains are ignored."""
+        scanner = SkillScanner([ScanTerm("java", "java"), ScanTerm("c", "c"), ScanTerm("git", "git")])
+
+        assert scanner.find("javascript, c++ and github.com") == []
+        assert scanner.find("Java, C and Git") == ["java", "c", "git"]
+
+    def test_overlapping_terms_prefer_longest(self):
+        """Test leftmost-longest resolution of overlapping terms."""
+        scanner = SkillScanner([
+            ScanTerm("machine learning", "ml"),
+            ScanTerm("learning", "learning"),
+            ScanTerm("machine", "machine"),
+        ])
+
+        assert scanner.find("machine learning engineer") == ["ml"]
+
+    def test_case_sensitive_terms(self):
+        """Test case-sensitive terms only match as written."""
+        scanner = SkillScanner([ScanTerm("Go", "go", case_sensitive=True)])
+
+        assert scanner.find("I will go there") == []
+        assert scanner.find("Services in Go") == ["go"]
+
+    def test_keyword_scanner(self):
+        """Test culture keywords are matched as whole words."""
+        scanner = keyword_scanner(("Agile", "lead"))
+
+        assert scanner.find("agile\nleadership") == ["agile"]
+
+
+class TestTaxonomyScanner:
+    """Tests for taxonomy-backed scanners."""
+
+    def test_aliases_resolve_to_declared_skill(self):
+        """Test a talent's skill is found by its taxonomy aliases."""
+        taxonomy = get_skills_taxonomy()
+        scanner = taxonomy.scanner_for(["JavaScript", "Stakeholder Management"])
+
+        assert scanner.find("Strong JS and stakeholder management skills") == [
+            taxonomy.key("JavaScript"), "stakeholder management",
+        ]
+
+    def test_declared_ambiguous_skill_is_scanned(self):
+        """Test ambiguous terms are scanned only when the talent lists them."""
+        taxonomy = get_skills_taxonomy()
+
+        assert taxonomy.find_skills("Wrote a node service") == []
+        assert taxonomy.scanner_for(["Node"]).find("Wrote a node service") == ["nodejs"]